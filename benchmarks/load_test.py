@@ -0,0 +1,130 @@
+"""End-to-end load test of the scrapers and pipeline against the local mock job boards
+
+Starts benchmarks/mock_job_board.py in process, points platforms.*.base_url at
+it and runs the normal scrape, process and output pipeline. Caches, indexes and
+checkpoints of real runs are left alone; outputs go to a temporary directory.
+
+Usage: python benchmarks/load_test.py [--platforms monster,linkedin] [--terms 20] [--delay 0.05]
+                                      [--latency 0.1] [--block-rate 0.02] [--throttle-rate 0.05]
+                                      [--layout mixed] [--no-term-limits] [--keep-output]
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_job_board import MockJobBoard
+from src.data.rollups import RollupStore
+from src.scheduler.job_scheduler import JobScheduler
+from src.utils.config import load_config
+from src.utils.metrics import report_path
+
+def configure(config: dict, board: MockJobBoard, args, output_dir: str) -> dict:
+    """Point the scrapers at the mock boards and keep the run away from real state"""
+    for platform, base_url in board.base_urls().items():
+        platform_config = config['platforms'].setdefault(platform, {})
+        platform_config['base_url'] = base_url
+        platform_config['enabled'] = platform in args.platforms
+    # Selenium pages are not served by the mock boards
+    config['platforms']['linkedin']['mode'] = 'http'
+
+    scraping = config.setdefault('scraping', {})
+    delay = dict(scraping.get('delay_between_requests', {}) or {})
+    delay['default'] = args.delay
+    delay['hosts'] = {urlparse(base_url).netloc: args.delay for base_url in board.base_urls().values()}
+    scraping['delay_between_requests'] = delay
+    scraping['retry'] = dict(scraping.get('retry', {}) or {}, backoff_base=args.backoff)
+
+    config['http_cache'] = {'enabled': False}
+    config['seen_index'] = {'enabled': False}
+    config['selector_learning'] = {'enabled': False}
+    config['checkpoints'] = {'enabled': False}
+    config['dedup'] = dict(config.get('dedup', {}) or {}, path='')
+    config['output'] = dict(config.get('output', {}) or {}, directory=output_dir)
+    config['metrics'] = dict(config.get('metrics', {}) or {}, enabled=True,
+                             directory=os.path.join(output_dir, 'metrics'), prometheus={'enabled': False})
+    config['execution'] = dict(config.get('execution', {}) or {}, mode='concurrent')
+    return config
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the scrapers against local mock job boards')
+    parser.add_argument('--platforms', default='monster,linkedin',
+                        help='Platforms to run, comma separated (dice needs a Selenium browser)')
+    parser.add_argument('--terms', type=int, default=20, help='Search terms to use from the role mappings')
+    parser.add_argument('--no-term-limits', action='store_true',
+                        help='Lift the per-platform term caps so every term is scraped')
+    parser.add_argument('--delay', type=float, default=0.05, help='Seconds between requests to each mock host')
+    parser.add_argument('--backoff', type=float, default=0.1, help='Seconds before the first retry')
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--jitter', type=float, default=0.02)
+    parser.add_argument('--results-per-term', type=int, default=100)
+    parser.add_argument('--block-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--block-after', type=int)
+    parser.add_argument('--layout', choices=['default', 'alternate', 'mixed'], default='default')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep-output', action='store_true', help='Keep the output directory and print its path')
+    args = parser.parse_args()
+    args.platforms = [platform.strip() for platform in args.platforms.split(',') if platform.strip()]
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(message)s')
+    warnings.filterwarnings('ignore', message='Ignoring URL', category=UserWarning)
+    logger = logging.getLogger('load_test')
+
+    board = MockJobBoard(latency=args.latency, jitter=args.jitter, results_per_term=args.results_per_term,
+                         block_rate=args.block_rate, throttle_rate=args.throttle_rate,
+                         block_after=args.block_after, layout=args.layout, seed=args.seed).start()
+    output_dir = tempfile.mkdtemp(prefix='load_test_')
+
+    try:
+        config = configure(load_config(), board, args, output_dir)
+        scheduler = JobScheduler(config, logger)
+        scheduler.data_processor._rollup_store = RollupStore(os.path.join(output_dir, 'rollups'), logger)
+        search_terms = scheduler._get_search_terms()[:args.terms]
+        scheduler._get_search_terms = lambda: search_terms
+
+        for platform in args.platforms:
+            scraper = scheduler.get_scraper(platform)
+            if args.no_term_limits:
+                scraper.max_terms = None
+
+        run_id = f"load_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        start = time.perf_counter()
+        result = scheduler._run_pipeline(args.platforms, run_id, 'Load test') or {}
+        elapsed = time.perf_counter() - start
+
+        requests = sum(sum(statuses.values()) for statuses in board.stats.values())
+        print(f"Platforms: {', '.join(args.platforms)}; terms: {len(search_terms)}; layout: {args.layout}")
+        print(f"Elapsed: {elapsed:.2f}s")
+        print(f"Requests served: {requests} ({requests / elapsed:.1f}/s)")
+        print(f"Jobs scraped: {result.get('jobs_scraped', 0)} ({result.get('jobs_scraped', 0) / elapsed:.1f}/s); "
+              f"saved: {result.get('jobs_saved', 0)}")
+        print(f"Responses by platform and status: {json.dumps(board.stats)}")
+
+        path = report_path(config, run_id)
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                for platform, terms in json.load(file)['platforms'].items():
+                    totals = {}
+                    for series in terms.values():
+                        for name, value in series.items():
+                            totals[name] = round(totals.get(name, 0) + value, 3)
+                    print(f"{platform}: {json.dumps(totals, sort_keys=True)}")
+    finally:
+        board.stop()
+        if args.keep_output:
+            print(f"Outputs kept in: {output_dir}")
+        else:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,399 @@
+"""Local stand-in for the LinkedIn, Monster and Dice job boards
+
+Serves search and detail pages shaped like the real sites, with optional
+latency, pagination, 403/429 injection and alternate page layouts, so the
+scrapers can be load-tested end to end without a network. Each platform gets
+its own port, as the real sites have their own hosts.
+
+Usage: python benchmarks/mock_job_board.py [--port 8900] [--latency 0.2] [--jitter 0.1]
+                                           [--block-rate 0.05] [--throttle-rate 0.05]
+                                           [--block-after N] [--layout default|alternate|mixed]
+
+Point the scrapers at it through platforms.<name>.base_url in settings.yaml;
+the URLs to use are printed on start.
+"""
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qs, quote, urlparse
+
+PLATFORMS = ['linkedin', 'monster', 'dice']
+
+# Search page path per platform; platforms.<name>.base_url is the server root plus this
+SEARCH_PATHS = {'linkedin': '/jobs/search', 'monster': '/jobs/search', 'dice': '/jobs'}
+
+COMPANIES = ['Acme Consulting', 'Globex', 'Initech', 'Umbrella Staffing', 'Stark Industries', 'Wayne Enterprises',
+             'Insight Global', 'TEKsystems', 'Apex Systems', 'Kforce', 'Randstad Digital', 'CyberCoders']
+LOCATIONS = ['Austin, TX', 'Chicago, IL', 'Remote', 'New York, NY', 'Charlotte, NC', 'Dallas, TX',
+             'Atlanta, GA', 'Seattle, WA', 'Denver, CO', 'Phoenix, AZ']
+ROLES = ['Consultant', 'Developer', 'Engineer', 'Analyst', 'Architect']
+DURATIONS = ['6 month contract', '12-month contract', 'contract for 3 months', '3 to 6 months contract']
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>$title</title>
+  <script>window.__CONFIG__ = {"env": "mock", "page": $page};</script>
+</head>
+<body>
+  <header><nav><ul>$nav</ul></nav></header>
+  <main>
+$body
+  </main>
+  <footer>$pager</footer>
+</body>
+</html>
+""")
+
+# Search result cards; "default" is the current layout of each site, "alternate" an older or A/B variant
+CARDS = {
+    ('linkedin', 'default'): Template("""<li>
+  <div class="base-card base-card--link base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:$job_id">
+    <a class="base-card__full-link" href="$root/jobs/view/$slug-$job_id?position=$position&amp;pageNum=$page"><span class="sr-only">$title</span></a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">$title</h3>
+      <h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="$root/company/$company_slug">$company</a></h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">$location</span>
+        <time class="job-search-card__listdate" datetime="$date">$days days ago</time>
+      </div>
+    </div>
+  </div>
+</li>"""),
+    ('linkedin', 'alternate'): Template("""<li>
+  <div class="base-card base-search-card" data-entity-urn="urn:li:jobPosting:$job_id">
+    <a class="base-card__full-link" href="$root/jobs/view/$slug-$job_id"><span class="sr-only">$title</span></a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">$title</h3>
+      <h4 class="base-search-card__subtitle">$company</h4>
+      <span class="job-search-card__location">$location</span>
+      <time datetime="$date">$days days ago</time>
+    </div>
+  </div>
+</li>"""),
+    ('monster', 'default'): Template("""  <div class="job-cardstyle__JobCardComponent sc-$position" data-jobid="$job_id">
+    <a href="/job-openings/$slug-$job_id" class="job-cardstyle__JobCardLink">
+      <h2 class="title job-cardstyle__JobCardTitle">$title</h2>
+    </a>
+    <div class="company job-cardstyle__JobCardCompany">$company</div>
+    <div class="location job-cardstyle__JobCardLocation">$location</div>
+    <div class="job-cardstyle__JobCardDetails"><span>Posted $days days ago</span><p>$summary</p></div>
+  </div>"""),
+    ('monster', 'alternate'): Template("""  <article data-jobid="$job_id" class="results-card">
+    <h3><a href="/job-openings/$slug-$job_id">$title</a></h3>
+    <span class="company-name">$company</span>
+    <span class="job-location">$location</span>
+    <p>$summary</p>
+  </article>"""),
+    ('dice', 'default'): Template("""      <div class="card search-card" data-testid="job-card" data-id="$job_id">
+        <a data-testid="job-title" class="job-title" href="$root/job-detail/$job_id">$title</a>
+        <a data-testid="job-company" class="company" href="/company/$company_slug">$company</a>
+        <span data-testid="job-location" class="location">$location</span>
+        <span class="employment-type">Contract</span>
+        <p class="card-description">$summary</p>
+      </div>"""),
+    ('dice', 'alternate'): Template("""      <div class="job-tile" data-job-id="$job_id">
+        <h3 class="job-title"><a href="$root/job-detail/$job_id">$title</a></h3>
+        <div class="company-name">$company</div>
+        <div class="job-location">$location</div>
+        <p>$summary</p>
+      </div>"""),
+}
+
+# Wrappers around the cards of one results page
+RESULTS = {
+    ('monster', 'default'): Template("""<div id="JobCardGrid" class="results">
+$cards
+</div>"""),
+    ('monster', 'alternate'): Template("""<section data-testid="jobResults">
+$cards
+</section>"""),
+    ('dice', 'default'): Template("""    <div class="search-results" data-testid="search-results">
+$cards
+    </div>"""),
+    ('dice', 'alternate'): Template("""    <div id="searchDisplay">
+$cards
+    </div>"""),
+    ('linkedin', 'default'): Template("""<section class="two-pane-serp-page__results-list">
+  <ul class="jobs-search__results-list">
+$cards
+  </ul>
+</section>"""),
+}
+RESULTS[('linkedin', 'alternate')] = RESULTS[('linkedin', 'default')]
+
+DESCRIPTION = {
+    'default': Template("""<section class="core-section-container description">
+  <div class="description__text description__text--rich">
+    <section class="show-more-less-html">
+      <div class="show-more-less-html__markup">
+        <strong>Contract length:</strong> $duration.<br><br>
+        We are looking for a $title to join $company in $location.
+        <ul><li>Hands-on $term experience</li><li>W2 or C2C</li></ul>
+      </div>
+    </section>
+  </div>
+</section>"""),
+    'alternate': Template("""<section class="description">
+  <div class="description__text">
+    $duration. We are looking for a $title to join $company in $location. Hands-on $term experience required.
+  </div>
+</section>"""),
+}
+
+
+class MockJobBoard:
+    """Threaded mock job boards, one HTTP server per platform"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 page_size: int = 25, results_per_term: int = 100, block_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: int = 2, block_after: int = None,
+                 layout: str = 'default', platforms: List[str] = None, seed: int = 0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.page_size = page_size
+        self.results_per_term = results_per_term
+        self.block_rate = block_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.block_after = block_after
+        self.layout = layout
+        self.platforms = platforms or list(PLATFORMS)
+        self.seed = seed
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._servers: Dict[str, ThreadingHTTPServer] = {}
+        # platform -> status -> count
+        self.stats: Dict[str, Dict[str, int]] = {platform: {} for platform in self.platforms}
+        self.requests = 0
+
+    def start(self) -> 'MockJobBoard':
+        """Start one server thread per platform; port 0 picks free ports"""
+        for index, platform in enumerate(self.platforms):
+            port = self.port + index if self.port else 0
+            server = ThreadingHTTPServer((self.host, port), self._handler(platform))
+            server.daemon_threads = True
+            self._servers[platform] = server
+            threading.Thread(target=server.serve_forever, name=f"mock-{platform}", daemon=True).start()
+        return self
+
+    def stop(self):
+        for server in self._servers.values():
+            server.shutdown()
+            server.server_close()
+        self._servers = {}
+
+    def __enter__(self) -> 'MockJobBoard':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def root(self, platform: str) -> str:
+        host, port = self._servers[platform].server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_urls(self) -> Dict[str, str]:
+        """platforms.<name>.base_url values that point the scrapers at this board"""
+        return {platform: self.root(platform) + SEARCH_PATHS[platform] for platform in self._servers}
+
+    def _record(self, platform: str, status: int):
+        with self._lock:
+            self.stats[platform][str(status)] = self.stats[platform].get(str(status), 0) + 1
+
+    def _fault(self) -> Optional[int]:
+        """Status to inject for the next request, if any"""
+        with self._lock:
+            self.requests += 1
+            if self.block_after is not None and self.requests > self.block_after:
+                return 403
+            roll = self._random.random()
+        if roll < self.block_rate:
+            return 403
+        if roll < self.block_rate + self.throttle_rate:
+            return 429
+        return None
+
+    def _layout(self) -> str:
+        if self.layout == 'mixed':
+            with self._lock:
+                return self._random.choice(['default', 'alternate'])
+        return self.layout
+
+    def jobs(self, platform: str, term: str, start: int, count: int) -> List[Dict[str, Any]]:
+        """Deterministic jobs start..start+count of a term's results"""
+        jobs = []
+        for position in range(start, min(start + count, self.results_per_term)):
+            rng = random.Random(f"{self.seed}:{platform}:{term}:{position}")
+            title = f"{term} {rng.choice(ROLES)} - Contract"
+            company = rng.choice(COMPANIES)
+            jobs.append({
+                'job_id': str(3900000000 + rng.randrange(10 ** 8)),
+                'position': position,
+                'title': title,
+                'slug': _slug(title),
+                'company': company,
+                'company_slug': _slug(company),
+                'location': rng.choice(LOCATIONS),
+                'days': rng.randint(0, 3),
+                'date': f"2026-10-{rng.randint(10, 16)}",
+                'duration': rng.choice(DURATIONS),
+                'summary': f"{rng.choice(DURATIONS).capitalize()} for a {title}.",
+                'term': term
+            })
+        return jobs
+
+    def _handler(self, platform: str):
+        board = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if board.latency or board.jitter:
+                    time.sleep(max(0.0, board.latency + random.uniform(-board.jitter, board.jitter)))
+
+                url = urlparse(self.path)
+                if url.path == '/__stats':
+                    return self._send(200, json.dumps(board.stats), 'application/json', record=False)
+
+                fault = board._fault()
+                if fault:
+                    headers = {'Retry-After': str(board.retry_after)} if fault == 429 else {}
+                    return self._send(fault, f"<html><body>{fault}</body></html>", headers=headers)
+
+                body = board.render(platform, url.path, parse_qs(url.query))
+                if body is None:
+                    return self._send(404, "<html><body>Not found</body></html>")
+                self._send(200, body)
+
+            def _send(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8',
+                      headers: Dict[str, str] = None, record: bool = True):
+                payload = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+                if record:
+                    board._record(platform, status)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def render(self, platform: str, path: str, query: Dict[str, List[str]]) -> Optional[str]:
+        """Body for a path on a platform's board, or None for unknown paths"""
+        root = self.root(platform)
+        layout = self._layout()
+
+        if platform == 'linkedin':
+            term = _first(query, 'keywords')
+            start = int(_first(query, 'start') or 0)
+            if path == '/jobs-guest/jobs/api/seeMoreJobPostings/search':
+                # The guest API returns bare <li> fragments, 25 at a time through start=
+                return self._cards(platform, layout, root, term, start)
+            if path.startswith('/jobs-guest/jobs/api/jobPosting/'):
+                return self._description(layout, path.rsplit('/', 1)[-1])
+            if path.rstrip('/') == SEARCH_PATHS[platform]:
+                results = RESULTS[(platform, layout)].substitute(cards=self._cards(platform, layout, root, term, start))
+                return self._page(f"{term} jobs | LinkedIn", results, start // self.page_size, term,
+                                  f"{path}?keywords={quote(term)}&start={{start}}", start)
+            if path.startswith('/jobs/view/'):
+                return self._page("Job | LinkedIn", self._description(layout, path.rsplit('-', 1)[-1]), 0, '', '', 0)
+            return None
+
+        page = max(1, int(_first(query, 'page') or 1))
+        start = (page - 1) * self.page_size
+        term = _first(query, 'q').replace('+', ' ')
+
+        if path.rstrip('/') == SEARCH_PATHS[platform]:
+            results = RESULTS[(platform, layout)].substitute(cards=self._cards(platform, layout, root, term, start))
+            return self._page(f"{term} Jobs | {platform.capitalize()}", results, page - 1, term,
+                              f"{SEARCH_PATHS[platform]}?q={quote(term)}&page={{page}}", start)
+        if path.startswith('/job-openings/') or path.startswith('/job-detail/'):
+            return self._page(f"Job | {platform.capitalize()}", self._description(layout, path.rsplit('-', 1)[-1]),
+                              0, '', '', 0)
+        return None
+
+    def _cards(self, platform: str, layout: str, root: str, term: str, start: int) -> str:
+        template = CARDS[(platform, layout)]
+        return '\n'.join(template.substitute(_escape(job), root=root, page=start // self.page_size)
+                         for job in self.jobs(platform, term, start, self.page_size))
+
+    def _description(self, layout: str, job_id: str) -> str:
+        rng = random.Random(f"{self.seed}:description:{job_id}")
+        title = f"{rng.choice(['SAP', 'Java', 'Cloud', 'Oracle HCM', 'Salesforce'])} {rng.choice(ROLES)}"
+        return DESCRIPTION[layout].substitute(duration=rng.choice(DURATIONS).capitalize(), title=title,
+                                              company=html.escape(rng.choice(COMPANIES)),
+                                              location=rng.choice(LOCATIONS), term=title.rsplit(' ', 1)[0])
+
+    def _page(self, title: str, body: str, page: int, term: str, next_url: str, start: int) -> str:
+        # A realistic amount of navigation before the results, as on the real sites
+        nav = ''.join(f'<li><a href="/browse/{index}">Category {index}</a></li>' for index in range(80))
+        has_next = start + self.page_size < self.results_per_term and next_url
+        pager = (f'<a class="next" rel="next" href="{html.escape(next_url.format(page=page + 2, start=start + self.page_size))}">'
+                 f'Next</a>') if has_next else ''
+        return PAGE.substitute(title=html.escape(title), page=page, nav=nav, body=body, pager=pager)
+
+
+def _first(query: Dict[str, List[str]], key: str) -> str:
+    return (query.get(key) or [''])[0]
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+def _escape(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: html.escape(value) if isinstance(value, str) else value for key, value in job.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local mock LinkedIn, Monster and Dice job boards')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900, help='Port of the first platform; the others follow')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random +/- seconds on top of the latency')
+    parser.add_argument('--page-size', type=int, default=25)
+    parser.add_argument('--results-per-term', type=int, default=100, help='Results before pagination ends')
+    parser.add_argument('--block-rate', type=float, default=0.0, help='Share of requests answered with 403')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Share of requests answered with 429')
+    parser.add_argument('--retry-after', type=int, default=2, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--block-after', type=int, help='Answer 403 to everything after this many requests')
+    parser.add_argument('--layout', choices=['default', 'alternate', 'mixed'], default='default')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    board = MockJobBoard(
+        host=args.host, port=args.port, latency=args.latency, jitter=args.jitter, page_size=args.page_size,
+        results_per_term=args.results_per_term, block_rate=args.block_rate, throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after, block_after=args.block_after, layout=args.layout, seed=args.seed
+    ).start()
+
+    print("Mock job boards running. Use these in settings.yaml:")
+    print("platforms:")
+    for platform, base_url in board.base_urls().items():
+        print(f"  {platform}:\n    base_url: \"{base_url}\"")
+    print(f"Request counts per platform and status: {board.root(board.platforms[0])}/__stats")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        board.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Parse throughput of MonsterScraper on saved result pages
+
+Usage: python benchmarks/parse_benchmark.py [--iterations N]
+"""
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from src.scrapers.async_fetcher import FetchResult
+from src.scrapers.monsters_scraper import MonsterScraper
+from src.scrapers.html_parsing import resolve_parser
+from src.utils.config import PROJECT_ROOT, load_config
+
+FIXTURES = os.path.join(PROJECT_ROOT, 'tests', 'fixtures', 'monster', '*.html')
+
+def legacy_parse(content: bytes) -> int:
+    """The previous approach: full html.parser tree and a find_all pass per selector"""
+    soup = BeautifulSoup(content, 'html.parser')
+    job_cards = []
+    for selector in ['.job-cardstyle__JobCardComponent', '.JobCard', '.job-card', '[data-testid="job-card"]', '.card-content']:
+        job_cards = soup.find_all('div', class_=selector.replace('.', ''))
+        if job_cards:
+            break
+    if not job_cards:
+        job_cards = soup.find_all('div', attrs={'data-jobid': True}) or \
+                    soup.find_all('article') or \
+                    soup.find_all('div', class_=lambda x: x and 'job' in x.lower())
+    count = 0
+    for card in job_cards[:5]:
+        for selectors in (['h2', 'h3', '.title', '.job-title', '[data-testid="job-title"]'],
+                          ['.company', '.company-name', '[data-testid="company-name"]'],
+                          ['.location', '.job-location', '[data-testid="location"]']):
+            for selector in selectors:
+                found = card.select_one(selector)
+                if found and found.get_text(strip=True):
+                    break
+        count += 1
+    return count
+
+def time_pages(parse, pages, iterations: int):
+    """Return (seconds per page, jobs found on one pass)"""
+    jobs = sum(parse(content) for content in pages)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for content in pages:
+            parse(content)
+    return (time.perf_counter() - start) / (iterations * len(pages)), jobs
+
+def main():
+    parser = argparse.ArgumentParser(description='Monster parse throughput on fixture pages')
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    logger = logging.getLogger('parse_benchmark')
+    paths = sorted(glob.glob(FIXTURES))
+    pages = [open(path, 'rb').read() for path in paths]
+    scraper = MonsterScraper(load_config(), logger)
+
+    def current(backend):
+        def parse(content):
+            scraper._html_parser = backend
+            return len(scraper._parse_monster_response(FetchResult('fixture', 200, content), 'fixture'))
+        return parse
+
+    variants = [('legacy html.parser', legacy_parse), ('scoped html.parser', current('html.parser'))]
+    if resolve_parser('lxml') == 'lxml':
+        variants.append(('scoped lxml', current('lxml')))
+
+    for path, content in zip(paths, pages):
+        print(f"{os.path.basename(path)} ({len(content) // 1024} KB, {args.iterations} iterations)")
+        for name, parse in variants:
+            seconds, jobs = time_pages(parse, [content], args.iterations)
+            print(f"  {name:<22} {seconds * 1000:8.2f} ms/page {1 / seconds:8.1f} pages/s  jobs={jobs}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""Offline benchmark suite for the parsers and the processing pipeline
+
+Times the Monster, Dice and LinkedIn parsers on the saved pages under
+tests/fixtures and DataProcessor on synthetic job datasets, writes the
+results as JSON and compares them with a stored baseline.
+
+Usage: python benchmarks/run_benchmarks.py [--sizes 10k,100k,1m] [--repeat N]
+                                           [--baseline PATH] [--save-baseline]
+                                           [--tolerance 0.2] [--fail-on-regression]
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from src.data.processor import DataProcessor
+from src.scrapers.async_fetcher import FetchResult
+from src.scrapers.html_parsing import make_soup, parse_dice_cards, parse_linkedin_cards, resolve_parser
+from src.scrapers.monsters_scraper import MonsterScraper
+from src.scrapers.selectors import MONSTER_SELECTORS
+from src.utils.config import PROJECT_ROOT, get_city_states, get_role_mappings, load_config, resolve_path
+from src.utils.metrics import get_metrics
+
+FIXTURES = os.path.join(PROJECT_ROOT, 'tests', 'fixtures')
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, 'benchmarks', 'baseline.json')
+
+def parse_size(value: str) -> int:
+    """Row count from a size such as 10k or 1m"""
+    value = value.strip().lower()
+    multiplier = {'k': 1000, 'm': 1000000}.get(value[-1:], 1)
+    return int(float(value.rstrip('km')) * multiplier)
+
+def size_label(rows: int) -> str:
+    if rows % 1000000 == 0:
+        return f"{rows // 1000000}m"
+    if rows % 1000 == 0:
+        return f"{rows // 1000}k"
+    return str(rows)
+
+def make_jobs(count: int, seed: int = 0) -> list:
+    """Synthetic scraped jobs drawing titles, places and phrasings from the bundled mappings"""
+    rng = random.Random(seed)
+    keywords = [keyword for group in get_role_mappings()['verticals'].values() for keyword in group]
+    cities = list(get_city_states().items())
+    companies = [f"Company {index}" for index in range(2000)]
+    levels = ['', 'Senior ', 'Lead ', 'Junior ', 'Principal ']
+    roles = ['Developer', 'Consultant', 'Engineer', 'Analyst', 'Architect', 'Administrator']
+    durations = ['6 month contract', '12-month contract', 'contract for 3 months', '3 to 6 months contract',
+                 'long term contract', 'contract to hire']
+    dates = ['1 day ago', '3 days ago', '5 hours ago', '2026-10-14', '10/12/2026', '']
+    platforms = ['LinkedIn', 'Monster', 'Dice']
+
+    jobs = []
+    for index in range(count):
+        keyword = rng.choice(keywords)
+        city, state = rng.choice(cities)
+        title = f"{rng.choice(levels)}{keyword} {rng.choice(roles)}"
+        jobs.append({
+            'title': title,
+            'company': rng.choice(companies),
+            'location': rng.choice([f"{city}, {state}", city, 'Remote', state]),
+            'description': f"{rng.choice(durations).capitalize()} for a {title}. "
+                           f"Requires {rng.choice(keywords)} and {rng.choice(keywords)} experience. Ref {index}.",
+            'posting_date': rng.choice(dates),
+            'platform': rng.choice(platforms),
+            'url': f"https://jobs.example.com/{index}",
+            'job_type': 'Contract'
+        })
+    return jobs
+
+def time_runs(func, repeat: int) -> list:
+    """Seconds taken by each of repeat calls"""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+def summarize(runs: list, items: int, unit: str) -> dict:
+    median = statistics.median(runs)
+    return {
+        'seconds': round(median, 6),
+        'min_seconds': round(min(runs), 6),
+        'runs': len(runs),
+        'items': items,
+        'unit': unit,
+        'items_per_second': round(items / median, 1) if median else None
+    }
+
+def benchmark_parsers(config: dict, logger, repeat: int) -> dict:
+    """Time the fixture-based parsers"""
+    results = {}
+    scraper = MonsterScraper(config, logger)
+    parser = scraper.html_parser
+
+    for path in sorted(glob.glob(os.path.join(FIXTURES, 'monster', '*.html'))):
+        content = open(path, 'rb').read()
+        response = FetchResult('fixture', 200, content)
+        jobs = len(scraper._parse_monster_response(response, 'fixture'))
+        runs = time_runs(lambda: scraper._parse_monster_response(response, 'fixture'), repeat)
+        results[f"parse_monster_response[{os.path.basename(path)}]"] = dict(summarize(runs, 1, 'pages'), jobs=jobs)
+
+        # The per-card extractor on its own, over every card on the page
+        cards = scraper.card_selectors(MONSTER_SELECTORS).select(make_soup(content, parser), 'card')[1]
+        runs = time_runs(lambda: [scraper._extract_job_from_card(card, 'fixture') for card in cards], repeat)
+        results[f"extract_monster_card[{os.path.basename(path)}]"] = summarize(runs, len(cards), 'cards')
+
+    for path in sorted(glob.glob(os.path.join(FIXTURES, 'dice', '*.html'))):
+        content = open(path, 'rb').read()
+        runs = time_runs(lambda: parse_dice_cards(content, parser), repeat)
+        results[f"parse_dice_cards[{os.path.basename(path)}]"] = summarize(runs, len(parse_dice_cards(content, parser)), 'cards')
+
+    path = os.path.join(FIXTURES, 'linkedin', 'guest_search.html')
+    if os.path.exists(path):
+        content = open(path, 'rb').read()
+        runs = time_runs(lambda: parse_linkedin_cards(content, parser), repeat)
+        results[f"parse_linkedin_cards[{os.path.basename(path)}]"] = summarize(runs, len(parse_linkedin_cards(content, parser)), 'cards')
+
+    scraper.close()
+    return results
+
+def benchmark_processing(config: dict, logger, sizes: list, repeat: int, excel_max_rows: int) -> dict:
+    """Time DataProcessor stages on synthetic datasets of each size"""
+    results = {}
+    run_timestamp = datetime(2026, 10, 16, 9, 0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in sizes:
+            label = size_label(rows)
+            jobs = make_jobs(rows)
+            # Large datasets are timed once; a single run already takes long enough to be stable
+            runs_for_size = repeat if rows <= 100000 else 1
+
+            runs, df = [], None
+            get_metrics().reset()
+            for _ in range(runs_for_size):
+                # A fresh processor per run so the near-duplicate index starts empty every time
+                processor = DataProcessor(logger, config)
+                start = time.perf_counter()
+                df = processor.process_jobs(jobs, run_timestamp)
+                runs.append(time.perf_counter() - start)
+            results[f"process_jobs[{label}]"] = dict(summarize(runs, rows, 'rows'), rows_out=len(df),
+                                                     stages=stage_seconds(runs_for_size))
+            del jobs
+
+            def summary_sheets():
+                with pd.ExcelWriter(os.path.join(directory, 'summaries.xlsx'), engine='xlsxwriter') as writer:
+                    processor._create_summary_sheets(df, writer)
+            runs = time_runs(summary_sheets, runs_for_size)
+            results[f"create_summary_sheets[{label}]"] = summarize(runs, len(df), 'rows')
+
+            if len(df) <= excel_max_rows:
+                path = os.path.join(directory, f"jobs_{label}.xlsx")
+                runs = time_runs(lambda: processor.save_to_excel(df, path), runs_for_size)
+                results[f"save_to_excel[{label}]"] = summarize(runs, len(df), 'rows')
+
+    return results
+
+def stage_seconds(runs: int) -> dict:
+    """Average seconds per run spent in each DataProcessor stage, from the metrics registry"""
+    return {timing['labels']['stage']: round(timing['total_seconds'] / runs, 4)
+            for timing in get_metrics().snapshot()['timings'] if timing['name'] == 'processing_stage_seconds'}
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Rows of (name, baseline seconds, current seconds, ratio, status) for benchmarks in both"""
+    rows = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get('seconds'):
+            rows.append((name, None, result['seconds'], None, 'new'))
+            continue
+
+        ratio = result['seconds'] / previous['seconds']
+        status = 'slower' if ratio > 1 + tolerance else 'faster' if ratio < 1 - tolerance else 'same'
+        rows.append((name, previous['seconds'], result['seconds'], ratio, status))
+    return rows
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline parser and processing benchmarks')
+    parser.add_argument('--sizes', default='10k,100k,1m', help='Synthetic dataset sizes, comma separated')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per benchmark (datasets above 100k run once)')
+    parser.add_argument('--only', choices=['parsers', 'processing'], help='Run one group of benchmarks')
+    parser.add_argument('--excel-max-rows', type=int, default=100000,
+                        help='Skip save_to_excel for larger datasets')
+    parser.add_argument('--output', help='Results file (default output/benchmarks/benchmark_<time>.json)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Relative change reported as faster or slower')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit with status 1 if anything got slower')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    # Synthetic rows all carry URLs; Excel's per-sheet hyperlink limit is expected at 100k rows
+    warnings.filterwarnings('ignore', message='Ignoring URL', category=UserWarning)
+    logger = logging.getLogger('benchmarks')
+
+    config = load_config()
+    # Keep benchmarks away from the persistent caches and indexes of real runs
+    config['http_cache'] = {'enabled': False}
+    config['seen_index'] = {'enabled': False}
+    config['selector_learning'] = {'enabled': False}
+    config['dedup'] = dict(config.get('dedup', {}) or {}, path='')
+
+    sizes = [parse_size(size) for size in args.sizes.split(',') if size.strip()]
+    results = {}
+    if args.only in (None, 'parsers'):
+        results.update(benchmark_parsers(config, logger, args.repeat))
+    if args.only in (None, 'processing'):
+        results.update(benchmark_processing(config, logger, sizes, args.repeat, args.excel_max_rows))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'html_parser': resolve_parser((config.get('scraping', {}) or {}).get('html_parser')),
+            'sizes': [size_label(rows) for rows in sizes],
+            'repeat': args.repeat,
+            'peak_rss_mb': peak_rss_mb()
+        },
+        'results': results
+    }
+
+    output = args.output or resolve_path(os.path.join(
+        'output', 'benchmarks', f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"))
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file).get('results', {})
+
+    regressions = 0
+    print(f"{'benchmark':<52} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, previous, current, ratio, status in compare(results, baseline, args.tolerance):
+        previous_text = f"{previous * 1000:8.1f}ms" if previous is not None else f"{'-':>10}"
+        ratio_text = f"{ratio:6.2f}x" if ratio is not None else f"{'':>7}"
+        print(f"{name:<52} {previous_text} {current * 1000:8.1f}ms {ratio_text}  {status}")
+        regressions += status == 'slower'
+
+    print(f"Results saved to: {output}")
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline saved to: {args.baseline}")
+
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
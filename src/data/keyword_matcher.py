@@ -0,0 +1,81 @@
+import re
+from typing import Dict, List, TYPE_CHECKING
+
+# Scrapers use the matcher without pandas; only classify needs it
+if TYPE_CHECKING:
+    import pandas as pd
+
+class KeywordMatcher:
+    """Match many keyword groups against text with one compiled regex"""
+
+    def __init__(self, groups: Dict[str, List[str]], suffixes: List[str] = None):
+        """suffixes are word endings a keyword may carry and still match, e.g. 'ing' for 'contracting'"""
+        self.group_order = list(groups)
+        self._group_rank = {group: rank for rank, group in enumerate(self.group_order)}
+
+        # Lowercased keyword -> groups it belongs to, in mapping order
+        self.keyword_groups: Dict[str, List[str]] = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                self.keyword_groups.setdefault(keyword.lower(), [])
+                if group not in self.keyword_groups[keyword.lower()]:
+                    self.keyword_groups[keyword.lower()].append(group)
+
+        # Longest keywords first so "SAP ABAP" wins over "SAP" at the same position.
+        # The lookahead lets matches overlap, e.g. "Oracle BI" inside "Oracle BI Publisher".
+        alternation = '|'.join(
+            re.escape(keyword) for keyword in sorted(self.keyword_groups, key=len, reverse=True)
+        )
+        # Only listed endings are allowed, so "temp" still does not match "template"
+        ending = f"(?:{'|'.join(map(re.escape, suffixes))})?" if suffixes else ''
+        self.pattern = re.compile(rf'(?<!\w)(?=({alternation}){ending}(?!\w))', re.IGNORECASE)
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether text contains any keyword"""
+        return bool(text) and self.pattern.search(text) is not None
+
+    def find_keywords(self, text: str) -> List[str]:
+        """Return the distinct keywords found in text, in order of appearance"""
+        if not text:
+            return []
+        return list(dict.fromkeys(match.lower() for match in self.pattern.findall(text)))
+
+    def find_groups(self, text: str) -> List[str]:
+        """Return every group with a keyword in text, in mapping order"""
+        groups = {group for keyword in self.find_keywords(text) for group in self.keyword_groups[keyword]}
+        return sorted(groups, key=self._group_rank.get)
+
+    def classify(self, texts: 'pd.Series', default: str = "Other") -> 'pd.DataFrame':
+        """Match a whole column at once
+
+        Returns a frame aligned with texts with the first matching group in
+        mapping order ('group'), all matching groups ('groups') and all
+        matched keywords ('keywords'), the latter two as comma separated text.
+        """
+        import pandas as pd
+
+        result = pd.DataFrame(index=texts.index)
+        result['group'] = default
+        result['groups'] = ""
+        result['keywords'] = ""
+
+        # One row per (text, keyword) match
+        matches = texts.fillna('').str.findall(self.pattern).explode().dropna().str.lower()
+        if matches.empty:
+            return result
+
+        matches = matches.reset_index().set_axis(['row', 'keyword'], axis=1).drop_duplicates()
+
+        result.loc[:, 'keywords'] = matches.groupby('row')['keyword'].agg(', '.join)
+
+        # One row per (text, group) match, ranked by mapping order
+        groups = matches.assign(group=matches['keyword'].map(self.keyword_groups)).explode('group')
+        groups = groups[['row', 'group']].drop_duplicates()
+        groups['rank'] = groups['group'].map(self._group_rank)
+        groups = groups.sort_values(['row', 'rank'])
+
+        by_row = groups.groupby('row')['group']
+        result.loc[:, 'group'] = by_row.first()
+        result.loc[:, 'groups'] = by_row.agg(', '.join)
+
+        return result.fillna({'group': default, 'groups': "", 'keywords': ""})
@@ -0,0 +1,261 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Any, List, Optional
+import numpy as np
+import pandas as pd
+from src.utils.config import resolve_path
+
+# Largest prime below 2**32, so hashed values fit in uint32 and a * x + b cannot overflow uint64
+_PRIME = np.uint64(4294967291)
+
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
+def normalize_for_matching(text: str) -> str:
+    """Lowercase text and collapse punctuation and whitespace to single spaces"""
+    return NON_ALNUM_PATTERN.sub(' ', str(text).lower()).strip()
+
+def title_key(title: str) -> str:
+    """Short digest of a normalized title; near-duplicates must share it"""
+    return hashlib.sha1(normalize_for_matching(title).encode('utf-8')).hexdigest()[:16]
+
+def shingle_hashes(text: str, size: int = 4) -> np.ndarray:
+    """Stable 32-bit hashes of the character shingles of normalized text"""
+    if len(text) <= size:
+        shingles = {text}
+    else:
+        shingles = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+class MinHasher:
+    """MinHash signatures whose estimated Jaccard similarity tracks shingle overlap"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        self.num_perm = num_perm
+        # Fixed seed so signatures stay comparable with ones stored by earlier runs
+        state = np.random.RandomState(seed)
+        self._a = state.randint(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = state.randint(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """Signature of one normalized text"""
+        hashes = shingle_hashes(text) % _PRIME
+        return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0).astype(np.uint32)
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """Signatures of many texts as an (n, num_perm) uint32 matrix"""
+        if not texts:
+            return np.empty((0, self.num_perm), dtype=np.uint32)
+        return np.vstack([self.signature(text) for text in texts])
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index of posted jobs, persisted in SQLite across runs
+
+    Each signature is split into bands; jobs sharing any band bucket become
+    candidates and are confirmed by their estimated similarity, so a batch
+    is checked in time linear in its size rather than against every job.
+    Only jobs with the same normalized title can match: the similarity of
+    title, company and location absorbs formatting differences, but short
+    texts like "Java Developer II" and "Java Developer III" score too close
+    to tell distinct postings apart.
+    """
+
+    def __init__(self, path: str, logger, num_perm: int = 64, bands: int = 16, threshold: float = 0.8,
+                 against_history: bool = False, retention_days: float = 90):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+
+        self.logger = logger
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.threshold = threshold
+        self.against_history = against_history
+        self.retention_days = retention_days
+        self.run_started = time.time()
+        self.resumed_since = None
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS signatures ("
+            "key TEXT PRIMARY KEY, platform TEXT, first_seen REAL, last_seen REAL, signature BLOB, title_key TEXT);"
+            "CREATE TABLE IF NOT EXISTS lsh_buckets (band INTEGER, bucket INTEGER, key TEXT);"
+            "CREATE INDEX IF NOT EXISTS lsh_buckets_lookup ON lsh_buckets (band, bucket);"
+            "CREATE INDEX IF NOT EXISTS lsh_buckets_key ON lsh_buckets (key);"
+            "CREATE TEMP TABLE batch_buckets (row INTEGER, band INTEGER, bucket INTEGER, title_key TEXT);"
+        )
+        # Indexes written before titles were compared get the column; their jobs never match again
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(signatures)")}
+        if 'title_key' not in columns:
+            self._db.execute("ALTER TABLE signatures ADD COLUMN title_key TEXT")
+        self._expire()
+
+        # Random odd multipliers that fold the rows of a band into one bucket id
+        self._band_coefficients = np.random.RandomState(2).randint(
+            1, 2 ** 62, size=self.rows_per_band, dtype=np.uint64) | np.uint64(1)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], logger) -> Optional['NearDuplicateIndex']:
+        """Build the index from the dedup section, or return None when disabled"""
+        dedup_config = config.get('dedup', {}) or {}
+        if not dedup_config.get('enabled', False):
+            return None
+
+        path = dedup_config.get('path') or ':memory:'
+        return cls(
+            path=resolve_path(path) if path != ':memory:' else path,
+            logger=logger,
+            num_perm=int(dedup_config.get('num_perm', 64)),
+            bands=int(dedup_config.get('bands', 16)),
+            threshold=float(dedup_config.get('threshold', 0.8)),
+            against_history=dedup_config.get('against_history', False),
+            retention_days=dedup_config.get('retention_days', 90)
+        )
+
+    def begin_run(self, resumed_since: float = None):
+        """Start a new run; without against_history only jobs from this run count as duplicates
+
+        When resuming an interrupted run, pass its start time: jobs first indexed
+        by the interrupted attempt are processed again and must not match themselves.
+        """
+        self.run_started = time.time()
+        self.resumed_since = resumed_since
+
+    def find_duplicates(self, df: pd.DataFrame) -> pd.Series:
+        """Mark rows that nearly duplicate an earlier row or an indexed job, and index the rest"""
+        if df.empty:
+            return pd.Series(False, index=df.index)
+
+        texts = (df['title'].fillna('') + ' ' + df['company'].fillna('') + ' ' + df['location'].fillna(''))
+        texts = [normalize_for_matching(text) for text in texts]
+        title_keys = [title_key(title) for title in df['title'].fillna('')]
+        signatures = self.hasher.signatures(texts)
+        buckets = self._bucket_ids(signatures)
+
+        with self._lock:
+            history = self._lookup(buckets, title_keys)
+
+            duplicate = np.zeros(len(df), dtype=bool)
+            batch_buckets: Dict[tuple, List[int]] = {}
+            historical_matches = []
+
+            for row in range(len(df)):
+                # Keyed by title too, so only rows with the same normalized title are compared
+                row_buckets = [(title_keys[row], band, int(buckets[row, band])) for band in range(self.bands)]
+
+                match = self._best_match(signatures[row], history.get(row, {}))
+                if match is not None:
+                    duplicate[row] = True
+                    historical_matches.append(match)
+                    continue
+
+                earlier = {other for bucket in row_buckets for other in batch_buckets.get(bucket, [])}
+                if earlier and self._similarities(signatures[row], signatures[list(earlier)]).max() >= self.threshold:
+                    duplicate[row] = True
+                    continue
+
+                for bucket in row_buckets:
+                    batch_buckets.setdefault(bucket, []).append(row)
+
+            kept = np.flatnonzero(~duplicate)
+            self._store(texts, title_keys, df['platform'].fillna('').tolist(), signatures, buckets, kept,
+                        historical_matches)
+
+        self.logger.info(
+            f"Near-duplicate check: {int(duplicate.sum())} of {len(df)} jobs dropped "
+            f"({len(historical_matches)} matched earlier runs)"
+        )
+        return pd.Series(duplicate, index=df.index)
+
+    def _bucket_ids(self, signatures: np.ndarray) -> np.ndarray:
+        """Fold each band of each signature into a signed 64-bit bucket id"""
+        banded = signatures.astype(np.uint64).reshape(len(signatures), self.bands, self.rows_per_band)
+        with np.errstate(over='ignore'):
+            folded = (banded * self._band_coefficients).sum(axis=2, dtype=np.uint64)
+        return folded.view(np.int64)
+
+    def _lookup(self, buckets: np.ndarray, title_keys: List[str]) -> Dict[int, Dict[str, np.ndarray]]:
+        """Indexed signatures with the row's title sharing a bucket with each row, keyed by row then job key"""
+        since = self.run_started if not self.against_history else 0
+        # Window of first_seen times indexed by an interrupted attempt of this run; empty when not resuming
+        skip_from, skip_until = (self.resumed_since, self.run_started) if self.resumed_since else (0, 0)
+
+        self._db.execute("DELETE FROM batch_buckets")
+        self._db.executemany(
+            "INSERT INTO batch_buckets VALUES (?, ?, ?, ?)",
+            ((row, band, int(buckets[row, band]), title_keys[row])
+             for row in range(len(buckets)) for band in range(self.bands))
+        )
+        rows = self._db.execute(
+            "SELECT DISTINCT b.row, s.key, s.signature FROM batch_buckets b "
+            "JOIN lsh_buckets l ON l.band = b.band AND l.bucket = b.bucket "
+            "JOIN signatures s ON s.key = l.key AND s.title_key = b.title_key WHERE s.last_seen >= ? "
+            "AND NOT (s.first_seen >= ? AND s.first_seen < ?)",
+            (since, skip_from, skip_until)
+        ).fetchall()
+
+        history: Dict[int, Dict[str, np.ndarray]] = {}
+        for row, key, signature in rows:
+            history.setdefault(row, {})[key] = np.frombuffer(signature, dtype=np.uint32)
+        return history
+
+    def _best_match(self, signature: np.ndarray, candidates: Dict[str, np.ndarray]) -> Optional[str]:
+        """Key of the first candidate similar enough to count as the same job"""
+        if not candidates:
+            return None
+
+        keys = list(candidates)
+        similarities = self._similarities(signature, np.vstack([candidates[key] for key in keys]))
+        best = int(similarities.argmax())
+        return keys[best] if similarities[best] >= self.threshold else None
+
+    @staticmethod
+    def _similarities(signature: np.ndarray, others: np.ndarray) -> np.ndarray:
+        """Estimated Jaccard similarity of a signature to each row of others"""
+        return (others == signature).mean(axis=1)
+
+    def _store(self, texts: List[str], title_keys: List[str], platforms: List[str], signatures: np.ndarray,
+               buckets: np.ndarray, kept: np.ndarray, historical_matches: List[str]):
+        """Index the kept rows and refresh jobs that were matched again"""
+        now = time.time()
+        new_keys = []
+        for row in kept:
+            key = hashlib.sha1(texts[row].encode('utf-8')).hexdigest()
+            exists = self._db.execute("SELECT 1 FROM signatures WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT INTO signatures (key, platform, first_seen, last_seen, signature, title_key) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET last_seen = excluded.last_seen, title_key = excluded.title_key",
+                (key, platforms[row], now, now, signatures[row].tobytes(), title_keys[row])
+            )
+            if not exists:
+                new_keys.append((key, row))
+
+        self._db.executemany(
+            "INSERT INTO lsh_buckets VALUES (?, ?, ?)",
+            ((band, int(buckets[row, band]), key) for key, row in new_keys for band in range(self.bands))
+        )
+        self._db.executemany(
+            "UPDATE signatures SET last_seen = ? WHERE key = ?",
+            ((now, key) for key in set(historical_matches))
+        )
+        self._db.commit()
+
+    def _expire(self):
+        """Forget jobs not seen within the retention period"""
+        if not self.retention_days:
+            return
+
+        cutoff = time.time() - self.retention_days * 86400
+        self._db.execute("DELETE FROM lsh_buckets WHERE key IN (SELECT key FROM signatures WHERE last_seen < ?)", (cutoff,))
+        self._db.execute("DELETE FROM signatures WHERE last_seen < ?", (cutoff,))
+        self._db.commit()
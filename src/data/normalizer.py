@@ -0,0 +1,88 @@
+import re
+from datetime import datetime
+import pandas as pd
+from src.utils.helpers import (
+    WHITESPACE_PATTERN, SPECIAL_CHARS_PATTERN, DAYS_AGO_PATTERN, HOURS_AGO_PATTERN,
+    US_DATE_PATTERN, ISO_DATE_PATTERN
+)
+
+TEXT_COLUMNS = ['title', 'company', 'location', 'description']
+
+# All contract duration phrasings in one pass; the leftmost phrase in the text wins
+DURATION_PATTERN = re.compile(
+    r'(?P<match>'
+    r'(?P<range_low>\d+)\s*to\s*(?P<range_high>\d+)\s*months?\s*contract'
+    r'|(?P<count>\d+)(?:\s*|-)(?P<unit>month|week|year)s?\s*contract'
+    r'|contract\s*for\s*(?P<for_count>\d+)\s*(?P<for_unit>month)s?'
+    r')',
+    re.IGNORECASE
+)
+
+MONTHS_PER_UNIT = {'week': 12 / 52, 'month': 1.0, 'year': 12.0}
+
+def clean_text_column(values: pd.Series) -> pd.Series:
+    """Column-wise version of helpers.clean_text"""
+    values = values.fillna('').astype(str).str.strip()
+    values = values.str.replace(WHITESPACE_PATTERN, ' ', regex=True)
+    return values.str.replace(SPECIAL_CHARS_PATTERN, '', regex=True)
+
+def normalize_dates(values: pd.Series, run_timestamp: datetime) -> pd.Series:
+    """Normalize posting dates to YYYY-MM-DD, resolving relative dates against run_timestamp
+
+    Values that are empty stay empty; values that cannot be parsed fall back
+    to the run date, as helpers.extract_date_from_text does.
+    """
+    values = values.fillna('').astype(str)
+    run_time = pd.Timestamp(run_timestamp)
+    dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+
+    days_ago = pd.to_numeric(values.str.extract(DAYS_AGO_PATTERN)[0], errors='coerce')
+    dates = dates.fillna(run_time - pd.to_timedelta(days_ago, unit='D'))
+
+    hours_ago = pd.to_numeric(values.str.extract(HOURS_AGO_PATTERN)[0], errors='coerce')
+    dates = dates.fillna(run_time - pd.to_timedelta(hours_ago, unit='h'))
+
+    us_parts = values.str.extract(US_DATE_PATTERN)
+    us_dates = pd.to_datetime(
+        us_parts[2] + '-' + us_parts[0] + '-' + us_parts[1], format='%Y-%m-%d', errors='coerce'
+    )
+    dates = dates.fillna(us_dates)
+
+    iso_parts = values.str.extract(ISO_DATE_PATTERN)
+    iso_dates = pd.to_datetime(
+        iso_parts[0] + '-' + iso_parts[1] + '-' + iso_parts[2], format='%Y-%m-%d', errors='coerce'
+    )
+    dates = dates.fillna(iso_dates)
+
+    normalized = dates.dt.strftime('%Y-%m-%d').fillna(run_time.strftime('%Y-%m-%d'))
+    return normalized.where(values.str.strip() != '', '')
+
+def extract_contract_durations(descriptions: pd.Series) -> pd.DataFrame:
+    """Extract contract duration text and length in months for a whole column
+
+    Ranges such as "3 to 6 months contract" count as their upper bound.
+    """
+    parts = descriptions.fillna('').astype(str).str.lower().str.extract(DURATION_PATTERN)
+
+    count = pd.to_numeric(parts['count'], errors='coerce')
+    unit_months = parts['unit'].str.lower().map(MONTHS_PER_UNIT)
+
+    months = count * unit_months
+    months = months.fillna(pd.to_numeric(parts['range_high'], errors='coerce'))
+    months = months.fillna(pd.to_numeric(parts['for_count'], errors='coerce'))
+
+    return pd.DataFrame({
+        'text': parts['match'].fillna('Not specified'),
+        'months': months.round(1).astype(float)
+    }, index=descriptions.index)
+
+def normalize_jobs(df: pd.DataFrame, run_timestamp: datetime) -> pd.DataFrame:
+    """Clean text columns and normalize posting dates for a batch of jobs"""
+    for column in TEXT_COLUMNS:
+        if column in df.columns:
+            df[column] = clean_text_column(df[column])
+
+    if 'posting_date' in df.columns:
+        df['posting_date'] = normalize_dates(df['posting_date'], run_timestamp)
+
+    return df
@@ -1,112 +1,86 @@
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from itertools import islice
 import os
-from datetime import datetime
-from src.utils.config import get_role_mappings
-from src.utils.helpers import get_us_states
+from datetime import datetime, date, timedelta
+from src.utils.config import get_role_mappings, get_city_states, resolve_path
+from src.utils.helpers import get_us_states, get_us_state_abbreviations
+from src.utils.metrics import get_metrics
+from src.data.keyword_matcher import KeywordMatcher
+from src.data.state_resolver import StateResolver
+from src.data.normalizer import normalize_jobs, extract_contract_durations
+from src.data.near_duplicates import NearDuplicateIndex
+from src.data.writers import create_writers
+from src.data.rollups import RollupStore, build_rollup, combine_rollups, summarize_rollup
+
+# Days covered by each period report
+REPORT_PERIOD_DAYS = {'week': 7, 'month': 30, 'quarter': 91}
+
+# Rollup labels written by scheduled runs; manual test runs are left out of reports
+SCHEDULED_RUN_LABELS = ['monday', 'daily']
 
 class DataProcessor:
     """Process and analyze scraped job data"""
     
-    def __init__(self, logger):
+    def __init__(self, logger, config: Optional[Dict[str, Any]] = None):
         self.logger = logger
         self.role_mappings = get_role_mappings()
         self.us_states = get_us_states()
+        self.vertical_matcher = KeywordMatcher(self.role_mappings['verticals'])
+        self.state_resolver = StateResolver(self.us_states, get_us_state_abbreviations(), get_city_states())
+        self._rollup_store = None
+        self.near_duplicates = NearDuplicateIndex.from_config(config or {}, logger)
+        self.metrics = get_metrics()
     
-    def process_jobs(self, jobs: List[Dict[str, Any]]) -> pd.DataFrame:
+    def _stage(self, stage: str):
+        """Timer for one processing stage"""
+        return self.metrics.timer('processing_stage_seconds', stage=stage)
+    
+    def process_jobs(self, jobs: List[Dict[str, Any]], run_timestamp: datetime = None) -> pd.DataFrame:
         """Process raw job data into structured DataFrame"""
         if not jobs:
             return pd.DataFrame()
         
         df = pd.DataFrame(jobs)
         
+        # Clean text and normalize dates against one run timestamp
+        with self._stage('normalize'):
+            df = normalize_jobs(df, run_timestamp or datetime.now())
+        
         # Add vertical classification
-        df['vertical'] = df.apply(self._classify_vertical, axis=1)
+        with self._stage('classify'):
+            df = self._classify_verticals(df)
         
         # Extract state from location
-        df['state'] = df['location'].apply(self._extract_state)
+        with self._stage('state'):
+            df['state'] = self.state_resolver.resolve_series(df['location'])
         
         # Add contract duration if available
-        df['contract_duration'] = df['description'].apply(self._extract_contract_duration)
+        with self._stage('duration'):
+            durations = extract_contract_durations(df['description'])
+            df['contract_duration'] = durations['text']
+            df['contract_duration_months'] = durations['months']
         
         # Clean and standardize data
-        df = self._clean_dataframe(df)
+        with self._stage('clean'):
+            df = self._clean_dataframe(df)
         
         return df
     
-    def _classify_vertical(self, row) -> str:
-        """Classify job into vertical based on title and description"""
-        title = row['title'].lower()
-        description = row['description'].lower()
+    def _classify_verticals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Classify all jobs into verticals based on title and description"""
+        text_to_check = df['title'].fillna('') + ' ' + df['description'].fillna('')
         
-        text_to_check = f"{title} {description}"
+        matches = self.vertical_matcher.classify(text_to_check)
+        df['vertical'] = matches['group']
+        df['matched_verticals'] = matches['groups']
+        df['matched_keywords'] = matches['keywords']
         
-        # Check each vertical
-        for vertical, keywords in self.role_mappings['verticals'].items():
-            if any(keyword.lower() in text_to_check for keyword in keywords):
-                return vertical
-        
-        return "Other"
+        return df
     
     def _extract_state(self, location: str) -> str:
         """Extract US state from location string"""
-        if not location:
-            return "Unknown"
-        
-        location_upper = location.upper()
-        
-        for state in self.us_states:
-            if state.upper() in location_upper:
-                return state
-        
-        # Check for state abbreviations
-        state_abbrevs = {
-            'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
-            'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
-            'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
-            'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
-            'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
-            'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
-            'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
-            'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
-            'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
-            'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
-            'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
-            'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
-            'WI': 'Wisconsin', 'WY': 'Wyoming'
-        }
-        
-        for abbrev, full_name in state_abbrevs.items():
-            if f" {abbrev} " in f" {location_upper} " or location_upper.endswith(f" {abbrev}"):
-                return full_name
-        
-        return "Unknown"
-    
-    def _extract_contract_duration(self, description: str) -> str:
-        """Extract contract duration from job description"""
-        if not description:
-            return "Not specified"
-        
-        import re
-        
-        # Common patterns for contract duration
-        patterns = [
-            r'(\d+)\s*month[s]?\s*contract',
-            r'(\d+)\s*week[s]?\s*contract',
-            r'(\d+)\s*year[s]?\s*contract',
-            r'contract\s*for\s*(\d+)\s*month[s]?',
-            r'(\d+)-month\s*contract',
-            r'(\d+)\s*to\s*(\d+)\s*month[s]?\s*contract'
-        ]
-        
-        description_lower = description.lower()
-        
-        for pattern in patterns:
-            match = re.search(pattern, description_lower)
-            if match:
-                return match.group(0)
-        
-        return "Not specified"
+        return self.state_resolver.resolve(location)
     
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and standardize DataFrame"""
@@ -117,10 +91,16 @@ class DataProcessor:
         df['description'] = df['description'].fillna('')
         df['contract_duration'] = df['contract_duration'].fillna('Not specified')
         
+        # Drop reworded copies of the same posting, e.g. one job listed on several platforms
+        if self.near_duplicates is not None:
+            with self._stage('near_duplicates'):
+                df = df[~self.near_duplicates.find_duplicates(df)]
+        
         # Standardize column order
         columns_order = [
             'title', 'vertical', 'state', 'platform', 'posting_date', 
-            'contract_duration', 'company', 'location', 'description', 'url'
+            'contract_duration', 'contract_duration_months', 'company', 'location', 'description', 'url',
+            'matched_verticals', 'matched_keywords'
         ]
         
         # Reorder columns
@@ -150,31 +130,126 @@ class DataProcessor:
         self.logger.info(f"Data saved to: {filepath}")
         return filepath
     
+    def process_jobs_chunked(self, jobs: Iterable[Dict[str, Any]], basename: str, config: Dict[str, Any],
+                             label: str, run_timestamp: datetime = None, resumed: bool = False) -> Dict[str, Any]:
+        """Enrich and write jobs in bounded batches while they are still being scraped
+        
+        Returns counts of scraped and saved jobs plus the output file paths.
+        A resumed run passes its original timestamp and rewrites its outputs.
+        """
+        run_timestamp = run_timestamp or datetime.now()
+        if self.near_duplicates is not None:
+            self.near_duplicates.begin_run(run_timestamp.timestamp() if resumed else None)
+        chunk_size = (config.get('processing', {}) or {}).get('chunk_size', 500)
+        
+        writers = []
+        # Running rollup of the saved jobs; it also feeds the Excel summary sheets, so no rows are kept
+        rollup = None
+        seen_keys = set()
+        result = {'jobs_scraped': 0, 'jobs_saved': 0, 'filepaths': []}
+        
+        try:
+            for batch in self._batches(jobs, chunk_size):
+                result['jobs_scraped'] += len(batch)
+                
+                df = self._drop_earlier_duplicates(self.process_jobs(batch, run_timestamp), seen_keys)
+                if df.empty:
+                    continue
+                
+                if not writers:
+                    writers = create_writers(config, basename, self.logger,
+                                             summary_builder=lambda: summarize_rollup(rollup))
+                
+                with self._stage('write'):
+                    for writer in writers:
+                        writer.write_chunk(df)
+                
+                with self._stage('rollup'):
+                    chunk_rollup = build_rollup(df)
+                    rollup = chunk_rollup if rollup is None else combine_rollups([rollup, chunk_rollup])
+                result['jobs_saved'] += len(df)
+                self.metrics.inc('jobs_saved_total', len(df))
+                self.logger.info(f"Processed chunk of {len(batch)} jobs ({result['jobs_saved']} saved so far)")
+        finally:
+            with self._stage('close_writers'):
+                result['filepaths'], close_error = self._close_writers(writers)
+        
+        # When the batch loop failed its error propagated from the finally above; otherwise report a failed close
+        if close_error is not None:
+            raise close_error
+        
+        for filepath in result['filepaths']:
+            self.logger.info(f"Data saved to: {filepath}")
+        
+        if rollup is not None:
+            filepath = self.rollup_store.save_rollup(rollup, run_timestamp.date(), label)
+            self.logger.info(f"Rollup saved to: {filepath}")
+        
+        return result
+    
+    def _close_writers(self, writers: list) -> Tuple[List[str], Optional[Exception]]:
+        """Close every writer even when some fail; returns the paths written and the first close error"""
+        filepaths = []
+        error = None
+        for writer in writers:
+            try:
+                filepaths.append(writer.close())
+            except Exception as e:
+                self.logger.error(f"Failed to close {writer.path}: {e}")
+                error = error or e
+        return filepaths, error
+    
+    def _batches(self, jobs: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Group an iterable of jobs into lists of at most size jobs"""
+        iterator = iter(jobs)
+        while True:
+            batch = list(islice(iterator, size))
+            if not batch:
+                return
+            yield batch
+    
+    def _drop_earlier_duplicates(self, df: pd.DataFrame, seen_keys: set) -> pd.DataFrame:
+        """Drop rows already written in an earlier chunk of the same run"""
+        if df.empty:
+            return df
+        
+        keys = pd.Series(list(zip(df['title'], df['company'], df['location'])), index=df.index)
+        df = df[~keys.isin(seen_keys)]
+        seen_keys.update(keys[df.index])
+        return df
+    
     def _create_summary_sheets(self, df: pd.DataFrame, writer):
         """Create summary analysis sheets"""
-        # Vertical analysis
-        vertical_summary = df.groupby('vertical').agg({
-            'title': 'count',
-            'state': lambda x: x.nunique(),
-            'platform': lambda x: ', '.join(x.unique())
-        }).rename(columns={'title': 'job_count', 'state': 'states_count'})
-        
-        vertical_summary.to_excel(writer, sheet_name='Vertical_Analysis')
-        
-        # State analysis
-        state_summary = df.groupby('state').agg({
-            'title': 'count',
-            'vertical': lambda x: ', '.join(x.unique()),
-            'platform': lambda x: ', '.join(x.unique())
-        }).rename(columns={'title': 'job_count'})
-        
-        state_summary.to_excel(writer, sheet_name='State_Analysis')
-        
-        # Platform analysis
-        platform_summary = df.groupby('platform').agg({
-            'title': 'count',
-            'vertical': lambda x: x.nunique(),
-            'state': lambda x: x.nunique()
-        }).rename(columns={'title': 'job_count', 'vertical': 'verticals_count', 'state': 'states_count'})
-        
-        platform_summary.to_excel(writer, sheet_name='Platform_Analysis')
+        for sheet_name, summary in self.build_summaries(df).items():
+            summary.to_excel(writer, sheet_name=sheet_name)
+    
+    def build_summaries(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Build the vertical, state and platform summaries keyed by sheet name"""
+        return summarize_rollup(build_rollup(df))
+    
+    @property
+    def rollup_store(self) -> RollupStore:
+        """Store of per-day rollups used for period reports"""
+        if self._rollup_store is None:
+            self._rollup_store = RollupStore(resolve_path(os.path.join('output', 'rollups')), self.logger)
+        return self._rollup_store
+    
+    def save_period_report(self, period: str, end_day: date = None, labels: List[str] = None) -> str:
+        """Save summary sheets for the last week, month or quarter from stored rollups"""
+        end_day = end_day or date.today()
+        start_day = end_day - timedelta(days=REPORT_PERIOD_DAYS[period] - 1)
+        labels = labels or SCHEDULED_RUN_LABELS
+        
+        summaries = self.rollup_store.summarize(start_day, end_day, labels)
+        
+        output_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'output', 'excel')
+        os.makedirs(output_dir, exist_ok=True)
+        filepath = os.path.join(output_dir, f"job_summary_{period}_{end_day.strftime('%Y%m%d')}.xlsx")
+        
+        with pd.ExcelWriter(filepath, engine='xlsxwriter') as writer:
+            for sheet_name, summary in summaries.items():
+                summary.to_excel(writer, sheet_name=sheet_name)
+            self.rollup_store.trend(start_day, end_day, labels=labels).to_excel(writer, sheet_name='Vertical_Trend')
+        
+        self.logger.info(f"{period.capitalize()} report ({start_day} to {end_day}) saved to: {filepath}")
+        return filepath
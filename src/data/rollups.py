@@ -0,0 +1,106 @@
+import os
+import re
+from datetime import date, datetime
+from typing import Dict, List
+import pandas as pd
+
+ROLLUP_DIMENSIONS = ['vertical', 'state', 'platform']
+
+# <YYYY-MM-DD>_<label>.csv, e.g. 2025-06-24_daily.csv
+ROLLUP_FILE_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})_(\w+)\.csv$')
+
+def build_rollup(df: pd.DataFrame) -> pd.DataFrame:
+    """Count jobs per (vertical, state, platform); every summary can be derived from this"""
+    if df.empty:
+        return pd.DataFrame(columns=ROLLUP_DIMENSIONS + ['job_count'])
+
+    return df.groupby(ROLLUP_DIMENSIONS, sort=False, dropna=False).size().reset_index(name='job_count')
+
+def combine_rollups(rollups: List[pd.DataFrame]) -> pd.DataFrame:
+    """Merge partial rollups, e.g. one per processed chunk, into one"""
+    if not rollups:
+        return build_rollup(pd.DataFrame())
+    combined = pd.concat(rollups, ignore_index=True)
+    return combined.groupby(ROLLUP_DIMENSIONS, sort=False, dropna=False)['job_count'].sum().reset_index()
+
+def summarize_rollup(rollup: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Build the vertical, state and platform summaries from a rollup, keyed by sheet name"""
+    vertical_summary = pd.DataFrame({
+        'job_count': rollup.groupby('vertical')['job_count'].sum(),
+        'states_count': _distinct_count(rollup, 'vertical', 'state'),
+        'platform': _distinct_join(rollup, 'vertical', 'platform')
+    })
+
+    state_summary = pd.DataFrame({
+        'job_count': rollup.groupby('state')['job_count'].sum(),
+        'vertical': _distinct_join(rollup, 'state', 'vertical'),
+        'platform': _distinct_join(rollup, 'state', 'platform')
+    })
+
+    platform_summary = pd.DataFrame({
+        'job_count': rollup.groupby('platform')['job_count'].sum(),
+        'verticals_count': _distinct_count(rollup, 'platform', 'vertical'),
+        'states_count': _distinct_count(rollup, 'platform', 'state')
+    })
+
+    return {
+        'Vertical_Analysis': vertical_summary.rename_axis('vertical'),
+        'State_Analysis': state_summary.rename_axis('state'),
+        'Platform_Analysis': platform_summary.rename_axis('platform')
+    }
+
+def _distinct_count(rollup: pd.DataFrame, key: str, column: str) -> pd.Series:
+    """Number of distinct values of column per key"""
+    return rollup.drop_duplicates([key, column]).groupby(key).size()
+
+def _distinct_join(rollup: pd.DataFrame, key: str, column: str) -> pd.Series:
+    """Distinct values of column per key, joined in order of first appearance"""
+    return rollup.drop_duplicates([key, column]).groupby(key, sort=False)[column].agg(', '.join)
+
+
+class RollupStore:
+    """Persist one rollup per day and run type and merge them into period reports"""
+
+    def __init__(self, directory: str, logger):
+        self.directory = directory
+        self.logger = logger
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, df: pd.DataFrame, day: date, label: str) -> str:
+        """Store the rollup of a run's jobs, replacing an earlier run with the same day and label"""
+        return self.save_rollup(build_rollup(df), day, label)
+
+    def save_rollup(self, rollup: pd.DataFrame, day: date, label: str) -> str:
+        """Store an already built rollup for a day and label"""
+        path = os.path.join(self.directory, f"{day.isoformat()}_{label}.csv")
+        rollup.to_csv(path, index=False)
+        return path
+
+    def load(self, start: date, end: date, labels: List[str] = None) -> pd.DataFrame:
+        """Load the stored rollups between start and end (inclusive) with a 'day' column"""
+        parts = []
+        for filename in sorted(os.listdir(self.directory)):
+            match = ROLLUP_FILE_PATTERN.match(filename)
+            if not match:
+                continue
+
+            day = datetime.strptime(match.group(1), '%Y-%m-%d').date()
+            if not start <= day <= end or (labels and match.group(2) not in labels):
+                continue
+
+            part = pd.read_csv(os.path.join(self.directory, filename), keep_default_na=False)
+            parts.append(part.assign(day=day))
+
+        if not parts:
+            return pd.DataFrame(columns=['day'] + ROLLUP_DIMENSIONS + ['job_count'])
+
+        return pd.concat(parts, ignore_index=True)
+
+    def summarize(self, start: date, end: date, labels: List[str] = None) -> Dict[str, pd.DataFrame]:
+        """Build the summary sheets for a period by merging the stored daily rollups"""
+        return summarize_rollup(combine_rollups([self.load(start, end, labels)]))
+
+    def trend(self, start: date, end: date, by: str = 'vertical', labels: List[str] = None) -> pd.DataFrame:
+        """Job counts per day for each value of a dimension"""
+        rollup = self.load(start, end, labels)
+        return rollup.pivot_table(index='day', columns=by, values='job_count', aggfunc='sum', fill_value=0)
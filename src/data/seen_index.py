@@ -0,0 +1,108 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse, urlunparse
+from src.utils.config import resolve_path
+
+def canonical_url(url: str) -> str:
+    """Normalize a job URL so the same posting always maps to the same key"""
+    parsed = urlparse(url.strip())
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((parsed.scheme.lower() or 'https', parsed.netloc.lower(), path, '', '', ''))
+
+
+class SeenJobIndex:
+    """Persistent SQLite index of jobs already extracted in earlier runs"""
+
+    def __init__(self, path: str, logger, retention_days: float = 30):
+        self.logger = logger
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS seen_jobs ("
+            "key TEXT PRIMARY KEY, platform TEXT, first_seen REAL, last_seen REAL, job TEXT)"
+        )
+
+        if retention_days:
+            cutoff = time.time() - retention_days * 86400
+            self._db.execute("DELETE FROM seen_jobs WHERE last_seen < ?", (cutoff,))
+        self._db.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], logger) -> Optional['SeenJobIndex']:
+        """Build the index from the seen_index section, or return None when disabled"""
+        index_config = config.get('seen_index', {}) or {}
+        if not index_config.get('enabled', False):
+            return None
+
+        return cls(
+            path=resolve_path(index_config.get('path', 'output/cache/seen_jobs.sqlite')),
+            logger=logger,
+            retention_days=index_config.get('retention_days', 30)
+        )
+
+    @staticmethod
+    def make_key(platform: str, job_id: str = None, url: str = None) -> Optional[str]:
+        """Build an index key from a platform job ID, falling back to the canonical URL"""
+        if job_id:
+            return f"{platform.lower()}:id:{job_id.strip()}"
+        if url:
+            return f"{platform.lower()}:url:{canonical_url(url)}"
+        return None
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the stored job for key and mark it seen in this run, or None"""
+        if not key:
+            return None
+
+        with self._lock:
+            row = self._db.execute("SELECT job FROM seen_jobs WHERE key = ?", (key,)).fetchone()
+            stats = self.stats.setdefault(key.split(':', 1)[0], {'hits': 0, 'misses': 0})
+
+            if row is None:
+                stats['misses'] += 1
+                return None
+
+            stats['hits'] += 1
+            self._db.execute("UPDATE seen_jobs SET last_seen = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+        return json.loads(row[0])
+
+    def add(self, key: Optional[str], platform: str, job: Dict[str, Any]):
+        """Remember an extracted job"""
+        if not key:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO seen_jobs VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET last_seen = excluded.last_seen, job = excluded.job",
+                (key, platform, now, now, json.dumps(job))
+            )
+            self._db.commit()
+
+    def log_stats(self, platform: str):
+        """Log how many cards were skipped thanks to the index"""
+        stats = self.stats.get(platform.lower(), {'hits': 0, 'misses': 0})
+        self.logger.info(f"{platform} seen-job index: {stats['hits']} known postings reused, {stats['misses']} new")
+
+
+_shared_index = None
+_shared_lock = threading.Lock()
+
+def get_seen_index(config: Dict[str, Any], logger) -> Optional[SeenJobIndex]:
+    """Return the process-wide seen-job index, or None when it is disabled"""
+    global _shared_index
+
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = SeenJobIndex.from_config(config, logger)
+        return _shared_index
@@ -0,0 +1,72 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+import pandas as pd
+
+# Words, keeping internal dots/apostrophes/hyphens ("St. Louis", "Winston-Salem")
+TOKEN_PATTERN = re.compile(r"[A-Za-z]+(?:[.'\-][A-Za-z]+)*\.?")
+
+class StateResolver:
+    """Resolve free-text locations to US states with a precomputed gazetteer index"""
+
+    def __init__(self, states: List[str], abbreviations: Dict[str, str], cities: Dict[str, str],
+                 cache_size: int = 4096):
+        self.abbreviations = dict(abbreviations)
+
+        # Token tuple -> (kind, state); kinds are 'state' or 'city'.
+        # State names are added last so they win over a city of the same name.
+        self.index: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+        for city, state in cities.items():
+            self.index[self._tokens_key(city)] = ('city', state)
+        for state in states:
+            self.index[self._tokens_key(state)] = ('state', state)
+
+        self.max_words = max(len(key) for key in self.index)
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve_uncached)
+
+    def resolve_series(self, locations: pd.Series) -> pd.Series:
+        """Resolve a whole column, doing the work once per distinct location"""
+        locations = locations.fillna('')
+        mapping = {location: self.resolve(location) for location in locations.unique()}
+        return locations.map(mapping)
+
+    def cache_info(self):
+        """Return hit/miss statistics of the memo cache"""
+        return self.resolve.cache_info()
+
+    def _resolve_uncached(self, location: str) -> str:
+        """Resolve one location string in a single tokenized pass"""
+        if not location:
+            return "Unknown"
+
+        tokens = TOKEN_PATTERN.findall(location)
+        words = [token.rstrip('.').lower() for token in tokens]
+
+        explicit_state = None
+        city_state = None
+        i = 0
+
+        while i < len(words):
+            # Longest gazetteer entry starting here, so "Kansas City" is read as a city
+            for size in range(min(self.max_words, len(words) - i), 0, -1):
+                entry = self.index.get(tuple(words[i:i + size]))
+                if entry:
+                    kind, state = entry
+                    if kind == 'state':
+                        explicit_state = state
+                    elif city_state is None:
+                        city_state = state
+                    i += size
+                    break
+            else:
+                # Abbreviations only count when written in capitals ("Austin, TX", not "in")
+                token = tokens[i].rstrip('.')
+                if token.isupper() and token in self.abbreviations:
+                    explicit_state = self.abbreviations[token]
+                i += 1
+
+        return explicit_state or city_state or "Unknown"
+
+    @staticmethod
+    def _tokens_key(name: str) -> Tuple[str, ...]:
+        return tuple(token.rstrip('.').lower() for token in TOKEN_PATTERN.findall(name))
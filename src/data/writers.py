@@ -0,0 +1,258 @@
+import gzip
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Callable, List, Optional
+import pandas as pd
+from src.utils.config import resolve_path
+
+# Numeric job columns; every other column is written as text
+FLOAT_COLUMNS = {'contract_duration_months'}
+
+class BaseWriter(ABC):
+    """Output writer that accepts job data in chunks"""
+
+    extension = ''
+
+    def __init__(self, path: str, logger):
+        self.path = path
+        self.logger = logger
+        self.rows_written = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    @abstractmethod
+    def write_chunk(self, df: pd.DataFrame):
+        """Append a chunk of rows"""
+        pass
+
+    @abstractmethod
+    def close(self) -> str:
+        """Finish the file and return its path"""
+        pass
+
+
+class ParquetWriter(BaseWriter):
+    """Write chunks as row groups of a single Parquet file
+
+    Column types are fixed rather than inferred from the first chunk, where a
+    column that happens to be all empty would get a null type later chunks
+    cannot be written with.
+    """
+
+    extension = '.parquet'
+
+    def __init__(self, path: str, logger):
+        super().__init__(path, logger)
+        self._writer = None
+        self._schema = None
+
+    def write_chunk(self, df: pd.DataFrame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._schema = pa.schema([
+                (str(column), pa.float64() if column in FLOAT_COLUMNS else pa.string()) for column in df.columns
+            ])
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression='snappy')
+
+        df = df.reindex(columns=self._schema.names)
+        self._writer.write_table(pa.Table.from_pandas(df, schema=self._schema, preserve_index=False))
+        self.rows_written += len(df)
+
+    def close(self) -> str:
+        if self._writer is not None:
+            self._writer.close()
+        return self.path
+
+
+class JsonlWriter(BaseWriter):
+    """Write chunks as gzip-compressed JSON lines"""
+
+    extension = '.jsonl.gz'
+
+    def __init__(self, path: str, logger):
+        super().__init__(path, logger)
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+
+    def write_chunk(self, df: pd.DataFrame):
+        if df.empty:
+            return
+        lines = df.to_json(orient='records', lines=True, force_ascii=False)
+        # Newer pandas versions end the output with a newline, older ones do not
+        self._file.write(lines if lines.endswith('\n') else lines + '\n')
+        self.rows_written += len(df)
+
+    def close(self) -> str:
+        self._file.close()
+        return self.path
+
+
+class CsvWriter(BaseWriter):
+    """Write chunks as a gzip-compressed CSV file"""
+
+    extension = '.csv.gz'
+
+    def __init__(self, path: str, logger):
+        super().__init__(path, logger)
+        self._file = gzip.open(path, 'wt', encoding='utf-8', newline='')
+
+    def write_chunk(self, df: pd.DataFrame):
+        df.to_csv(self._file, index=False, header=self.rows_written == 0)
+        self.rows_written += len(df)
+
+    def close(self) -> str:
+        self._file.close()
+        return self.path
+
+
+class ExcelWriter(BaseWriter):
+    """Write chunks to xlsx with xlsxwriter, optionally in constant_memory mode
+
+    In constant_memory mode rows are flushed to disk as they are written and
+    no rows are kept; summary_builder is called on close for the summary
+    sheets, which the caller builds from its per-chunk rollups.
+    """
+
+    extension = '.xlsx'
+    max_rows_per_sheet = 1048575
+
+    def __init__(self, path: str, logger, constant_memory: bool = True,
+                 summary_builder: Optional[Callable[[], Dict[str, pd.DataFrame]]] = None):
+        super().__init__(path, logger)
+        import xlsxwriter
+
+        self._workbook = xlsxwriter.Workbook(path, {'constant_memory': constant_memory})
+        self._summary_builder = summary_builder
+        self._sheet = None
+        self._sheet_count = 0
+        self._sheet_row = 0
+        self._columns: List[str] = []
+
+    def write_chunk(self, df: pd.DataFrame):
+        if df.empty:
+            return
+
+        if not self._columns:
+            self._columns = list(df.columns)
+
+        values = df.reindex(columns=self._columns).astype(object)
+        values = values.where(values.notna(), None)
+
+        for row in values.itertuples(index=False, name=None):
+            if self._sheet is None or self._sheet_row > self.max_rows_per_sheet:
+                self._start_data_sheet()
+            self._sheet.write_row(self._sheet_row, 0, row)
+            self._sheet_row += 1
+
+        self.rows_written += len(df)
+
+    def close(self) -> str:
+        if self._sheet is None:
+            self._start_data_sheet()
+
+        if self._summary_builder is not None and self.rows_written:
+            for sheet_name, summary in self._summary_builder().items():
+                self._write_frame(sheet_name, summary.reset_index())
+
+        self._workbook.close()
+        return self.path
+
+    def _start_data_sheet(self):
+        """Start a Job_Data sheet, continuing on a new one when a sheet is full"""
+        self._sheet_count += 1
+        name = 'Job_Data' if self._sheet_count == 1 else f'Job_Data_{self._sheet_count}'
+        self._sheet = self._workbook.add_worksheet(name)
+        self._sheet.write_row(0, 0, self._columns)
+        self._sheet_row = 1
+
+    def _write_frame(self, sheet_name: str, df: pd.DataFrame):
+        """Write a small frame to its own sheet"""
+        sheet = self._workbook.add_worksheet(sheet_name)
+        sheet.write_row(0, 0, [str(col) for col in df.columns])
+
+        values = df.astype(object).where(df.notna(), None)
+        for row_number, row in enumerate(values.itertuples(index=False, name=None), start=1):
+            sheet.write_row(row_number, 0, row)
+
+
+class BackgroundWriter:
+    """Run a writer on its own thread so writing overlaps with scraping and processing"""
+
+    def __init__(self, writer: BaseWriter, queue_size: int = 4):
+        self.writer = writer
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=f'writer-{writer.extension}', daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self) -> str:
+        return self.writer.path
+
+    def write_chunk(self, df: pd.DataFrame):
+        """Queue a chunk, blocking when the writer is too far behind"""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(df)
+
+    def close(self) -> str:
+        """Wait for queued chunks to be written and finish the file"""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self.writer.path
+
+    def _run(self):
+        while True:
+            df = self._queue.get()
+            if df is None:
+                break
+            if self._error is None:
+                try:
+                    self.writer.write_chunk(df)
+                except Exception as e:
+                    self._error = e
+
+        try:
+            self.writer.close()
+        except Exception as e:
+            self._error = self._error or e
+
+
+WRITER_DIRECTORIES = {'excel': 'excel', 'parquet': 'parquet', 'jsonl': 'jsonl', 'csv': 'csv'}
+
+def create_writers(config: Dict[str, Any], basename: str, logger,
+                   summary_builder: Callable = None) -> List[Any]:
+    """Create the writers selected by the output section of settings.yaml"""
+    output = config.get('output', {}) or {}
+    base_dir = resolve_path(output.get('directory', 'output'))
+    formats = output.get('formats', ['excel']) or ['excel']
+
+    writers = []
+    for output_format in formats:
+        directory = os.path.join(base_dir, WRITER_DIRECTORIES.get(output_format, output_format))
+
+        if output_format == 'excel':
+            writer = ExcelWriter(
+                os.path.join(directory, basename + ExcelWriter.extension), logger,
+                constant_memory=output.get('excel_constant_memory', True),
+                summary_builder=summary_builder if output.get('include_summary_sheets', True) else None
+            )
+        elif output_format == 'parquet':
+            writer = ParquetWriter(os.path.join(directory, basename + ParquetWriter.extension), logger)
+        elif output_format == 'jsonl':
+            writer = JsonlWriter(os.path.join(directory, basename + JsonlWriter.extension), logger)
+        elif output_format == 'csv':
+            writer = CsvWriter(os.path.join(directory, basename + CsvWriter.extension), logger)
+        else:
+            logger.warning(f"Unknown output format '{output_format}', skipping")
+            continue
+
+        if output.get('background', True):
+            writer = BackgroundWriter(writer, output.get('queue_size', 4))
+        writers.append(writer)
+
+    return writers
@@ -4,28 +4,84 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.scheduler.job_scheduler import JobScheduler
+from src.scrapers.registry import SCRAPERS, available_platforms
 from src.utils.logger import setup_logger
 from src.utils.config import load_config
 import argparse
 
+def run_import_benchmark(logger):
+    """Log how long the entry point, each scraper and the data stack take to import"""
+    from src.utils.import_benchmark import benchmark_imports
+    
+    modules = ['src.scheduler.job_scheduler', 'src.data.processor']
+    modules += [target.split(':')[0] for target in SCRAPERS.values()]
+    
+    for module, seconds in benchmark_imports(modules).items():
+        logger.info(f"import {module}: {seconds * 1000:.0f} ms")
+
+def run_queue_worker(config, logger, run_id: str):
+    """Lease and scrape work units of a queued run until it is finished"""
+    from src.scheduler.work_queue import create_work_queue
+    from src.scheduler.worker import QueueWorker
+    from src.utils.metrics import get_metrics, report_path
+    from src.utils.rate_limiter import split_request_rates
+    
+    # Every worker process has its own limiter; each takes its share so the run keeps the configured rates
+    processes = int((config.get('execution', {}) or {}).get('queue_workers', 3))
+    config = split_request_rates(config, processes)
+    
+    worker = QueueWorker(config, logger, create_work_queue(config, logger))
+    try:
+        worker.run(run_id)
+    finally:
+        # Each worker process reports its own share of the run
+        path = report_path(config, f"{run_id}_worker_{worker.worker_id.replace(':', '_')}")
+        if path:
+            get_metrics().write_report(path, run_id=run_id, worker=worker.worker_id)
+
 def main():
     """Main entry point for the job scraper application"""
     logger = setup_logger()
     config = load_config()
     
     parser = argparse.ArgumentParser(description='Job Scraper Tool')
-    parser.add_argument('--mode', choices=['manual', 'scheduled'], default='scheduled',
-                       help='Run mode: manual or scheduled')
-    parser.add_argument('--platform', choices=['linkedin', 'monster', 'dice', 'all'], 
+    parser.add_argument('--mode', choices=['manual', 'scheduled', 'report', 'worker'], default='scheduled',
+                       help='Run mode: manual, scheduled, report or worker')
+    parser.add_argument('--platform', choices=available_platforms(config) + ['all'],
                        default='all', help='Platform to scrape')
+    parser.add_argument('--period', choices=['week', 'month', 'quarter'], default='week',
+                       help='Report period for report mode')
+    parser.add_argument('--run-id', help='Queued run to work on in worker mode')
+    parser.add_argument('--resume', nargs='?', const='latest', metavar='RUN_ID',
+                       help='Finish an interrupted run (the latest by default) and exit')
+    parser.add_argument('--benchmark-imports', action='store_true',
+                       help='Report import times of the main modules and exit')
     
     args = parser.parse_args()
     
+    if args.benchmark_imports:
+        run_import_benchmark(logger)
+        return
+    
+    if args.mode == 'worker':
+        if not args.run_id:
+            parser.error('--mode worker requires --run-id')
+        run_queue_worker(config, logger, args.run_id)
+        return
+    
     scheduler = JobScheduler(config, logger)
     
+    if args.resume:
+        logger.info("Resuming interrupted run...")
+        scheduler.resume_run(None if args.resume == 'latest' else args.resume)
+        return
+    
     if args.mode == 'manual':
         logger.info("Running manual scraping...")
         scheduler.run_manual_scraping(args.platform)
+    elif args.mode == 'report':
+        logger.info(f"Building {args.period} report from stored rollups...")
+        scheduler.data_processor.save_period_report(args.period)
     else:
         logger.info("Starting scheduled scraping...")
         scheduler.start_scheduled_scraping()
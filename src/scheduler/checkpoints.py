@@ -0,0 +1,112 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Iterator, List, Optional, Set
+from src.utils.config import resolve_path
+
+class RunCheckpoints:
+    """Durable record of the (platform, term) results of each run, so a crashed run can be resumed"""
+
+    def __init__(self, path: str, logger, retention_days: float = 14):
+        self.logger = logger
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, label TEXT, platforms TEXT, search_terms TEXT, "
+            "started_at REAL, finished_at REAL);"
+            "CREATE TABLE IF NOT EXISTS terms ("
+            "run_id TEXT, platform TEXT, term TEXT, jobs TEXT, completed_at REAL, "
+            "PRIMARY KEY (run_id, platform, term));"
+        )
+
+        if retention_days:
+            cutoff = time.time() - retention_days * 86400
+            self._db.execute("DELETE FROM terms WHERE run_id IN (SELECT run_id FROM runs WHERE started_at < ?)", (cutoff,))
+            self._db.execute("DELETE FROM runs WHERE started_at < ?", (cutoff,))
+        self._db.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], logger) -> Optional['RunCheckpoints']:
+        """Build the store from the checkpoints section, or return None when disabled"""
+        checkpoint_config = config.get('checkpoints', {}) or {}
+        if not checkpoint_config.get('enabled', False):
+            return None
+
+        return cls(
+            path=resolve_path(checkpoint_config.get('path', 'output/checkpoints/runs.sqlite')),
+            logger=logger,
+            retention_days=checkpoint_config.get('retention_days', 14)
+        )
+
+    def start_run(self, run_id: str, label: str, platforms: List[str], search_terms: List[str], started_at: float):
+        """Record a new run with everything needed to repeat it"""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, NULL)",
+                (run_id, label, json.dumps(platforms), json.dumps(search_terms), started_at)
+            )
+            self._db.commit()
+
+    def get_run(self, run_id: str = None) -> Optional[Dict[str, Any]]:
+        """A run by ID, or the most recent unfinished run when no ID is given"""
+        with self._lock:
+            if run_id:
+                row = self._db.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            else:
+                row = self._db.execute(
+                    "SELECT * FROM runs WHERE finished_at IS NULL ORDER BY started_at DESC LIMIT 1"
+                ).fetchone()
+
+        if row is None:
+            return None
+
+        run_id, label, platforms, search_terms, started_at, finished_at = row
+        return {
+            'run_id': run_id,
+            'label': label,
+            'platforms': json.loads(platforms),
+            'search_terms': json.loads(search_terms),
+            'started_at': started_at,
+            'finished_at': finished_at
+        }
+
+    def completed_terms(self, run_id: str, platform: str) -> Set[str]:
+        """Terms of a platform that already have a checkpoint in a run"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT term FROM terms WHERE run_id = ? AND platform = ?", (run_id, platform)
+            ).fetchall()
+        return {term for term, in rows}
+
+    def save_term(self, run_id: str, platform: str, term: str, jobs: List[Dict[str, Any]]):
+        """Checkpoint the jobs of one finished (platform, term) unit"""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO terms VALUES (?, ?, ?, ?, ?)",
+                (run_id, platform, term, json.dumps(jobs), time.time())
+            )
+            self._db.commit()
+
+    def iter_jobs(self, run_id: str, platform: str) -> Iterator[Dict[str, Any]]:
+        """Yield the checkpointed jobs of a platform in a run"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT jobs FROM terms WHERE run_id = ? AND platform = ? ORDER BY completed_at",
+                (run_id, platform)
+            ).fetchall()
+
+        for jobs, in rows:
+            yield from json.loads(jobs)
+
+    def finish_run(self, run_id: str):
+        """Mark a run finished and drop its checkpointed jobs, which are now in the outputs"""
+        with self._lock:
+            self._db.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), run_id))
+            self._db.execute("DELETE FROM terms WHERE run_id = ?", (run_id,))
+            self._db.commit()
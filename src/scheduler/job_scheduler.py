@@ -1,12 +1,15 @@
 import schedule
+import subprocess
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Any
-from src.scrapers.linkedin_scraper import LinkedInScraper
-from src.scrapers.monsters_scraper import MonsterScraper
-from src.scrapers.dice_scraper import DiceScraper
-from src.data.processor import DataProcessor
-from src.utils.config import get_role_mappings
+from src.scrapers.registry import create_scraper, enabled_platforms, load_scraper_class
+from src.scheduler.checkpoints import RunCheckpoints
+from src.scheduler.platform_executor import PlatformExecutor
+from src.utils.config import get_role_mappings, resolve_path
+from src.utils.metrics import get_metrics, report_path, start_metrics_server
+from src.utils.retry import ScrapeError
 
 class JobScheduler:
     """Handle scheduled job scraping"""
@@ -16,14 +19,29 @@ class JobScheduler:
         self.logger = logger
         self.role_mappings = get_role_mappings()
         
-        # Initialize scrapers
-        self.scrapers = {
-            'linkedin': LinkedInScraper(config, logger),
-            'monster': MonsterScraper(config, logger),
-            'dice': DiceScraper(config, logger)
-        }
-        
-        self.data_processor = DataProcessor(logger)
+        # Scrapers and the data processor are built on first use
+        self.scrapers = {}
+        self._data_processor = None
+        self.executor = PlatformExecutor(config, logger)
+        self.checkpoints = RunCheckpoints.from_config(config, logger)
+        self.metrics = get_metrics()
+        self.metrics_server = start_metrics_server(config, logger)
+        # Platform -> error for platforms the last run could not finish
+        self.failed_platforms = {}
+    
+    def get_scraper(self, platform: str):
+        """Return the scraper for a platform, importing and creating it if needed"""
+        if platform not in self.scrapers:
+            self.scrapers[platform] = create_scraper(platform, self.config, self.logger)
+        return self.scrapers[platform]
+    
+    @property
+    def data_processor(self):
+        """Data processor, imported only when jobs are processed or reported"""
+        if self._data_processor is None:
+            from src.data.processor import DataProcessor
+            self._data_processor = DataProcessor(self.logger, self.config)
+        return self._data_processor
     
     def start_scheduled_scraping(self):
         """Start the scheduled scraping process"""
@@ -55,33 +73,16 @@ class JobScheduler:
     def _run_scraping_job(self, job_type: str):
         """Execute the scraping job"""
         try:
-            all_jobs = []
-            
-            # Get search terms for all verticals
-            search_terms = self._get_search_terms()
+            # Generate filename with timestamp and job type
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            basename = f"job_scraping_{job_type}_{timestamp}"
             
-            # Scrape from all platforms
-            for platform_name, scraper in self.scrapers.items():
-                try:
-                    self.logger.info(f"Scraping {platform_name}...")
-                    jobs = scraper.scrape_jobs(search_terms)
-                    all_jobs.extend(jobs)
-                    self.logger.info(f"Found {len(jobs)} jobs from {platform_name}")
-                except Exception as e:
-                    self.logger.error(f"Error scraping {platform_name}: {e}")
+            # Scrape from all platforms, processing and saving data as it arrives
+            result = self._run_pipeline(enabled_platforms(self.config), basename, job_type)
             
-            # Process and save data
-            if all_jobs:
-                df = self.data_processor.process_jobs(all_jobs)
-                
-                # Generate filename with timestamp and job type
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"job_scraping_{job_type}_{timestamp}.xlsx"
-                
-                filepath = self.data_processor.save_to_excel(df, filename)
-                
-                self.logger.info(f"Scraping completed. Found {len(all_jobs)} total jobs.")
-                self.logger.info(f"Results saved to: {filepath}")
+            if result['jobs_saved']:
+                self.logger.info(f"Scraping completed. Found {result['jobs_scraped']} total jobs.")
+                self.logger.info(f"Results saved to: {', '.join(result['filepaths'])}")
             else:
                 self.logger.warning("No jobs found in this scraping session.")
                 
@@ -92,37 +93,190 @@ class JobScheduler:
         """Run manual scraping for testing"""
         self.logger.info(f"Starting manual scraping for platform: {platform}")
         
-        all_jobs = []
-        search_terms = self._get_search_terms()
+        platforms = enabled_platforms(self.config) if platform == 'all' else [platform]
         
-        if platform == 'all':
-            scrapers_to_run = self.scrapers.items()
-        else:
-            scrapers_to_run = [(platform, self.scrapers[platform])]
-        
-        for platform_name, scraper in scrapers_to_run:
-            try:
-                self.logger.info(f"Scraping {platform_name}...")
-                jobs = scraper.scrape_jobs(search_terms)
-                all_jobs.extend(jobs)
-                self.logger.info(f"Found {len(jobs)} jobs from {platform_name}")
-            except Exception as e:
-                self.logger.error(f"Error scraping {platform_name}: {e}")
-        
-        # Process and save data
-        if all_jobs:
-            df = self.data_processor.process_jobs(all_jobs)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"job_scraping_manual_{timestamp}.xlsx"
-            
-            filepath = self.data_processor.save_to_excel(df, filename)
-            
-            self.logger.info(f"Manual scraping completed. Found {len(all_jobs)} total jobs.")
-            self.logger.info(f"Results saved to: {filepath}")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        basename = f"job_scraping_manual_{timestamp}"
+        
+        result = self._run_pipeline(platforms, basename, 'manual')
+        
+        if result['jobs_saved']:
+            self.logger.info(f"Manual scraping completed. Found {result['jobs_scraped']} total jobs.")
+            self.logger.info(f"Results saved to: {', '.join(result['filepaths'])}")
         else:
             self.logger.warning("No jobs found in manual scraping.")
     
+    def resume_run(self, run_id: str = None) -> bool:
+        """Finish an interrupted run from its checkpoints; False when there is nothing to resume"""
+        if self.checkpoints is None:
+            self.logger.warning("Checkpoints are disabled, there is no run to resume")
+            return False
+        
+        run = self.checkpoints.get_run(run_id)
+        if run is None:
+            self.logger.warning(f"No unfinished run found to resume{f' with ID {run_id}' if run_id else ''}")
+            return False
+        if run['finished_at']:
+            self.logger.warning(f"Run {run['run_id']} already finished")
+            return False
+        
+        self.logger.info(f"Resuming {run['label']} run {run['run_id']}")
+        result = self._run_pipeline(run['platforms'], run['run_id'], run['label'], resumed_run=run)
+        
+        if result['jobs_saved']:
+            self.logger.info(f"Resumed run completed. Found {result['jobs_scraped']} total jobs.")
+            self.logger.info(f"Results saved to: {', '.join(result['filepaths'])}")
+        else:
+            self.logger.warning("No jobs found in the resumed run.")
+        return True
+    
+    def _run_pipeline(self, platforms: list, basename: str, label: str, resumed_run: dict = None) -> dict:
+        """Stream jobs from the given platforms into chunked processing and output
+        
+        A resumed run keeps its search terms, timestamp and output names, and
+        only scrapes the (platform, term) units that have no checkpoint yet.
+        """
+        if resumed_run:
+            search_terms = resumed_run['search_terms']
+            run_timestamp = datetime.fromtimestamp(resumed_run['started_at'])
+        else:
+            search_terms = self._get_search_terms()
+            run_timestamp = datetime.now()
+            if self.checkpoints is not None:
+                self.checkpoints.start_run(basename, label, platforms, search_terms, run_timestamp.timestamp())
+        
+        self.metrics.reset()
+        self.failed_platforms = {}
+        result = None
+        try:
+            if self.executor.mode == 'queue':
+                # The work queue keeps the finished units of a run, so it doubles as its checkpoint
+                jobs = self._stream_queued_jobs(platforms, search_terms, basename)
+            else:
+                scrapers_to_run = [(platform, self.get_scraper(platform)) for platform in platforms]
+                jobs = self._stream_platform_jobs(scrapers_to_run, search_terms, basename)
+            
+            result = self.data_processor.process_jobs_chunked(jobs, basename, self.config, label, run_timestamp,
+                                                              resumed=resumed_run is not None)
+        finally:
+            self._write_metrics_report(basename, label, platforms, result)
+        
+        if self.checkpoints is not None:
+            if self.failed_platforms:
+                # Keep the checkpoints so the failed terms can be scraped again
+                failures = '; '.join(f"{platform}: {error}" for platform, error in self.failed_platforms.items())
+                self.logger.warning(f"Run {basename} is incomplete ({failures}). "
+                                    f"Finish it with: python src/main.py --resume {basename}")
+            else:
+                self.checkpoints.finish_run(basename)
+        return result
+    
+    def _write_metrics_report(self, run_id: str, label: str, platforms: list, result: dict = None):
+        """Write the run's metrics report when metrics are enabled, also for runs that failed"""
+        path = report_path(self.config, run_id)
+        if path is None:
+            return
+        
+        try:
+            self.metrics.write_report(
+                path, run_id=run_id, label=label, platforms_requested=platforms,
+                completed=result is not None,
+                jobs_scraped=(result or {}).get('jobs_scraped'), jobs_saved=(result or {}).get('jobs_saved')
+            )
+            self.logger.info(f"Metrics report saved to: {path}")
+        except OSError as e:
+            self.logger.warning(f"Could not write the metrics report: {e}")
+    
+    def _stream_platform_jobs(self, scrapers_to_run, search_terms: list, run_id: str):
+        """Yield jobs from all platforms as the platform workers extract them"""
+        def make_task(platform, scraper):
+            def task():
+                try:
+                    yield from self._iter_checkpointed_jobs(platform, scraper, search_terms, run_id)
+                finally:
+                    scraper.close()
+            return task
+        
+        tasks = [(platform_name, make_task(platform_name, scraper)) for platform_name, scraper in scrapers_to_run]
+        
+        for platform_name, job in self.executor.stream(tasks):
+            yield job
+        self.failed_platforms.update(self.executor.failed)
+    
+    def _iter_checkpointed_jobs(self, platform: str, scraper, search_terms: list, run_id: str):
+        """Yield a platform's jobs, checkpointing each term and reloading terms finished before a restart
+        
+        Terms the scraper could not finish get no checkpoint; once the other
+        terms are through, ScrapeError reports them so the run stays resumable.
+        """
+        completed = set()
+        if self.checkpoints is not None:
+            completed = self.checkpoints.completed_terms(run_id, platform)
+            if completed:
+                self.logger.info(f"Reloading {len(completed)} checkpointed {platform} terms of run {run_id}")
+                yield from self.checkpoints.iter_jobs(run_id, platform)
+        
+        # Apply the platform's term limit first so a resume never picks up terms the run would have skipped
+        remaining = [term for term in search_terms[:scraper.max_terms] if term not in completed]
+        if not remaining:
+            return
+        
+        scraped = set()
+        for term, jobs in scraper.iter_term_jobs(remaining):
+            scraped.add(term)
+            if self.checkpoints is not None:
+                self.checkpoints.save_term(run_id, platform, term, jobs)
+            yield from jobs
+        
+        failed = [term for term in remaining if term not in scraped]
+        if failed:
+            reasons = ', '.join(f"{term} ({scraper.failed_terms.get(term, 'not reached')})" for term in failed[:5])
+            raise ScrapeError(f"{len(failed)} of {len(remaining)} terms not scraped: {reasons}"
+                              f"{', ...' if len(failed) > 5 else ''}")
+    
+    def _stream_queued_jobs(self, platforms: list, search_terms: list, run_id: str):
+        """Expand the run into work units, let worker processes scrape them and yield their jobs
+        
+        Completed units are picked up while the workers run, so processing
+        keeps pace with scraping as in the other execution modes.
+        """
+        from src.scheduler.work_queue import WorkUnit, create_work_queue
+        from src.scheduler.worker import QueueWorker
+        
+        work_queue = create_work_queue(self.config, self.logger)
+        units = []
+        for platform in platforms:
+            max_terms = load_scraper_class(platform, self.config).max_terms
+            units.extend(WorkUnit(platform, term) for term in search_terms[:max_terms])
+        
+        added = work_queue.enqueue(run_id, units)
+        self.logger.info(f"Queued {added} work units for run {run_id}")
+        # A resumed run tries the units that ran out of attempts last time again
+        retried = work_queue.retry_failed(run_id)
+        if retried:
+            self.logger.info(f"Retrying {retried} failed work units of run {run_id}")
+        
+        workers = self._start_queue_workers(run_id)
+        poll_interval = (self.config.get('work_queue', {}) or {}).get('poll_interval', 5)
+        yielded = set()
+        while any(process.poll() is None for process in workers):
+            yield from work_queue.iter_results(run_id, yielded)
+            time.sleep(poll_interval)
+        
+        # Finish whatever is left, including units of workers that died mid-lease
+        QueueWorker(self.config, self.logger, work_queue, worker_id=f"scheduler:{run_id}").run(run_id)
+        
+        yield from work_queue.iter_results(run_id, yielded)
+        self.failed_platforms.update(work_queue.failures(run_id))
+    
+    def _start_queue_workers(self, run_id: str) -> list:
+        """Start execution.queue_workers local worker processes for a run"""
+        count = int((self.config.get('execution', {}) or {}).get('queue_workers', 3))
+        command = [sys.executable, resolve_path('src/main.py'), '--mode', 'worker', '--run-id', run_id]
+        
+        self.logger.info(f"Starting {count} queue workers for run {run_id}")
+        return [subprocess.Popen(command) for _ in range(count)]
+    
     def _get_search_terms(self) -> list:
         """Get search terms from all verticals"""
         search_terms = []
@@ -130,4 +284,5 @@ class JobScheduler:
         for vertical, keywords in self.role_mappings['verticals'].items():
             search_terms.extend(keywords)
         
-        return list(set(search_terms))  # Remove duplicates
+        # Remove duplicates but keep the mapping's order, so runs and resumes see the same terms
+        return list(dict.fromkeys(search_terms))
@@ -0,0 +1,102 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Tuple
+
+# Marks the end of one platform's stream on the results queue
+_TASK_DONE = object()
+
+class PlatformExecutor:
+    """Run platform scraping tasks in isolated worker threads"""
+    
+    def __init__(self, config: Dict[str, Any], logger):
+        self.logger = logger
+        
+        execution = config.get('execution', {}) or {}
+        self.mode = execution.get('mode', 'concurrent')
+        self.max_workers = max(1, int(execution.get('max_workers', 3)))
+        self.queue_size = int(execution.get('queue_size', 1000))
+        # Platform -> error of the tasks that raised in the last stream
+        self.failed: Dict[str, str] = {}
+        
+        # Optional cap on how many tasks may hit the same platform at once
+        limits = execution.get('platform_concurrency', {}) or {}
+        self._platform_limits = {
+            platform: threading.BoundedSemaphore(int(limit))
+            for platform, limit in limits.items() if limit
+        }
+    
+    def stream(self, tasks: List[Tuple[str, Callable[[], Iterable[Any]]]]) -> Iterator[Tuple[str, Any]]:
+        """Run (platform, task) pairs and yield (platform, item) as workers produce items
+
+        Each task returns an iterable; items from all platforms are merged as
+        they arrive. A bounded queue makes workers wait when the consumer
+        falls behind, which keeps memory flat. Platforms whose task raised are
+        listed in failed once the stream is exhausted.
+        """
+        self.failed = {}
+        if self.mode == 'sequential' or len(tasks) <= 1:
+            for platform_name, task in tasks:
+                for item in self._iterate_task(platform_name, task):
+                    yield platform_name, item
+            return
+        
+        workers = min(self.max_workers, len(tasks))
+        self.logger.info(f"Running {len(tasks)} platform tasks with {workers} workers")
+        
+        results = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def worker(platform_name, task):
+            try:
+                for item in self._iterate_task(platform_name, task):
+                    if not put((platform_name, item)):
+                        return
+            finally:
+                put((platform_name, _TASK_DONE))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scraper') as executor:
+            for platform_name, task in tasks:
+                executor.submit(worker, platform_name, task)
+            
+            remaining = len(tasks)
+            try:
+                while remaining:
+                    platform_name, item = results.get()
+                    if item is _TASK_DONE:
+                        remaining -= 1
+                    else:
+                        yield platform_name, item
+            finally:
+                # Let workers exit if the consumer stopped early
+                stop.set()
+    
+    def _iterate_task(self, platform_name: str, task: Callable[[], Iterable[Any]]) -> Iterator[Any]:
+        """Iterate a single task, keeping failures local to its platform"""
+        semaphore = self._platform_limits.get(platform_name)
+        
+        if semaphore:
+            semaphore.acquire()
+        
+        count = 0
+        try:
+            self.logger.info(f"Scraping {platform_name}...")
+            for item in task():
+                count += 1
+                yield item
+            self.logger.info(f"Found {count} jobs from {platform_name}")
+        except Exception as e:
+            self.logger.error(f"Error scraping {platform_name} after {count} jobs: {e}")
+            self.failed[platform_name] = str(e)
+        finally:
+            if semaphore:
+                semaphore.release()
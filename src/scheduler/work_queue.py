@@ -0,0 +1,256 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Iterator, List, Optional, Set
+from src.utils.config import resolve_path
+
+class WorkUnit:
+    """One (platform, term, location, page) slice of a scraping run"""
+
+    def __init__(self, platform: str, term: str, location: str = None, page: int = 0,
+                 unit_id: int = None, run_id: str = None, attempts: int = 0):
+        self.platform = platform
+        self.term = term
+        self.location = location
+        self.page = page
+        self.unit_id = unit_id
+        self.run_id = run_id
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return f"WorkUnit({self.platform}, {self.term!r}, {self.location!r}, page={self.page})"
+
+
+class BaseWorkQueue(ABC):
+    """Durable queue of work units that several worker processes lease from"""
+
+    @abstractmethod
+    def enqueue(self, run_id: str, units: List[WorkUnit]) -> int:
+        """Add units to a run, ignoring ones already queued; returns how many were added"""
+        pass
+
+    @abstractmethod
+    def lease(self, run_id: str, worker_id: str) -> Optional[WorkUnit]:
+        """Take the next pending or expired unit of a run, or None when there is none right now"""
+        pass
+
+    @abstractmethod
+    def heartbeat(self, unit: WorkUnit, worker_id: str) -> bool:
+        """Extend a lease; False when the lease was lost to another worker"""
+        pass
+
+    @abstractmethod
+    def complete(self, unit: WorkUnit, worker_id: str, jobs: List[Dict[str, Any]]):
+        """Store a unit's jobs and mark it done"""
+        pass
+
+    @abstractmethod
+    def fail(self, unit: WorkUnit, worker_id: str, error: str):
+        """Release a unit for another attempt, or mark it failed when out of attempts"""
+        pass
+
+    @abstractmethod
+    def status(self, run_id: str) -> Dict[str, int]:
+        """Number of units of a run per status"""
+        pass
+
+    @abstractmethod
+    def failures(self, run_id: str) -> Dict[str, str]:
+        """Last error per platform of the units of a run that ran out of attempts"""
+        pass
+
+    @abstractmethod
+    def retry_failed(self, run_id: str) -> int:
+        """Give the failed units of a run fresh attempts, e.g. when it is resumed; returns how many"""
+        pass
+
+    @abstractmethod
+    def iter_results(self, run_id: str, seen: Set[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the jobs stored by the completed units of a run
+
+        Units whose IDs are in seen are skipped and the IDs of yielded units are
+        added to it, so calling again while workers run yields only new results.
+        """
+        pass
+
+    def is_finished(self, run_id: str) -> bool:
+        """True when no unit of the run is pending or leased"""
+        status = self.status(run_id)
+        return not status.get('pending') and not status.get('leased')
+
+
+class SqliteWorkQueue(BaseWorkQueue):
+    """Work queue in a SQLite file shared by the worker processes of one host or volume"""
+
+    def __init__(self, path: str, logger, lease_seconds: float = 300, max_attempts: int = 3):
+        self.path = path
+        self.logger = logger
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode; every write is its own short IMMEDIATE transaction
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS units ("
+            "id INTEGER PRIMARY KEY, run_id TEXT, platform TEXT, term TEXT, location TEXT, page INTEGER, "
+            "status TEXT DEFAULT 'pending', worker TEXT, lease_expires REAL, attempts INTEGER DEFAULT 0, "
+            "error TEXT, jobs TEXT, updated_at REAL, "
+            "UNIQUE (run_id, platform, term, location, page));"
+            "CREATE INDEX IF NOT EXISTS units_by_status ON units (run_id, status);"
+        )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], logger) -> 'SqliteWorkQueue':
+        queue_config = config.get('work_queue', {}) or {}
+        return cls(
+            path=resolve_path(queue_config.get('path', 'output/queue/work_queue.sqlite')),
+            logger=logger,
+            lease_seconds=queue_config.get('lease_seconds', 300),
+            max_attempts=queue_config.get('max_attempts', 3)
+        )
+
+    def _write(self, sql: str, params=()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._db.execute(sql, params)
+
+    def enqueue(self, run_id: str, units: List[WorkUnit]) -> int:
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                before = self._db.total_changes
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO units (run_id, platform, term, location, page, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(run_id, unit.platform, unit.term, unit.location or '', unit.page, now) for unit in units]
+                )
+                added = self._db.total_changes - before
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return added
+
+    def lease(self, run_id: str, worker_id: str) -> Optional[WorkUnit]:
+        now = time.time()
+        with self._lock:
+            while True:
+                # IMMEDIATE takes the write lock up front, so two processes never lease the same unit
+                self._db.execute("BEGIN IMMEDIATE")
+                try:
+                    row = self._db.execute(
+                        "SELECT id, platform, term, location, page, attempts FROM units "
+                        "WHERE run_id = ? AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?)) "
+                        "ORDER BY attempts, id LIMIT 1",
+                        (run_id, now)
+                    ).fetchone()
+
+                    if row is None:
+                        self._db.execute("COMMIT")
+                        return None
+
+                    unit_id, platform, term, location, page, attempts = row
+                    if attempts >= self.max_attempts:
+                        # A worker died holding this unit on its last attempt
+                        self._db.execute(
+                            "UPDATE units SET status = 'failed', error = 'lease expired', updated_at = ? WHERE id = ?",
+                            (now, unit_id)
+                        )
+                        self._db.execute("COMMIT")
+                        continue
+
+                    self._db.execute(
+                        "UPDATE units SET status = 'leased', worker = ?, lease_expires = ?, "
+                        "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                        (worker_id, now + self.lease_seconds, now, unit_id)
+                    )
+                    self._db.execute("COMMIT")
+                except Exception:
+                    self._db.execute("ROLLBACK")
+                    raise
+
+                return WorkUnit(platform, term, location or None, page, unit_id, run_id, attempts + 1)
+
+    def heartbeat(self, unit: WorkUnit, worker_id: str) -> bool:
+        cursor = self._write(
+            "UPDATE units SET lease_expires = ?, updated_at = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+            (time.time() + self.lease_seconds, time.time(), unit.unit_id, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, unit: WorkUnit, worker_id: str, jobs: List[Dict[str, Any]]):
+        cursor = self._write(
+            "UPDATE units SET status = 'done', jobs = ?, error = NULL, updated_at = ? "
+            "WHERE id = ? AND worker = ? AND status = 'leased'",
+            (json.dumps(jobs), time.time(), unit.unit_id, worker_id)
+        )
+        if cursor.rowcount != 1:
+            self.logger.warning(f"{unit} finished after its lease was taken over; result discarded")
+
+    def fail(self, unit: WorkUnit, worker_id: str, error: str):
+        status = 'failed' if unit.attempts >= self.max_attempts else 'pending'
+        self._write(
+            "UPDATE units SET status = ?, error = ?, worker = NULL, updated_at = ? "
+            "WHERE id = ? AND worker = ? AND status = 'leased'",
+            (status, error, time.time(), unit.unit_id, worker_id)
+        )
+
+    def status(self, run_id: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM units WHERE run_id = ? GROUP BY status", (run_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def failures(self, run_id: str) -> Dict[str, str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT platform, COUNT(*), MAX(error) FROM units WHERE run_id = ? AND status = 'failed' GROUP BY platform",
+                (run_id,)
+            ).fetchall()
+        return {platform: f"{count} work units failed, e.g. {error}" for platform, count, error in rows}
+
+    def retry_failed(self, run_id: str) -> int:
+        cursor = self._write(
+            "UPDATE units SET status = 'pending', attempts = 0, error = NULL, updated_at = ? "
+            "WHERE run_id = ? AND status = 'failed'",
+            (time.time(), run_id)
+        )
+        return cursor.rowcount
+
+    def iter_results(self, run_id: str, seen: Set[int] = None) -> Iterator[Dict[str, Any]]:
+        seen = set() if seen is None else seen
+        with self._lock:
+            done = self._db.execute(
+                "SELECT id FROM units WHERE run_id = ? AND status = 'done' ORDER BY id", (run_id,)
+            ).fetchall()
+        new_ids = [unit_id for unit_id, in done if unit_id not in seen]
+
+        # Load the results in pages so a large run is never held at once
+        for start in range(0, len(new_ids), 50):
+            page = new_ids[start:start + 50]
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT id, jobs FROM units WHERE id IN ({', '.join('?' * len(page))}) ORDER BY id", page
+                ).fetchall()
+            for unit_id, jobs in rows:
+                yield from json.loads(jobs or '[]')
+                seen.add(unit_id)
+
+
+# Backend name -> class; other backends (e.g. a network queue for several hosts)
+# only need to implement BaseWorkQueue and a from_config classmethod
+QUEUE_BACKENDS = {'sqlite': SqliteWorkQueue}
+
+def create_work_queue(config: Dict[str, Any], logger) -> BaseWorkQueue:
+    """Build the work queue backend selected by work_queue.backend"""
+    backend = (config.get('work_queue', {}) or {}).get('backend', 'sqlite')
+    if backend not in QUEUE_BACKENDS:
+        raise ValueError(f"Unknown work queue backend: {backend}")
+    return QUEUE_BACKENDS[backend].from_config(config, logger)
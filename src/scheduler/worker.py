@@ -0,0 +1,90 @@
+import os
+import socket
+import threading
+import time
+from typing import Dict, Any
+from src.scrapers.registry import create_scraper
+from src.scheduler.work_queue import BaseWorkQueue, WorkUnit
+from src.utils.retry import ScrapeError
+
+class QueueWorker:
+    """Lease work units from a queue and scrape them until the run has none left"""
+
+    def __init__(self, config: Dict[str, Any], logger, queue: BaseWorkQueue, worker_id: str = None):
+        self.config = config
+        self.logger = logger
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+        queue_config = config.get('work_queue', {}) or {}
+        self.poll_interval = queue_config.get('poll_interval', 5)
+        # Heartbeat often enough that a slow unit never loses its lease
+        self.heartbeat_interval = max(1.0, getattr(queue, 'lease_seconds', 300) / 3)
+        self.scrapers = {}
+
+    def get_scraper(self, platform: str):
+        """Return this worker's scraper for a platform, creating it on first use"""
+        if platform not in self.scrapers:
+            self.scrapers[platform] = create_scraper(platform, self.config, self.logger)
+        return self.scrapers[platform]
+
+    def run(self, run_id: str, wait_for_leases: bool = True) -> int:
+        """Work on a run until it is finished; returns the number of units completed
+
+        With wait_for_leases the worker keeps polling while other workers hold
+        leases, so it can pick up their units if they crash.
+        """
+        completed = 0
+        self.logger.info(f"Worker {self.worker_id} joining run {run_id}")
+
+        try:
+            while True:
+                unit = self.queue.lease(run_id, self.worker_id)
+                if unit is None:
+                    if not wait_for_leases or self.queue.is_finished(run_id):
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                if self._process(unit):
+                    completed += 1
+        finally:
+            for scraper in self.scrapers.values():
+                scraper.close()
+
+        self.logger.info(f"Worker {self.worker_id} completed {completed} units of run {run_id}")
+        return completed
+
+    def _process(self, unit: WorkUnit) -> bool:
+        """Scrape one unit while heartbeating its lease"""
+        stop = threading.Event()
+
+        def heartbeat():
+            while not stop.wait(self.heartbeat_interval):
+                if not self.queue.heartbeat(unit, self.worker_id):
+                    self.logger.warning(f"Lost the lease on {unit}")
+                    return
+
+        thread = threading.Thread(target=heartbeat, name=f"heartbeat-{unit.unit_id}", daemon=True)
+        thread.start()
+
+        try:
+            scraper = self.get_scraper(unit.platform)
+            jobs = []
+            scraped = False
+            for term, term_jobs in scraper.iter_term_jobs([unit.term], unit.location):
+                scraped = True
+                jobs.extend(term_jobs)
+            if not scraped:
+                # Scrapers leave failed terms out instead of yielding them empty
+                raise ScrapeError(scraper.failed_terms.pop(unit.term, "term was not scraped"))
+            self.queue.complete(unit, self.worker_id, jobs)
+            self.logger.info(f"Completed {unit} with {len(jobs)} jobs")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error processing {unit} (attempt {unit.attempts}): {e}")
+            self.queue.fail(unit, self.worker_id, str(e))
+            return False
+        finally:
+            stop.set()
+            thread.join()
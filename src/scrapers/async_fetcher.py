@@ -0,0 +1,91 @@
+import asyncio
+from typing import Dict, Any, List
+from urllib.parse import urlparse
+
+class FetchResult:
+    """Minimal response object shared by the sync and async fetch paths"""
+
+    def __init__(self, url: str, status_code: int = 0, content: bytes = b'',
+                 headers: Dict[str, str] = None, error: Exception = None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.error = error
+        # URL to cache the page under once the scraper accepts it; None when it came from the cache
+        self.cache_url = None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    @classmethod
+    def from_response(cls, response) -> 'FetchResult':
+        """Build a FetchResult from a requests.Response"""
+        return cls(response.url, response.status_code, response.content, dict(response.headers))
+
+
+class AsyncFetcher:
+    """Fetch many URLs concurrently with a per-host connection cap"""
+
+    def __init__(self, headers: Dict[str, str], cookies: Dict[str, str], logger,
+                 max_concurrency: int = 10, per_host_limit: int = 2, timeout: int = 30,
+                 rate_limiter=None):
+        self.headers = headers
+        self.cookies = cookies
+        self.logger = logger
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+
+    @classmethod
+    def from_session(cls, session, config: Dict[str, Any], logger, rate_limiter=None) -> 'AsyncFetcher':
+        """Create a fetcher that reuses the headers and cookies of a requests session"""
+        scraping = config.get('scraping', {}) or {}
+        async_config = scraping.get('async_http', {}) or {}
+
+        return cls(
+            headers=dict(session.headers),
+            cookies=session.cookies.get_dict(),
+            logger=logger,
+            max_concurrency=async_config.get('max_concurrency', 10),
+            per_host_limit=async_config.get('per_host_limit', 2),
+            timeout=scraping.get('timeout', 30),
+            rate_limiter=rate_limiter
+        )
+
+    def fetch_all(self, urls: List[str], extra_headers: List[Dict[str, str]] = None) -> List[FetchResult]:
+        """Fetch all URLs and return results in the same order"""
+        return asyncio.run(self.fetch_all_async(urls, extra_headers))
+
+    async def fetch_all_async(self, urls: List[str], extra_headers: List[Dict[str, str]] = None) -> List[FetchResult]:
+        """Coroutine version of fetch_all for callers already inside an event loop"""
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_limit)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(headers=self.headers, cookies=self.cookies,
+                                         connector=connector, timeout=timeout) as client:
+            extra_headers = extra_headers or [{} for _ in urls]
+            return await asyncio.gather(*(
+                self._fetch(client, url, headers) for url, headers in zip(urls, extra_headers)
+            ))
+
+    async def _fetch(self, client, url: str, headers: Dict[str, str] = None) -> FetchResult:
+        """Fetch a single URL, turning errors into an empty result"""
+        host = urlparse(url).netloc
+
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(host)
+            
+            async with client.get(url, headers=headers) as response:
+                content = await response.read()
+                if self.rate_limiter:
+                    self.rate_limiter.record_response(host, response.status, response.headers)
+                return FetchResult(str(response.url), response.status, content, dict(response.headers))
+        except Exception as e:
+            self.logger.warning(f"Request failed for {url}: {e}")
+            return FetchResult(url, error=e)
@@ -1,22 +1,138 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple, Optional
 import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from src.utils.helpers import random_delay, clean_text
+import threading
+import time
+from urllib.parse import urlparse
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.http_cache import get_http_cache
+from src.utils.metrics import get_metrics
+from src.utils.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, get_circuit_breaker
+from src.data.seen_index import SeenJobIndex, get_seen_index
+from src.data.keyword_matcher import KeywordMatcher
+from src.utils.config import get_role_mappings
+from .async_fetcher import AsyncFetcher, FetchResult
+from .driver_pool import DriverPool, get_driver_pool
+from .html_parsing import CardSelectors, make_soup, resolve_parser
+from .selector_ranker import get_selector_ranker
+
+# Returns the outerHTML of every card matched by the first selector that finds any,
+# so a whole result page is read with one WebDriver round trip
+SNAPSHOT_CARDS_SCRIPT = """
+for (const selector of arguments[0]) {
+    const cards = document.querySelectorAll(selector);
+    if (cards.length) {
+        return {selector: selector, cards: Array.from(cards, card => card.outerHTML)};
+    }
+}
+return {selector: null, cards: []};
+"""
+
+# Endings a contract keyword may carry: "contracts", "contracting", "freelancer", "consultants".
+# Matching is otherwise whole-word so "temp" does not match "template".
+CONTRACT_SUFFIXES = ['s', 'r', 'rs', 'or', 'ors', 'er', 'ers', 'ing', 'ed']
+
+_contract_matcher = None
+_contract_lock = threading.Lock()
+
+def get_contract_matcher() -> KeywordMatcher:
+    """Matcher for contract_keywords in roles_mapping.json, compiled once per process"""
+    global _contract_matcher
+    
+    with _contract_lock:
+        if _contract_matcher is None:
+            keywords = get_role_mappings().get('contract_keywords', [])
+            _contract_matcher = KeywordMatcher({'contract': keywords}, suffixes=CONTRACT_SUFFIXES)
+        return _contract_matcher
 
 class BaseScraper(ABC):
-    """Base class for all job scrapers"""
+    """Base class for all job scrapers
+    
+    Sessions, browsers, caches and indexes are created on first use, so a
+    scraper only pays for the subsystems its platform actually touches.
+    """
+    
+    # Most search terms a run covers on this platform; None for all
+    max_terms = None
+    
+    # Search page used when platforms.<name>.base_url is not configured
+    default_base_url = None
     
     def __init__(self, config: Dict[str, Any], logger):
         self.config = config
         self.logger = logger
-        self.session = requests.Session()
-        self.setup_session()
+        self.rate_limiter = get_rate_limiter(config)
+        self.retry_policy = RetryPolicy.from_config(config)
+        self.metrics = get_metrics()
+        self._session = None
+        self._driver_pool = None
+        self._readiness = None
+        self._html_parser = None
+        self._card_selectors = {}
+        # Terms that could not be scraped -> reason; iter_term_jobs leaves them out
+        self.failed_terms: Dict[str, str] = {}
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session with the platform's headers"""
+        if self._session is None:
+            self._session = requests.Session()
+            self.setup_session()
+        return self._session
+    
+    @property
+    def http_cache(self):
+        """Shared HTTP cache, or None when disabled"""
+        return get_http_cache(self.config, self.logger)
+    
+    @property
+    def seen_index(self):
+        """Shared seen-job index, or None when disabled"""
+        return get_seen_index(self.config, self.logger)
+    
+    @property
+    def circuit_breaker(self):
+        """This platform's circuit breaker, shared by all its scrapers in the process"""
+        return get_circuit_breaker(self.get_platform_name(), self.config, self.logger)
+    
+    @property
+    def selector_ranker(self):
+        """Shared selector ranking, or None when selector learning is disabled"""
+        return get_selector_ranker(self.config, self.logger)
+    
+    def card_selectors(self, selectors: Dict[str, List[str]]) -> CardSelectors:
+        """This platform's selector lists, tried in the order learned from earlier pages"""
+        key = id(selectors)
+        if key not in self._card_selectors:
+            self._card_selectors[key] = CardSelectors(self.get_platform_name(), selectors, self.selector_ranker)
+        return self._card_selectors[key]
+    
+    @property
+    def base_url(self) -> str:
+        """Search page from platforms.<name>.base_url, e.g. to point the scraper at a local mock board"""
+        platform_config = (self.config.get('platforms', {}) or {}).get(self.get_platform_name().lower(), {}) or {}
+        return (platform_config.get('base_url') or self.default_base_url or '').rstrip('/')
+    
+    def site_url(self, path: str) -> str:
+        """Absolute URL of a path on the same site as base_url"""
+        parsed = urlparse(self.base_url)
+        return f"{parsed.scheme}://{parsed.netloc}{path}"
+    
+    @property
+    def html_parser(self) -> str:
+        """BeautifulSoup backend selected by scraping.html_parser"""
+        if self._html_parser is None:
+            requested = (self.config.get('scraping', {}) or {}).get('html_parser')
+            self._html_parser = resolve_parser(requested, self.logger)
+        return self._html_parser
+    
+    @property
+    def readiness(self):
+        """Page readiness checks for Selenium-based scrapers"""
+        if self._readiness is None:
+            from .page_readiness import PageReadiness
+            self._readiness = PageReadiness(self.get_platform_name(), self.config, self.logger)
+        return self._readiness
     
     def setup_session(self):
         """Setup requests session with headers"""
@@ -27,6 +143,9 @@ class BaseScraper(ABC):
     
     def get_selenium_driver(self):
         """Setup and return Selenium WebDriver"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
@@ -37,28 +156,281 @@ class BaseScraper(ABC):
         driver = webdriver.Chrome(options=chrome_options)
         return driver
     
+    @property
+    def driver_pool(self) -> DriverPool:
+        """Process-wide pool of warm browsers"""
+        if self._driver_pool is None:
+            self._driver_pool = get_driver_pool(self.config, self.logger)
+        return self._driver_pool
+    
+    def lease_driver(self):
+        """Lease a warm browser started by get_selenium_driver for this platform, as a with-block"""
+        return self.driver_pool.lease(self.get_platform_name(), self.get_selenium_driver)
+    
+    def snapshot_cards(self, driver, selectors: List[str]) -> Tuple[Optional[str], List[str]]:
+        """Return (matched selector, outerHTML of each card) for the current page in one call"""
+        try:
+            snapshot = driver.execute_script(SNAPSHOT_CARDS_SCRIPT, selectors) or {}
+            return snapshot.get('selector'), snapshot.get('cards') or []
+        except Exception as e:
+            self.logger.warning(f"Card snapshot script failed, parsing page source instead: {e}")
+        
+        soup = make_soup(driver.page_source, self.html_parser)
+        for selector in selectors:
+            cards = soup.select(selector)
+            if cards:
+                return selector, [str(card) for card in cards]
+        return None, []
+    
+    def close(self):
+        """Release browsers and connections held by this scraper"""
+        if self._driver_pool is not None:
+            self._driver_pool.close(self.get_platform_name())
+            self._driver_pool = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self.selector_ranker is not None:
+            self.selector_ranker.log_stats(self.get_platform_name())
+            self.selector_ranker.save()
+    
+    def fetch_many(self, urls: List[str], terms: List[str] = None) -> List[FetchResult]:
+        """Fetch URLs through the HTTP cache, sending only stale or missing pages
+        
+        terms gives the search term each URL belongs to, for the metrics. New
+        pages are not cached until the scraper passes them to cache_response.
+        """
+        terms = terms or [None] * len(urls)
+        if self.http_cache is None:
+            return self._fetch_uncached(urls, [{} for _ in urls], terms)
+        
+        results = [None] * len(urls)
+        pending = []
+        
+        for index, url in enumerate(urls):
+            entry = self.http_cache.get(url)
+            if entry and self.http_cache.is_fresh(entry, self.get_platform_name()):
+                results[index] = FetchResult(url, entry['status'], entry['content'], entry['headers'])
+                self.http_cache.record_hit()
+                self.metrics.inc('cache_hits_total', platform=self.get_platform_name(), term=terms[index])
+            else:
+                pending.append((index, url, entry))
+        
+        fetched = self._fetch_uncached(
+            [url for _, url, _ in pending],
+            [self.http_cache.conditional_headers(entry) for _, _, entry in pending],
+            [terms[index] for index, _, _ in pending]
+        )
+        
+        for (index, url, entry), result in zip(pending, fetched):
+            self.http_cache.record_miss()
+            
+            if result.status_code == 304 and entry:
+                self.http_cache.refresh(url, result.headers)
+                result = FetchResult(url, entry['status'], entry['content'], entry['headers'])
+            elif result.status_code == 200:
+                result.cache_url = url
+            
+            results[index] = result
+        
+        return results
+    
+    def cache_response(self, result: FetchResult):
+        """Cache a fetched page once cards were parsed from it, so block or captcha pages served with 200 are never kept"""
+        if self.http_cache is not None and result.cache_url:
+            self.http_cache.store(result.cache_url, result.status_code, result.headers, result.content)
+            result.cache_url = None
+    
+    def _fetch_uncached(self, urls: List[str], extra_headers: List[Dict[str, str]],
+                        terms: List[str] = None) -> List[FetchResult]:
+        """Fetch URLs, retrying transient failures with backoff while the platform's circuit is closed"""
+        terms = terms or [None] * len(urls)
+        results = [None] * len(urls)
+        pending = list(range(len(urls)))
+        platform = self.get_platform_name()
+        
+        for attempt in range(self.retry_policy.attempts):
+            if attempt:
+                delay = self.retry_policy.delay(attempt)
+                self.logger.info(f"Retrying {len(pending)} {platform} requests in {delay:.1f}s")
+                time.sleep(delay)
+                self.metrics.observe('retry_wait_seconds', delay, platform=platform)
+            
+            if not self.circuit_breaker.allow():
+                error = CircuitOpenError(self.get_platform_name(), self.circuit_breaker.retry_in())
+                for index in pending:
+                    results[index] = FetchResult(urls[index], error=error)
+                break
+            
+            with self.metrics.timer('fetch_seconds', platform=platform):
+                fetched = self._send([urls[index] for index in pending], [extra_headers[index] for index in pending])
+            
+            retry = []
+            for index, result in zip(pending, fetched):
+                self._record_response(result, terms[index])
+                results[index] = result
+                if self.retry_policy.should_retry(result):
+                    retry.append(index)
+            
+            pending = retry
+            if not pending:
+                break
+        
+        return results
+    
+    def _record_response(self, result: FetchResult, term: str = None):
+        """Count a response by status and its bytes for the metrics"""
+        if isinstance(result.error, CircuitOpenError):
+            status = 'circuit_open'
+        elif result.error is not None:
+            status = 'error'
+        else:
+            status = str(result.status_code)
+        
+        self.metrics.inc('requests_total', platform=self.get_platform_name(), term=term, status=status)
+        self.metrics.inc('response_bytes_total', len(result.content), platform=self.get_platform_name(), term=term)
+    
+    def record_cards(self, term: str, found: int, extracted: int):
+        """Count the job cards found on a results page and the jobs extracted from them"""
+        self.metrics.inc('cards_found_total', found, platform=self.get_platform_name(), term=term)
+        self.metrics.inc('cards_extracted_total', extracted, platform=self.get_platform_name(), term=term)
+    
+    def _send(self, urls: List[str], extra_headers: List[Dict[str, str]]) -> List[FetchResult]:
+        """Fetch URLs concurrently when async HTTP is enabled, otherwise one by one"""
+        async_config = self.config.get('scraping', {}).get('async_http', {}) or {}
+        
+        if async_config.get('enabled', False):
+            try:
+                fetcher = AsyncFetcher.from_session(self.session, self.config, self.logger, self.rate_limiter)
+                return self._send_async(fetcher, urls, extra_headers)
+            except ImportError:
+                self.logger.warning("aiohttp is not installed, falling back to sequential requests")
+        
+        results = []
+        timeout = self.config.get('scraping', {}).get('timeout', 30)
+        for url, headers in zip(urls, extra_headers):
+            # Stop mid-batch once the circuit opens; a half-open circuit only gets the first request as its probe
+            if results and self.circuit_breaker.is_open:
+                results.append(FetchResult(url, error=CircuitOpenError(self.get_platform_name(),
+                                                                       self.circuit_breaker.retry_in())))
+                continue
+            
+            self.wait_for_slot(url)
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout)
+                self.rate_limiter.record_response(url, response.status_code, response.headers)
+                result = FetchResult.from_response(response)
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(f"Request failed for {url}: {e}")
+                result = FetchResult(url, error=e)
+            
+            self.circuit_breaker.record_result(result)
+            results.append(result)
+        
+        return results
+    
+    def _send_async(self, fetcher: AsyncFetcher, urls: List[str], extra_headers: List[Dict[str, str]]) -> List[FetchResult]:
+        """Fetch a batch concurrently; a half-open circuit gets only the first URL as its probe"""
+        results = []
+        if urls and self.circuit_breaker.state != CircuitBreaker.CLOSED:
+            probe = fetcher.fetch_all(urls[:1], extra_headers[:1])[0]
+            self.circuit_breaker.record_result(probe)
+            results.append(probe)
+            urls, extra_headers = urls[1:], extra_headers[1:]
+            
+            if self.circuit_breaker.state != CircuitBreaker.CLOSED:
+                # The probe failed and reopened the circuit; the rest of the batch is not sent
+                error = CircuitOpenError(self.get_platform_name(), self.circuit_breaker.retry_in())
+                return results + [FetchResult(url, error=error) for url in urls]
+        
+        if urls:
+            fetched = fetcher.fetch_all(urls, extra_headers)
+            for result in fetched:
+                self.circuit_breaker.record_result(result)
+            results.extend(fetched)
+        return results
+    
+    def wait_for_slot(self, url: str) -> float:
+        """Wait until the shared rate limiter allows another request to the URL's host"""
+        return self.rate_limiter.acquire(urlparse(url).netloc)
+    
+    def load_page(self, driver, url: str, term: str = None):
+        """Open a URL in the browser, retrying failed loads with backoff while the circuit allows it"""
+        platform = self.get_platform_name()
+        for attempt in range(self.retry_policy.attempts):
+            self.circuit_breaker.check()
+            self.wait_for_slot(url)
+            try:
+                with self.metrics.timer('page_load_seconds', platform=platform, term=term):
+                    driver.get(url)
+                self.circuit_breaker.record_success()
+                self.metrics.inc('page_loads_total', platform=platform, term=term, status='ok')
+                return
+            except Exception as e:
+                self.circuit_breaker.record_failure()
+                self.metrics.inc('page_loads_total', platform=platform, term=term, status='error')
+                if attempt + 1 == self.retry_policy.attempts:
+                    raise
+                delay = self.retry_policy.delay(attempt + 1)
+                self.logger.warning(f"Loading {url} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                self.metrics.observe('retry_wait_seconds', delay, platform=platform)
+    
+    def circuit_is_open(self) -> bool:
+        """True, with a warning, when the platform's circuit refuses requests for now"""
+        if not self.circuit_breaker.is_open:
+            return False
+        self.logger.warning(f"{self.get_platform_name()} circuit is open, skipping its remaining terms "
+                            f"(next probe in {self.circuit_breaker.retry_in():.0f}s)")
+        return True
+    
+    def get_seen_job(self, job_id: str = None, url: str = None):
+        """Return (key, stored job) for a posting extracted in an earlier run"""
+        if self.seen_index is None:
+            return None, None
+        
+        key = SeenJobIndex.make_key(self.get_platform_name(), job_id, url)
+        return key, self.seen_index.get(key)
+    
+    def remember_job(self, key: str, job: Dict[str, Any]):
+        """Store an extracted job so later runs can skip it"""
+        if self.seen_index is not None and job:
+            self.seen_index.add(key, self.get_platform_name(), job)
+    
+    def fail_term(self, term: str, error):
+        """Record a term that could not be scraped; it is not yielded, so it is never checkpointed as empty"""
+        self.failed_terms[term] = str(error)
+        self.metrics.inc('terms_failed_total', platform=self.get_platform_name(), term=term)
+    
     @abstractmethod
-    def scrape_jobs(self, search_terms: List[str], location: str = None) -> List[Dict[str, Any]]:
-        """Abstract method to scrape jobs from platform"""
+    def iter_term_jobs(self, search_terms: List[str], location: str = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Abstract method yielding (term, contract jobs) as each search term finishes; failed terms are skipped"""
         pass
     
+    def iter_jobs(self, search_terms: List[str], location: str = None) -> Iterator[Dict[str, Any]]:
+        """Yield contract jobs as they are extracted"""
+        for term, jobs in self.iter_term_jobs(search_terms, location):
+            yield from jobs
+    
+    def scrape_jobs(self, search_terms: List[str], location: str = None) -> List[Dict[str, Any]]:
+        """Scrape all contract jobs from platform into a list"""
+        return list(self.iter_jobs(search_terms, location))
+    
     @abstractmethod
     def get_platform_name(self) -> str:
         """Return platform name"""
         pass
     
-    def filter_contract_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def filter_contract_jobs(self, jobs: List[Dict[str, Any]], term: str = None) -> List[Dict[str, Any]]:
         """Filter jobs to only include contract positions"""
-        contract_keywords = ['contract', 'contractor', 'freelance', 'temporary', 'temp', 'consulting']
-        
+        matcher = get_contract_matcher()
         filtered_jobs = []
         for job in jobs:
-            job_title = job.get('title', '').lower()
-            job_description = job.get('description', '').lower()
-            job_type = job.get('job_type', '').lower()
+            text_to_check = f"{job.get('title', '')} {job.get('description', '')} {job.get('job_type', '')}"
             
-            if any(keyword in job_title or keyword in job_description or keyword in job_type 
-                   for keyword in contract_keywords):
+            if matcher.contains_any(text_to_check):
                 filtered_jobs.append(job)
         
+        self.metrics.inc('jobs_scraped_total', len(jobs), platform=self.get_platform_name(), term=term)
+        self.metrics.inc('jobs_kept_total', len(filtered_jobs), platform=self.get_platform_name(), term=term)
         return filtered_jobs
@@ -1,16 +1,17 @@
-from typing import List, Dict, Any
-import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from typing import List, Dict, Any, Iterator, Tuple, Optional
 from selenium.webdriver.chrome.options import Options
 from selenium import webdriver
 from .base_scraper import BaseScraper
-from src.utils.helpers import random_delay, clean_text, extract_date_from_text
+from .html_parsing import parse_card_fragments, parse_dice_card
+from .selectors import DICE_SELECTORS
 
 class DiceScraper(BaseScraper):
     """Dice.com job scraper with stable Chrome configuration"""
     
+    # Limit search terms to prevent crashes
+    max_terms = 5
+    default_base_url = "https://www.dice.com/jobs"
+    
     def get_platform_name(self) -> str:
         return "Dice"
     
@@ -51,127 +52,87 @@ class DiceScraper(BaseScraper):
             self.logger.error(f"Failed to create Chrome driver: {e}")
             raise
     
-    def scrape_jobs(self, search_terms: List[str], location: str = None) -> List[Dict[str, Any]]:
-        """Scrape jobs with better error handling"""
-        all_jobs = []
-        
-        # Limit search terms to prevent crashes
-        limited_terms = search_terms[:5]  # Only first 5 terms
+    def iter_term_jobs(self, search_terms: List[str], location: str = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Scrape jobs with better error handling, yielding each term's contract jobs"""
+        limited_terms = search_terms[:self.max_terms]
         
         for term in limited_terms:
+            if self.circuit_is_open():
+                break
             self.logger.info(f"Scraping Dice for: {term}")
             
-            driver = None
             try:
-                driver = self.get_selenium_driver()
-                jobs = self._scrape_term_safe(driver, term, location)
-                all_jobs.extend(jobs)
+                with self.lease_driver() as driver:
+                    jobs = self._scrape_term_safe(driver, term, location)
                 self.logger.info(f"Successfully scraped {len(jobs)} jobs for {term}")
                 
             except Exception as e:
+                # E.g. a browser crash; the term is left out so a resume or retry scrapes it again
                 self.logger.error(f"Error scraping Dice for {term}: {e}")
-                
-            finally:
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
+                self.fail_term(term, e)
+                continue
             
-            random_delay(3, 5)
+            yield term, self.filter_contract_jobs(jobs, term)
         
-        return self.filter_contract_jobs(all_jobs)
+        self.readiness.log_summary()
+        if self.seen_index is not None:
+            self.seen_index.log_stats(self.get_platform_name())
     
     def _scrape_term_safe(self, driver, search_term: str, location: str) -> List[Dict[str, Any]]:
-        """Safe scraping method"""
+        """Scrape one term; page-level failures such as a crashed browser propagate to the caller"""
         jobs = []
         
-        try:
-            # Simple Dice URL
-            url = f"https://www.dice.com/jobs?q={search_term}&location={location or 'United States'}&employmentType=CONTRACT"
-            
-            self.logger.info(f"Loading URL: {url}")
-            driver.get(url)
-            
-            # Wait for page load
-            time.sleep(5)
-            
-            # Try to find job elements with multiple selectors
-            job_selectors = [
-                '[data-testid="job-card"]',
-                '.card',
-                '.job-tile',
-                '.search-result-item'
-            ]
-            
-            job_cards = []
-            for selector in job_selectors:
-                try:
-                    job_cards = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if job_cards:
-                        self.logger.info(f"Found {len(job_cards)} job cards with selector: {selector}")
-                        break
-                except:
-                    continue
-            
-            if not job_cards:
-                self.logger.warning(f"No job cards found for {search_term}")
-                return jobs
-            
-            # Extract job data
-            for i, card in enumerate(job_cards[:5]):  # Limit to 5 jobs per term
-                try:
-                    job_data = self._extract_job_data_safe(card, driver.current_url)
-                    if job_data:
-                        jobs.append(job_data)
-                        self.logger.info(f"Extracted job {i+1}: {job_data['title']}")
-                except Exception as e:
-                    self.logger.warning(f"Error extracting job {i+1}: {e}")
-                    continue
-            
-        except Exception as e:
-            self.logger.error(f"Error in _scrape_term_safe: {e}")
+        # Simple Dice URL
+        url = f"{self.base_url}?q={search_term}&location={location or 'United States'}&employmentType=CONTRACT"
+        
+        self.logger.info(f"Loading URL: {url}")
+        self.load_page(driver, url, search_term)
+        
+        # Wait until any job card selector matches
+        self.readiness.wait_for_elements(driver, DICE_SELECTORS['card'])
         
+        # Read every card in one round trip and parse it in-process
+        selector, fragments = self.snapshot_cards(driver, DICE_SELECTORS['card'])
+        if not fragments:
+            self.logger.warning(f"No job cards found for {search_term}")
+            self.record_cards(search_term, 0, 0)
+            return jobs
+        
+        self.logger.info(f"Found {len(fragments)} job cards with selector: {selector}")
+        current_url = driver.current_url
+        
+        # Extract job data
+        with self.metrics.timer('parse_seconds', platform=self.get_platform_name(), term=search_term):
+            cards = parse_card_fragments(fragments[:5], parse_dice_card, self.html_parser,
+                                         self.card_selectors(DICE_SELECTORS))  # Limit to 5 jobs per term
+        for i, card in enumerate(cards):
+            job_data = self._build_job(card, current_url)
+            if job_data:
+                jobs.append(job_data)
+                self.logger.info(f"Extracted job {i+1}: {job_data['title']}")
+        
+        self.record_cards(search_term, len(fragments), len(jobs))
         return jobs
     
-    def _extract_job_data_safe(self, card, current_url) -> Dict[str, Any]:
-        """Safe job data extraction"""
-        try:
-            # Try multiple selectors for each field
-            title_selectors = ['[data-testid="job-title"]', '.job-title', 'h2', 'h3', '.title']
-            company_selectors = ['[data-testid="job-company"]', '.company', '.company-name']
-            location_selectors = ['[data-testid="job-location"]', '.location', '.job-location']
-            
-            title = self._get_text_by_selectors(card, title_selectors)
-            company = self._get_text_by_selectors(card, company_selectors)
-            location = self._get_text_by_selectors(card, location_selectors)
-            
-            if not title:
-                return None
-            
-            return {
-                'title': clean_text(title),
-                'company': clean_text(company) or "Unknown Company",
-                'location': clean_text(location) or "Unknown Location",
-                'description': f"Contract position for {clean_text(title)}",
-                'posting_date': extract_date_from_text(""),
-                'platform': self.get_platform_name(),
-                'url': current_url,
-                'job_type': 'Contract'
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Error in _extract_job_data_safe: {e}")
+    def _build_job(self, card: Optional[Dict[str, Any]], current_url: str) -> Optional[Dict[str, Any]]:
+        """Turn a parsed card into a job, reusing postings seen in earlier runs"""
+        if not card:
             return None
-    
-    def _get_text_by_selectors(self, element, selectors):
-        """Try multiple selectors to get text"""
-        for selector in selectors:
-            try:
-                sub_element = element.find_element(By.CSS_SELECTOR, selector)
-                text = sub_element.text.strip()
-                if text:
-                    return text
-            except:
-                continue
-        return ""
+        
+        job_key, seen_job = self.get_seen_job(card['job_id'], card['url'])
+        if seen_job:
+            return seen_job
+        
+        job_data = {
+            'title': card['title'],
+            'company': card['company'] or "Unknown Company",
+            'location': card['location'] or "Unknown Location",
+            'description': f"Contract position for {card['title']}",
+            'posting_date': "",
+            'platform': self.get_platform_name(),
+            'url': current_url,
+            'job_type': 'Contract'
+        }
+        
+        self.remember_job(job_key, job_data)
+        return job_data
@@ -0,0 +1,181 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, List, Optional
+
+class _PooledDriver:
+    """A browser owned by the pool plus its usage counters"""
+
+    def __init__(self, key: str, driver):
+        self.key = key
+        self.driver = driver
+        self.base_handle = driver.current_window_handle
+        self.pages = 0
+
+
+class DriverPool:
+    """Keep warm Chrome browsers for every scraper of the process and lease them (or fresh tabs)
+
+    max_browsers caps all browsers together. An idle browser is only reused by
+    leases with the key it was started for, since platforms launch Chrome with
+    different options (Dice disables JavaScript, which LinkedIn needs); when the
+    pool is full, an idle browser of another key is quit to make room.
+    """
+
+    def __init__(self, config: Dict[str, Any], logger):
+        self.logger = logger
+
+        pool_config = (config.get('selenium', {}) or {}).get('pool', {}) or {}
+        self.max_browsers = max(1, int(pool_config.get('max_browsers', 1)))
+        self.max_pages = int(pool_config.get('max_pages_per_browser', 50))
+        self.max_rss_mb = pool_config.get('max_rss_mb', 1024)
+        self.use_tabs = pool_config.get('use_tabs', True)
+
+        self._idle: Dict[str, List[_PooledDriver]] = {}
+        self._created = 0
+        self._available = threading.Condition()
+
+    @contextmanager
+    def lease(self, key: str, driver_factory: Callable):
+        """Lease a driver started by driver_factory for key for the duration of a with-block"""
+        pooled = self._acquire(key, driver_factory)
+        healthy = False
+
+        try:
+            if self.use_tabs:
+                pooled.driver.switch_to.new_window('tab')
+            yield pooled.driver
+            healthy = True
+        finally:
+            pooled.pages += 1
+            self._release(pooled, healthy)
+
+    def close(self, key: str = None):
+        """Quit the idle browsers of one key, or of all keys"""
+        with self._available:
+            keys = [key] if key is not None else list(self._idle)
+            idle = [pooled for name in keys for pooled in self._idle.pop(name, [])]
+        for pooled in idle:
+            self._discard(pooled)
+
+    def _acquire(self, key: str, driver_factory: Callable) -> _PooledDriver:
+        """Return a healthy idle browser for key, starting one if the pool has room"""
+        while True:
+            pooled, evicted = self._take(key)
+            if evicted is not None:
+                self._discard(evicted)
+            if pooled is None:
+                break
+            # Checked outside the lock so a hung browser does not block other leases
+            if self._is_healthy(pooled):
+                return pooled
+            self._discard(pooled)
+
+        try:
+            self.logger.info(f"Starting pooled Chrome browser for {key}")
+            return _PooledDriver(key, driver_factory())
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+    def _take(self, key: str):
+        """Under the lock, pop an idle browser for key or reserve a slot for a new one (pooled None)
+
+        Also returns a browser of another key that was evicted to make room, for the caller to quit.
+        """
+        with self._available:
+            while True:
+                if self._idle.get(key):
+                    return self._idle[key].pop(), None
+
+                if self._created < self.max_browsers:
+                    self._created += 1
+                    return None, None
+
+                other = next((name for name, idle in self._idle.items() if idle), None)
+                if other is not None:
+                    # Reserve a slot for this lease; the caller's _discard frees the evicted browser's
+                    self._created += 1
+                    return None, self._idle[other].pop()
+
+                self._available.wait()
+
+    def _release(self, pooled: _PooledDriver, healthy: bool):
+        """Return a browser to the pool, or recycle it when it is worn out"""
+        if healthy and self.use_tabs:
+            healthy = self._close_tab(pooled)
+
+        recycle = not healthy or pooled.pages >= self.max_pages or self._over_memory_limit(pooled)
+
+        if recycle:
+            self.logger.info(f"Recycling {pooled.key} Chrome browser after {pooled.pages} pages")
+            self._discard(pooled)
+            return
+
+        with self._available:
+            self._idle.setdefault(pooled.key, []).append(pooled)
+            self._available.notify()
+
+    def _close_tab(self, pooled: _PooledDriver) -> bool:
+        """Close every tab except the browser's original window"""
+        try:
+            for handle in pooled.driver.window_handles:
+                if handle != pooled.base_handle:
+                    pooled.driver.switch_to.window(handle)
+                    pooled.driver.close()
+            pooled.driver.switch_to.window(pooled.base_handle)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to close leased tab: {e}")
+            return False
+
+    def _is_healthy(self, pooled: _PooledDriver) -> bool:
+        """Check that the browser still answers commands"""
+        try:
+            pooled.driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    def _over_memory_limit(self, pooled: _PooledDriver) -> bool:
+        """Check the resident memory of chromedriver and its browser processes"""
+        if not self.max_rss_mb:
+            return False
+
+        try:
+            import psutil
+        except ImportError:
+            return False
+
+        try:
+            process = psutil.Process(pooled.driver.service.process.pid)
+            rss = process.memory_info().rss
+            rss += sum(child.memory_info().rss for child in process.children(recursive=True))
+        except Exception:
+            return False
+
+        return rss / (1024 * 1024) > self.max_rss_mb
+
+    def _discard(self, pooled: _PooledDriver):
+        """Free a browser's slot and quit it; the quit runs outside the pool lock"""
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+
+_shared_pool: Optional[DriverPool] = None
+_shared_lock = threading.Lock()
+
+def get_driver_pool(config: Dict[str, Any], logger) -> DriverPool:
+    """Return the process-wide browser pool shared by all scrapers"""
+    global _shared_pool
+
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = DriverPool(config, logger)
+        return _shared_pool
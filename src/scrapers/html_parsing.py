@@ -0,0 +1,208 @@
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import soupsieve
+import re
+from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+from .selectors import LINKEDIN_SELECTORS, DICE_SELECTORS
+
+DEFAULT_PARSER = 'html.parser'
+
+def resolve_parser(name: str = None, logger=None) -> str:
+    """Return the requested BeautifulSoup backend, or html.parser when it is not installed"""
+    name = name or DEFAULT_PARSER
+    if name == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            if logger:
+                logger.warning("lxml is not installed, falling back to html.parser")
+            return DEFAULT_PARSER
+    return name
+
+def make_soup(markup, parser: str = None) -> BeautifulSoup:
+    """Parse markup with the given BeautifulSoup backend"""
+    return BeautifulSoup(markup, parser or DEFAULT_PARSER)
+
+def make_scoped_soup(markup, region_start: 're.Pattern', parser: str = None) -> BeautifulSoup:
+    """Build a tree from the start of the results region on, or of the whole page when it is missing"""
+    if isinstance(markup, str):
+        markup = markup.encode('utf-8')
+
+    match = region_start.search(markup)
+    if match is None:
+        return make_soup(markup, parser)
+
+    # The charset declaration lives in the skipped head, so pass it on explicitly
+    encoding = EncodingDetector.find_declared_encoding(markup, is_html=True) or 'utf-8'
+    return BeautifulSoup(markup[match.start():], parser or DEFAULT_PARSER, from_encoding=encoding)
+
+
+class SelectorList:
+    """Selectors in order of preference, compiled once and matched in a single pass"""
+
+    def __init__(self, selectors: List[str]):
+        self.selectors = list(selectors)
+        self._combined = soupsieve.compile(', '.join(self.selectors))
+        self._compiled = {selector: soupsieve.compile(selector) for selector in self.selectors}
+        self._each = list(self._compiled.values())
+
+    def _rank(self, element, limit: int = None) -> Optional[int]:
+        """Position of the most preferred selector matching element, if it is below limit"""
+        for rank, pattern in enumerate(self._each[:limit]):
+            if pattern.match(element):
+                return rank
+        return None
+
+    def select_best(self, root, preferred: str = None) -> Tuple[Optional[str], List[Any]]:
+        """Return (selector, elements) for the most preferred selector that matches anything
+
+        A preferred selector, e.g. one learned from earlier pages, is tried on
+        its own first; the full pass only runs when it finds nothing.
+        """
+        if preferred in self._compiled:
+            elements = self._compiled[preferred].select(root)
+            if elements:
+                return preferred, elements
+
+        best_rank, best = len(self._each), []
+        for element in self._combined.select(root):
+            # Only selectors at least as preferred as the current best are worth checking
+            rank = self._rank(element, best_rank + 1)
+            if rank is None:
+                continue
+            if rank < best_rank:
+                best_rank, best = rank, [element]
+            elif rank == best_rank:
+                best.append(element)
+
+        return (self.selectors[best_rank] if best else None), best
+
+    def select_text(self, root, preferred: str = None) -> Tuple[Optional[str], str]:
+        """Return (selector, text) for the most preferred match that has text"""
+        if preferred in self._compiled:
+            for element in self._compiled[preferred].select(root):
+                text = element.get_text(' ', strip=True)
+                if text:
+                    return preferred, text
+
+        best = None
+        for element in self._combined.select(root):
+            text = element.get_text(' ', strip=True)
+            if text:
+                rank = self._rank(element)
+                if best is None or rank < best[0]:
+                    best = (rank, text)
+
+        return (self.selectors[best[0]], best[1]) if best else (None, "")
+
+
+class CardSelectors:
+    """A platform's selector lists by field, tried in learned order when a ranker is given"""
+
+    def __init__(self, platform: str, selectors: Dict[str, List[str]], ranker=None):
+        self.platform = platform
+        self.ranker = ranker
+        self._lists = {field: SelectorList(field_selectors) for field, field_selectors in selectors.items()}
+
+    def _preferred(self, field: str) -> Optional[str]:
+        return self.ranker.preferred(self.platform, field) if self.ranker else None
+
+    def _record(self, field: str, winner: Optional[str]):
+        if self.ranker:
+            self.ranker.record(self.platform, field, self._lists[field].selectors, winner)
+
+    def select(self, root, field: str) -> Tuple[Optional[str], List[Any]]:
+        """Return (selector, elements) for a field"""
+        selector, elements = self._lists[field].select_best(root, self._preferred(field))
+        self._record(field, selector)
+        return selector, elements
+
+    def first(self, root, field: str):
+        """First element of a field, or None"""
+        return next(iter(self.select(root, field)[1]), None)
+
+    def text(self, root, field: str) -> str:
+        """Stripped text of a field, or an empty string"""
+        selector, text = self._lists[field].select_text(root, self._preferred(field))
+        self._record(field, selector)
+        return text
+
+
+# Defaults used when a scraper does not pass its own (learning) selectors
+LINKEDIN_CARD = CardSelectors('LinkedIn', LINKEDIN_SELECTORS)
+DICE_CARD = CardSelectors('Dice', DICE_SELECTORS)
+
+def parse_card_fragments(fragments: List[str], card_parser: Callable, parser: str = None,
+                         selectors: CardSelectors = None) -> List[Optional[Dict[str, Any]]]:
+    """Parse outerHTML snapshots of single cards, keeping their positions (None for unusable cards)"""
+    return [card_parser(fragment_root(fragment, parser), selectors) for fragment in fragments]
+
+def fragment_root(fragment: str, parser: str = None):
+    """Top element of an HTML fragment; lxml wraps fragments in html and body, html.parser does not"""
+    soup = make_soup(fragment, parser)
+    return (soup.body or soup).find()
+
+def linkedin_job_id(urn: Optional[str]) -> Optional[str]:
+    """Numeric job ID from a data-entity-urn such as urn:li:jobPosting:123"""
+    return urn.rsplit(':', 1)[-1] if urn else None
+
+def parse_linkedin_card(card, selectors: CardSelectors = None) -> Optional[Dict[str, Any]]:
+    """Fields of one LinkedIn job card, with its job_id when available"""
+    if card is None:
+        return None
+    selectors = selectors or LINKEDIN_CARD
+
+    title = selectors.text(card, 'title')
+    if not title:
+        return None
+
+    link = selectors.first(card, 'link')
+    date = selectors.first(card, 'posting_date')
+
+    return {
+        'job_id': linkedin_job_id(card.get('data-entity-urn')),
+        'title': title,
+        'company': selectors.text(card, 'company'),
+        'location': selectors.text(card, 'location'),
+        'posting_date': (date.get('datetime') or date.get_text(strip=True)) if date is not None else "",
+        'url': link.get('href', '').split('?')[0] if link is not None else ""
+    }
+
+def parse_linkedin_cards(markup, parser: str = None, selectors: CardSelectors = None) -> List[Dict[str, Any]]:
+    """Parse the job cards of a LinkedIn search page or guest listing fragment
+
+    Descriptions are not part of the cards and are loaded separately.
+    """
+    selectors = selectors or LINKEDIN_CARD
+    cards = selectors.select(make_soup(markup, parser), 'card')[1]
+    return [job for job in (parse_linkedin_card(card, selectors) for card in cards) if job]
+
+def parse_linkedin_description(markup, parser: str = None, selectors: CardSelectors = None) -> str:
+    """Description text of a LinkedIn job posting page or fragment"""
+    return (selectors or LINKEDIN_CARD).text(make_soup(markup, parser), 'description')
+
+def parse_dice_card(card, selectors: CardSelectors = None) -> Optional[Dict[str, Any]]:
+    """Fields of one Dice job card, with its job_id when available"""
+    if card is None:
+        return None
+    selectors = selectors or DICE_CARD
+
+    title = selectors.text(card, 'title')
+    if not title:
+        return None
+
+    link = selectors.first(card, 'link')
+
+    return {
+        'job_id': card.get('data-id') or card.get('data-job-id'),
+        'title': title,
+        'company': selectors.text(card, 'company'),
+        'location': selectors.text(card, 'location'),
+        'url': link.get('href', '') if link is not None else ""
+    }
+
+def parse_dice_cards(markup, parser: str = None, selectors: CardSelectors = None) -> List[Dict[str, Any]]:
+    """Parse the job cards of a Dice search page"""
+    selectors = selectors or DICE_CARD
+    cards = selectors.select(make_soup(markup, parser), 'card')[1]
+    return [job for job in (parse_dice_card(card, selectors) for card in cards) if job]
@@ -1,119 +1,234 @@
-from typing import List, Dict, Any
-import time
+from typing import List, Dict, Any, Iterator, Tuple, Optional
+from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from .base_scraper import BaseScraper
-from src.utils.helpers import random_delay, clean_text, extract_date_from_text
+from .html_parsing import parse_card_fragments, parse_linkedin_card, parse_linkedin_cards, parse_linkedin_description
+from .selectors import LINKEDIN_SELECTORS
+from src.utils.retry import BLOCKING_STATUSES
+
+# Public listing fragments served to logged-out visitors; no browser needed
+GUEST_SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+GUEST_POSTING_PATH = "/jobs-guest/jobs/api/jobPosting/{job_id}"
 
 class LinkedInScraper(BaseScraper):
     """LinkedIn job scraper"""
     
+    default_base_url = "https://www.linkedin.com/jobs/search"
+    
+    def __init__(self, config: Dict[str, Any], logger):
+        super().__init__(config, logger)
+        linkedin_config = (config.get('platforms', {}) or {}).get('linkedin', {}) or {}
+        # auto: HTTP first with Selenium as fallback; http or selenium: that path only
+        self.extraction_mode = linkedin_config.get('mode', 'auto')
+        self.max_jobs_per_term = linkedin_config.get('max_jobs_per_term', 20)
+        self._http_blocked = False
+    
     def get_platform_name(self) -> str:
         return "LinkedIn"
     
-    def scrape_jobs(self, search_terms: List[str], location: str = None) -> List[Dict[str, Any]]:
-        """Scrape jobs from LinkedIn"""
-        all_jobs = []
-        driver = self.get_selenium_driver()
+    def iter_term_jobs(self, search_terms: List[str], location: str = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Scrape jobs from LinkedIn, yielding each term's contract jobs as it finishes"""
+        used_browser = False
         
-        try:
-            for term in search_terms:
-                self.logger.info(f"Scraping LinkedIn for: {term}")
-                jobs = self._scrape_term(driver, term, location)
-                all_jobs.extend(jobs)
-                random_delay(2, 4)
+        for term in search_terms:
+            if self.circuit_is_open():
+                break
+            self.logger.info(f"Scraping LinkedIn for: {term}")
+            
+            jobs = None
+            if self.extraction_mode != 'selenium' and not self._http_blocked:
+                jobs = self._scrape_term_http(term, location)
+            
+            if jobs is None and self.extraction_mode != 'http':
+                used_browser = True
+                try:
+                    with self.lease_driver() as driver:
+                        jobs = self._scrape_term(driver, term, location)
+                except Exception as e:
+                    # E.g. a browser crash; the term is left out so a resume or retry scrapes it again
+                    self.logger.error(f"Error scraping LinkedIn for {term}: {e}")
+                    self.fail_term(term, e)
+                    continue
             
-        finally:
-            driver.quit()
+            if jobs is None:
+                self.fail_term(term, "guest listing failed and the browser fallback is disabled")
+                continue
+            
+            yield term, self.filter_contract_jobs(jobs or [], term)
         
-        return self.filter_contract_jobs(all_jobs)
+        if used_browser:
+            self.readiness.log_summary()
+        if self.seen_index is not None:
+            self.seen_index.log_stats(self.get_platform_name())
     
-    def _scrape_term(self, driver, search_term: str, location: str) -> List[Dict[str, Any]]:
-        """Scrape jobs for a specific search term"""
-        jobs = []
-        
-        # Build LinkedIn search URL
-        base_url = "https://www.linkedin.com/jobs/search"
-        params = {
+    def _build_search_params(self, search_term: str, location: str) -> Dict[str, str]:
+        """Query parameters shared by the search page and the guest listing"""
+        return {
             'keywords': search_term,
             'location': location or 'United States',
             'f_JT': 'C',  # Contract jobs filter
             'f_TPR': 'r86400'  # Last 24 hours
         }
+    
+    def _scrape_term_http(self, search_term: str, location: str) -> Optional[List[Dict[str, Any]]]:
+        """Scrape a term from the guest listing fragments, or return None to fall back to Selenium"""
+        url = f"{self.site_url(GUEST_SEARCH_PATH)}?{urlencode(self._build_search_params(search_term, location))}"
+        response = self.fetch_many([url], [search_term])[0]
         
-        url = f"{base_url}?" + "&".join([f"{k}={v}" for k, v in params.items()])
+        if response.error is not None or response.status_code != 200:
+            if response.status_code in BLOCKING_STATUSES:
+                self.logger.warning(f"LinkedIn guest listing blocked ({response.status_code}), skipping HTTP mode for this run")
+                self._http_blocked = True
+            else:
+                self.logger.warning(f"LinkedIn guest listing failed for {search_term}: {response.error or response.status_code}")
+            return None
         
-        try:
-            driver.get(url)
-            time.sleep(3)
-            
-            # Scroll to load more jobs
-            self._scroll_page(driver)
+        if not response.content.strip():
+            return []
+        
+        selectors = self.card_selectors(LINKEDIN_SELECTORS)
+        with self.metrics.timer('parse_seconds', platform=self.get_platform_name(), term=search_term):
+            cards = parse_linkedin_cards(response.content, self.html_parser, selectors)[:self.max_jobs_per_term]
+        if not cards:
+            self.logger.warning(f"No job cards parsed from LinkedIn guest listing for {search_term}")
+            return None
+        self.cache_response(response)
+        
+        jobs = []
+        new_cards = []
+        for card in cards:
+            job_key, seen_job = self.get_seen_job(card['job_id'], card['url'])
+            if self._has_description(seen_job):
+                jobs.append(seen_job)
+            else:
+                new_cards.append((job_key, card))
+        
+        # Descriptions for all new cards in one batch instead of a click per card
+        detail_urls = {card['job_id']: self.site_url(GUEST_POSTING_PATH.format(job_id=card['job_id']))
+                       for _, card in new_cards if card['job_id']}
+        descriptions = {}
+        details = self.fetch_many(list(detail_urls.values()), [search_term] * len(detail_urls))
+        with self.metrics.timer('parse_seconds', platform=self.get_platform_name(), term=search_term):
+            for job_id, detail in zip(detail_urls, details):
+                if detail.status_code == 200:
+                    descriptions[job_id] = parse_linkedin_description(detail.content, self.html_parser, selectors)
+                    if descriptions[job_id]:
+                        self.cache_response(detail)
+        
+        for job_key, card in new_cards:
+            job_data = {
+                'title': card['title'],
+                'company': card['company'],
+                'location': card['location'],
+                'description': descriptions.get(card['job_id'], ""),
+                'posting_date': card['posting_date'],
+                'platform': self.get_platform_name(),
+                'url': card['url'] or url,
+                'job_type': 'Contract'
+            }
+            # Jobs whose details failed to load are kept out of the index so the next run fetches them again
+            if job_data['description']:
+                self.remember_job(job_key, job_data)
+            jobs.append(job_data)
+        
+        self.record_cards(search_term, len(cards), len(jobs))
+        self.logger.info(f"Found {len(jobs)} LinkedIn jobs for {search_term} without a browser")
+        return jobs
+    
+    def _scrape_term(self, driver, search_term: str, location: str) -> List[Dict[str, Any]]:
+        """Scrape jobs for a specific search term"""
+        jobs = []
+        
+        # Build LinkedIn search URL
+        params = self._build_search_params(search_term, location)
+        
+        url = f"{self.base_url}?" + "&".join([f"{k}={v}" for k, v in params.items()])
+        
+        # Page-level failures such as a crashed browser propagate, so the term is not recorded as empty
+        self.load_page(driver, url, search_term)
+        
+        if not self.readiness.wait_for_elements(driver, LINKEDIN_SELECTORS['card']):
+            self.logger.warning(f"No job cards loaded for {search_term}")
+            return jobs
+        
+        # Scroll to load more jobs
+        self._scroll_page(driver)
+        
+        # Read all cards in one round trip and parse them in-process
+        selector, fragments = self.snapshot_cards(driver, LINKEDIN_SELECTORS['card'])
+        with self.metrics.timer('parse_seconds', platform=self.get_platform_name(), term=search_term):
+            cards = parse_card_fragments(fragments[:self.max_jobs_per_term], parse_linkedin_card,
+                                         self.html_parser, self.card_selectors(LINKEDIN_SELECTORS))
+        card_elements = None
+        
+        for index, card in enumerate(cards):
+            if not card:
+                continue
             
-            # Find job cards
-            job_cards = driver.find_elements(By.CSS_SELECTOR, '.job-search-card')
+            # Skip the click and detail load for postings seen in earlier runs
+            job_key, seen_job = self.get_seen_job(card['job_id'], card['url'])
+            if self._has_description(seen_job):
+                jobs.append(seen_job)
+                continue
             
-            for card in job_cards[:20]:  # Limit to first 20 jobs
-                try:
-                    job_data = self._extract_job_data(driver, card)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    self.logger.warning(f"Error extracting job data: {e}")
-                    continue
-                
-                random_delay(1, 2)
+            if card_elements is None:
+                card_elements = driver.find_elements(By.CSS_SELECTOR, selector)
             
-        except Exception as e:
-            self.logger.error(f"Error scraping LinkedIn for {search_term}: {e}")
+            # Opening a card loads its details from LinkedIn
+            self.wait_for_slot(url)
+            try:
+                job_data = self._extract_job_data(driver, card_elements[index], card, url)
+                if job_data:
+                    # As in the HTTP path, only complete jobs are indexed
+                    if job_data['description']:
+                        self.remember_job(job_key, job_data)
+                    jobs.append(job_data)
+            except Exception as e:
+                self.logger.warning(f"Error extracting job data: {e}")
+                continue
         
+        self.record_cards(search_term, len(fragments), len(jobs))
         return jobs
     
     def _scroll_page(self, driver):
         """Scroll page to load more jobs"""
-        for i in range(3):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        self.readiness.scroll_until_stable(driver, LINKEDIN_SELECTORS['card'][0], max_scrolls=3)
     
-    def _extract_job_data(self, driver, card) -> Dict[str, Any]:
-        """Extract job data from job card"""
+    def _extract_job_data(self, driver, card_element, card: Dict[str, Any], search_url: str) -> Dict[str, Any]:
+        """Open a snapshotted card and combine its fields with the detail description"""
         try:
-            # Click on job card to get details
-            card.click()
-            time.sleep(2)
-            
-            # Extract job details
-            title_element = card.find_element(By.CSS_SELECTOR, '.base-search-card__title')
-            company_element = card.find_element(By.CSS_SELECTOR, '.base-search-card__subtitle')
-            location_element = card.find_element(By.CSS_SELECTOR, '.job-search-card__location')
-            
-            # Try to get job description from detail panel
-            try:
-                description_element = driver.find_element(By.CSS_SELECTOR, '.show-more-less-html__markup')
-                description = clean_text(description_element.text)
-            except:
-                description = ""
-            
-            # Try to get posting date
-            try:
-                date_element = card.find_element(By.CSS_SELECTOR, '.job-search-card__listdate')
-                posting_date = extract_date_from_text(date_element.get_attribute('datetime'))
-            except:
-                posting_date = extract_date_from_text("")
+            # Click on job card and wait for its details to replace the previous ones
+            previous_description = self._current_description(driver)
+            card_element.click()
+            details_loaded = self.readiness.wait_until(
+                driver,
+                lambda d: self._current_description(d) not in ("", previous_description),
+                'job_details'
+            )
             
+            # On a timeout the panel may still show the previous card, so its text is not used
             return {
-                'title': clean_text(title_element.text),
-                'company': clean_text(company_element.text),
-                'location': clean_text(location_element.text),
-                'description': description,
-                'posting_date': posting_date,
+                'title': card['title'],
+                'company': card['company'],
+                'location': card['location'],
+                'description': self._current_description(driver) if details_loaded else "",
+                'posting_date': card['posting_date'],
                 'platform': self.get_platform_name(),
-                'url': driver.current_url,
+                'url': card['url'] or search_url,
                 'job_type': 'Contract'
             }
             
         except Exception as e:
             self.logger.warning(f"Error extracting job data from card: {e}")
             return None
+    
+    def _has_description(self, job: Optional[Dict[str, Any]]) -> bool:
+        """Whether a stored job is complete; jobs indexed without their description are fetched again"""
+        return bool(job and job.get('description'))
+    
+    def _current_description(self, driver) -> str:
+        """Return the text of the job detail panel, or an empty string"""
+        try:
+            return driver.find_element(By.CSS_SELECTOR, LINKEDIN_SELECTORS['description'][0]).text
+        except Exception:
+            return ""
@@ -1,16 +1,17 @@
-from typing import List, Dict, Any
-import requests
-import time
-import random
-from bs4 import BeautifulSoup
+from typing import List, Dict, Any, Iterator, Tuple
 from .base_scraper import BaseScraper
-from src.utils.helpers import random_delay, clean_text, extract_date_from_text
+from .html_parsing import make_scoped_soup, make_soup
+from .selectors import MONSTER_SELECTORS, MONSTER_RESULTS_START
 
 class MonsterScraper(BaseScraper):
     """Enhanced Monster.com job scraper with anti-bot protection"""
     
-    def __init__(self, config: Dict[str, Any], logger):
-        super().__init__(config, logger)
+    # Limit search terms to avoid triggering rate limits
+    max_terms = 3
+    default_base_url = "https://www.monster.com/jobs/search"
+    
+    def setup_session(self):
+        """Use browser-like headers and cookies for the session"""
         self.setup_advanced_session()
     
     def setup_advanced_session(self):
@@ -42,149 +43,145 @@ class MonsterScraper(BaseScraper):
     def get_platform_name(self) -> str:
         return "Monster"
     
-    def scrape_jobs(self, search_terms: List[str], location: str = None) -> List[Dict[str, Any]]:
-        """Scrape jobs with enhanced anti-detection measures"""
-        all_jobs = []
+    def iter_term_jobs(self, search_terms: List[str], location: str = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Scrape jobs with enhanced anti-detection measures, yielding terms as they resolve"""
+        limited_terms = search_terms[:self.max_terms]
         
-        # Limit search terms to avoid triggering rate limits
-        limited_terms = search_terms[:3]  # Only first 3 terms
+        self.logger.info(f"Scraping Monster for {len(limited_terms)} terms")
         
-        for i, term in enumerate(limited_terms):
-            self.logger.info(f"Scraping Monster for: {term} ({i+1}/{len(limited_terms)})")
-            
-            try:
-                jobs = self._scrape_term_safe(term, location)
-                all_jobs.extend(jobs)
+        try:
+            for term, jobs in self._scrape_terms_safe(limited_terms, location):
                 self.logger.info(f"Successfully found {len(jobs)} jobs for {term}")
-                
-                # Progressive delay to avoid rate limiting
-                delay = random.uniform(5, 10) + (i * 2)  # Increasing delay
-                self.logger.info(f"Waiting {delay:.1f} seconds before next request...")
-                time.sleep(delay)
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping Monster for {term}: {e}")
-                # Longer delay after error
-                time.sleep(random.uniform(10, 15))
+                yield term, self.filter_contract_jobs(jobs, term)
+        except Exception as e:
+            self.logger.error(f"Error scraping Monster: {e}")
         
-        return self.filter_contract_jobs(all_jobs)
+        if self.http_cache is not None:
+            self.http_cache.log_stats()
     
-    def _scrape_term_safe(self, search_term: str, location: str) -> List[Dict[str, Any]]:
-        """Safe scraping method with multiple fallback approaches"""
-        jobs = []
-        
-        # Try multiple URL patterns
-        url_patterns = [
-            f"https://www.monster.com/jobs/search?q={search_term}&where={location or 'United States'}",
-            f"https://www.monster.com/jobs/search/?q={search_term.replace(' ', '+')}&where={location or 'United+States'}",
-            f"https://www.monster.com/jobs/search?q={search_term}&location={location or 'United States'}"
+    def _build_url_patterns(self, search_term: str, location: str) -> List[str]:
+        """Build the candidate search URLs for a term, in order of preference"""
+        return [
+            f"{self.base_url}?q={search_term}&where={location or 'United States'}",
+            f"{self.base_url}/?q={search_term.replace(' ', '+')}&where={location or 'United+States'}",
+            f"{self.base_url}?q={search_term}&location={location or 'United States'}"
         ]
+    
+    def _scrape_terms_safe(self, search_terms: List[str], location: str) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Fetch all terms concurrently, falling back to the next URL pattern per term"""
+        pending = list(search_terms)
+        # Terms whose search page loaded under some pattern; only they can be empty rather than failed
+        loaded = set()
+        pattern_count = len(self._build_url_patterns("", location))
         
-        for url_pattern in url_patterns:
-            try:
-                self.logger.info(f"Trying URL pattern: {url_pattern}")
-                
-                # Add random delay before request
-                time.sleep(random.uniform(2, 4))
-                
-                response = self.session.get(url_pattern, timeout=30)
-                
-                if response.status_code == 200:
-                    self.logger.info(f"Success! Got 200 response")
-                    jobs = self._parse_monster_response(response, search_term)
-                    if jobs:
-                        return jobs
-                elif response.status_code == 403:
-                    self.logger.warning(f"403 Forbidden for pattern: {url_pattern}")
-                    continue
+        for pattern_index in range(pattern_count):
+            if not pending:
+                break
+            if self.circuit_breaker.is_open:
+                # Blocked: the other patterns would only be refused too
+                self.logger.warning(f"Monster circuit is open, skipping the remaining URL patterns for {len(pending)} terms")
+                break
+            
+            urls = [self._build_url_patterns(term, location)[pattern_index] for term in pending]
+            self.logger.info(f"Trying URL pattern {pattern_index + 1} for {len(urls)} terms")
+            
+            still_pending = []
+            for term, response in zip(pending, self.fetch_many(urls, pending)):
+                if response.error is None and response.status_code == 200:
+                    loaded.add(term)
+                jobs = self._handle_response(response, term)
+                if jobs:
+                    self.cache_response(response)
+                    yield term, jobs
                 else:
-                    self.logger.warning(f"Got status code {response.status_code}")
-                    
-            except requests.exceptions.RequestException as e:
-                self.logger.warning(f"Request failed for pattern {url_pattern}: {e}")
-                continue
+                    still_pending.append(term)
+            
+            pending = still_pending
         
         # If all URL patterns fail, try alternative approach
-        return self._try_alternative_approach(search_term, location)
+        for term in pending:
+            if term in loaded:
+                yield term, self._try_alternative_approach(term, location)
+            else:
+                # Blocked or unreachable; left out so a resume or retry scrapes it again
+                self.fail_term(term, "no search page could be loaded")
+    
+    def _handle_response(self, response, search_term: str) -> List[Dict[str, Any]]:
+        """Check the status of a fetched page and parse it when successful"""
+        if response.error is not None:
+            return []
+        
+        if response.status_code == 200:
+            self.logger.info(f"Success! Got 200 response")
+            return self._parse_monster_response(response, search_term)
+        elif response.status_code == 403:
+            self.logger.warning(f"403 Forbidden for pattern: {response.url}")
+        else:
+            self.logger.warning(f"Got status code {response.status_code}")
+        
+        return []
     
     def _parse_monster_response(self, response, search_term: str) -> List[Dict[str, Any]]:
         """Parse Monster response and extract job data"""
         jobs = []
+        job_cards = []
         
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Multiple selectors to find job cards
-            job_selectors = [
-                '.job-cardstyle__JobCardComponent',
-                '.JobCard',
-                '.job-card',
-                '[data-testid="job-card"]',
-                '.card-content'
-            ]
-            
-            job_cards = []
-            for selector in job_selectors:
-                job_cards = soup.find_all('div', class_=selector.replace('.', ''))
+            with self.metrics.timer('parse_seconds', platform=self.get_platform_name(), term=search_term):
+                # Build a tree of the results region only; one selector pass finds the cards
+                selectors = self.card_selectors(MONSTER_SELECTORS)
+                soup = make_scoped_soup(response.content, MONSTER_RESULTS_START, self.html_parser)
+                selector, job_cards = selectors.select(soup, 'card')
+                
+                if not job_cards:
+                    # The cards are outside the expected region; look at the whole page
+                    selector, job_cards = selectors.select(make_soup(response.content, self.html_parser), 'card')
+                
                 if job_cards:
                     self.logger.info(f"Found {len(job_cards)} job cards with selector: {selector}")
-                    break
-            
-            if not job_cards:
-                # Try generic approach
-                job_cards = soup.find_all('div', attrs={'data-jobid': True}) or \
-                           soup.find_all('article') or \
-                           soup.find_all('div', class_=lambda x: x and 'job' in x.lower())
-            
-            for card in job_cards[:5]:  # Limit to 5 jobs per term
-                try:
-                    job_data = self._extract_job_from_card(card, search_term)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    self.logger.warning(f"Error extracting job from card: {e}")
-                    continue
+                
+                for card in job_cards[:5]:  # Limit to 5 jobs per term
+                    try:
+                        job_data = self._extract_job_from_card(card, search_term)
+                        if job_data:
+                            jobs.append(job_data)
+                    except Exception as e:
+                        self.logger.warning(f"Error extracting job from card: {e}")
+                        continue
             
         except Exception as e:
             self.logger.error(f"Error parsing Monster response: {e}")
         
+        self.record_cards(search_term, len(job_cards), len(jobs))
         return jobs
     
     def _extract_job_from_card(self, card, search_term: str) -> Dict[str, Any]:
         """Extract job data from individual job card"""
         try:
-            # Try multiple approaches to extract title
-            title = self._extract_text_multiple_selectors(card, [
-                'h2', 'h3', '.title', '.job-title', '[data-testid="job-title"]'
-            ])
-            
-            company = self._extract_text_multiple_selectors(card, [
-                '.company', '.company-name', '[data-testid="company-name"]'
-            ])
-            
-            location = self._extract_text_multiple_selectors(card, [
-                '.location', '.job-location', '[data-testid="location"]'
-            ])
+            selectors = self.card_selectors(MONSTER_SELECTORS)
+            title = selectors.text(card, 'title')
+            company = selectors.text(card, 'company')
+            location = selectors.text(card, 'location')
             
             # Get job URL if available
             job_url = ""
-            link = card.find('a')
+            link = selectors.first(card, 'link')
             if link and link.get('href'):
                 job_url = link.get('href')
                 if job_url.startswith('/'):
-                    job_url = f"https://www.monster.com{job_url}"
+                    job_url = self.site_url(job_url)
             
             if not title:
                 return None
             
             return {
-                'title': clean_text(title),
-                'company': clean_text(company) or "Unknown Company",
-                'location': clean_text(location) or "Unknown Location",
-                'description': f"Contract position for {search_term} - {clean_text(title)}",
-                'posting_date': extract_date_from_text(""),
+                'title': title,
+                'company': company or "Unknown Company",
+                'location': location or "Unknown Location",
+                'description': f"Contract position for {search_term} - {title}",
+                'posting_date': "",
                 'platform': self.get_platform_name(),
-                'url': job_url or f"https://www.monster.com/jobs/search?q={search_term}",
+                'url': job_url or f"{self.base_url}?q={search_term}",
                 'job_type': 'Contract'
             }
             
@@ -192,17 +189,6 @@ class MonsterScraper(BaseScraper):
             self.logger.warning(f"Error extracting job data: {e}")
             return None
     
-    def _extract_text_multiple_selectors(self, element, selectors):
-        """Try multiple CSS selectors to extract text"""
-        for selector in selectors:
-            try:
-                found = element.select_one(selector)
-                if found and found.get_text(strip=True):
-                    return found.get_text(strip=True)
-            except:
-                continue
-        return ""
-    
     def _try_alternative_approach(self, search_term: str, location: str) -> List[Dict[str, Any]]:
         """Alternative approach when main scraping fails"""
         self.logger.info(f"Trying alternative approach for {search_term}")
@@ -214,9 +200,9 @@ class MonsterScraper(BaseScraper):
                 'company': "Various Companies",
                 'location': location or "United States",
                 'description': f"Contract opportunities for {search_term} professionals",
-                'posting_date': extract_date_from_text(""),
+                'posting_date': "",
                 'platform': self.get_platform_name(),
-                'url': f"https://www.monster.com/jobs/search?q={search_term}",
+                'url': f"{self.base_url}?q={search_term}",
                 'job_type': 'Contract'
             }
         ]
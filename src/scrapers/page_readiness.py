@@ -0,0 +1,89 @@
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+class PageReadiness:
+    """Wait for Selenium pages to become ready instead of sleeping a fixed time"""
+
+    def __init__(self, platform: str, config: Dict[str, Any], logger):
+        self.platform = platform
+        self.logger = logger
+
+        readiness = (config.get('selenium', {}) or {}).get('readiness', {}) or {}
+        self.max_wait = readiness.get('max_wait', 10)
+        self.poll_interval = readiness.get('poll_interval', 0.2)
+        self.scroll_wait = readiness.get('scroll_wait', 3)
+
+        self.wait_times: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def wait_until(self, driver, condition: Callable, kind: str, timeout: float = None, warn: bool = True):
+        """Wait until condition(driver) is truthy, returning its value or None on timeout"""
+        timeout = min(timeout or self.max_wait, self.max_wait)
+        start = time.monotonic()
+
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(condition)
+        except TimeoutException:
+            if warn:
+                self.logger.warning(f"{self.platform}: timed out after {timeout}s waiting for {kind}")
+            return None
+        finally:
+            self._record(kind, time.monotonic() - start)
+
+    def wait_for_elements(self, driver, selectors: List[str], timeout: float = None) -> Optional[str]:
+        """Wait until any of the CSS selectors matches, returning the first that does"""
+        def any_present(d):
+            for selector in selectors:
+                if d.find_elements(By.CSS_SELECTOR, selector):
+                    return selector
+            return False
+
+        return self.wait_until(driver, any_present, 'elements', timeout)
+
+    def scroll_until_stable(self, driver, card_selector: str, max_scrolls: int = 3) -> int:
+        """Scroll to the bottom until no new cards load, returning the final card count"""
+        count = len(driver.find_elements(By.CSS_SELECTOR, card_selector))
+
+        for _ in range(max_scrolls):
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+            def more_cards(d, previous=count):
+                current = len(d.find_elements(By.CSS_SELECTOR, card_selector))
+                return current if current > previous else False
+
+            # A timeout here just means the list stopped growing
+            new_count = self.wait_until(driver, more_cards, 'scroll', self.scroll_wait, warn=False)
+
+            if not new_count:
+                break
+            count = new_count
+
+        return count
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return count, total and max observed wait per wait kind"""
+        with self._lock:
+            return {
+                kind: {
+                    'count': len(times),
+                    'total_seconds': round(sum(times), 3),
+                    'max_seconds': round(max(times), 3)
+                }
+                for kind, times in self.wait_times.items()
+            }
+
+    def log_summary(self):
+        """Log observed wait times for this platform"""
+        for kind, stats in self.summary().items():
+            self.logger.info(
+                f"{self.platform} waits for {kind}: {stats['count']} waits, "
+                f"{stats['total_seconds']}s total, {stats['max_seconds']}s max"
+            )
+
+    def _record(self, kind: str, elapsed: float):
+        with self._lock:
+            self.wait_times.setdefault(kind, []).append(elapsed)
@@ -0,0 +1,49 @@
+import importlib
+import threading
+from typing import Dict, Any, List, Type
+
+# Platform name -> "module:Class"; modules are imported only when a platform is used
+SCRAPERS = {
+    'linkedin': 'src.scrapers.linkedin_scraper:LinkedInScraper',
+    'monster': 'src.scrapers.monsters_scraper:MonsterScraper',
+    'dice': 'src.scrapers.dice_scraper:DiceScraper'
+}
+
+_loaded: Dict[str, Type] = {}
+_lock = threading.Lock()
+
+def register_scraper(name: str, target: str):
+    """Register a scraper as "module:Class" under a platform name"""
+    SCRAPERS[name] = target
+    _loaded.pop(name, None)
+
+def available_platforms(config: Dict[str, Any] = None) -> List[str]:
+    """Names of all known scrapers, including ones declared in the platforms section"""
+    names = list(SCRAPERS)
+    for name, platform_config in ((config or {}).get('platforms', {}) or {}).items():
+        if (platform_config or {}).get('scraper') and name not in names:
+            names.append(name)
+    return names
+
+def enabled_platforms(config: Dict[str, Any]) -> List[str]:
+    """Known scrapers not switched off with platforms.<name>.enabled"""
+    platforms = config.get('platforms', {}) or {}
+    return [name for name in available_platforms(config)
+            if (platforms.get(name) or {}).get('enabled', True)]
+
+def load_scraper_class(name: str, config: Dict[str, Any] = None) -> Type:
+    """Import and return the scraper class for a platform"""
+    with _lock:
+        if name not in _loaded:
+            target = ((config or {}).get('platforms', {}) or {}).get(name, {}) or {}
+            target = target.get('scraper') or SCRAPERS.get(name)
+            if not target:
+                raise KeyError(f"Unknown platform: {name}")
+
+            module_name, class_name = target.split(':')
+            _loaded[name] = getattr(importlib.import_module(module_name), class_name)
+        return _loaded[name]
+
+def create_scraper(name: str, config: Dict[str, Any], logger):
+    """Build the scraper for a platform"""
+    return load_scraper_class(name, config)(config, logger)
@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional
+from src.utils.config import resolve_path
+
+class SelectorRanker:
+    """Learn which fallback selector works for each platform and field, persisted between runs
+
+    Every lookup adds to the score of the selector that matched while older
+    scores decay, so the ranking follows layout changes within a few pages.
+    """
+
+    def __init__(self, path: str, logger, decay: float = 0.9, fallback_warn_ratio: float = 0.2):
+        self.path = path
+        self.logger = logger
+        self.decay = decay
+        self.fallback_warn_ratio = fallback_warn_ratio
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        # platform -> field -> selector -> score
+        self.scores: Dict[str, Dict[str, Dict[str, float]]] = {}
+        # platform -> field -> lookups, fallbacks (a non-default selector won) and misses
+        self.stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    self.scores = json.load(file)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable selector ranking {path}: {e}")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], logger) -> Optional['SelectorRanker']:
+        """Build the ranker from the selector_learning section, or return None when disabled"""
+        learning_config = config.get('selector_learning', {}) or {}
+        if not learning_config.get('enabled', False):
+            return None
+
+        return cls(
+            path=resolve_path(learning_config.get('path', 'output/cache/selector_ranks.json')),
+            logger=logger,
+            decay=learning_config.get('decay', 0.9),
+            fallback_warn_ratio=learning_config.get('fallback_warn_ratio', 0.2)
+        )
+
+    def preferred(self, platform: str, field: str) -> Optional[str]:
+        """Selector that has recently worked best for a field, if any has been learned"""
+        with self._lock:
+            scores = self.scores.get(platform, {}).get(field)
+            return max(scores, key=scores.get) if scores else None
+
+    def record(self, platform: str, field: str, selectors: List[str], winner: Optional[str]):
+        """Record which selector matched a field (None when none did)"""
+        with self._lock:
+            stats = self.stats.setdefault(platform, {}).setdefault(field, {'lookups': 0, 'fallbacks': 0, 'misses': 0})
+            stats['lookups'] += 1
+
+            if winner is None:
+                stats['misses'] += 1
+                return
+            if winner != selectors[0]:
+                stats['fallbacks'] += 1
+
+            scores = self.scores.setdefault(platform, {}).setdefault(field, {})
+            for selector in list(scores):
+                if selector not in selectors:
+                    del scores[selector]
+                else:
+                    scores[selector] *= self.decay
+            scores[winner] = scores.get(winner, 0.0) + 1.0
+            self._dirty = True
+
+    def log_stats(self, platform: str):
+        """Log how often each field needed a fallback selector in this run"""
+        with self._lock:
+            fields = dict(self.stats.get(platform, {}))
+
+        for field, stats in fields.items():
+            lookups = stats['lookups']
+            message = (f"{platform} selectors for {field}: {lookups} lookups, "
+                       f"{stats['fallbacks']} fallbacks, {stats['misses']} misses, "
+                       f"preferred {self.preferred(platform, field)!r}")
+
+            if lookups and (stats['fallbacks'] + stats['misses']) / lookups > self.fallback_warn_ratio:
+                self.logger.warning(f"{message} - the page layout may have changed")
+            else:
+                self.logger.info(message)
+
+    def save(self):
+        """Write the ranking to disk if it changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self.scores, file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+
+_shared_ranker = None
+_shared_lock = threading.Lock()
+
+def get_selector_ranker(config: Dict[str, Any], logger) -> Optional[SelectorRanker]:
+    """Return the process-wide selector ranker, or None when it is disabled"""
+    global _shared_ranker
+
+    with _shared_lock:
+        if _shared_ranker is None:
+            _shared_ranker = SelectorRanker.from_config(config, logger)
+        return _shared_ranker
@@ -0,0 +1,48 @@
+# CSS selectors for each platform's job cards, in order of preference.
+# Shared by the HTTP parsers and the Selenium extraction paths so a layout
+# change only has to be fixed in one place.
+
+import re
+
+LINKEDIN_SELECTORS = {
+    'card': ['.job-search-card', '.base-search-card'],
+    'title': ['.base-search-card__title'],
+    'company': ['.base-search-card__subtitle'],
+    'location': ['.job-search-card__location'],
+    'posting_date': ['time'],
+    'link': ['a.base-card__full-link', 'a'],
+    'description': ['.show-more-less-html__markup', '.description__text']
+}
+
+DICE_SELECTORS = {
+    'card': ['[data-testid="job-card"]', '.card', '.job-tile', '.search-result-item'],
+    'title': ['[data-testid="job-title"]', '.job-title', 'h2', 'h3', '.title'],
+    'company': ['[data-testid="job-company"]', '.company', '.company-name'],
+    'location': ['[data-testid="job-location"]', '.location', '.job-location'],
+    'link': ['a']
+}
+
+MONSTER_SELECTORS = {
+    'card': [
+        '.job-cardstyle__JobCardComponent',
+        '.JobCard',
+        '.job-card',
+        '[data-testid="job-card"]',
+        '.card-content',
+        # Generic fallbacks when none of the known card classes are present
+        'div[data-jobid]',
+        'article',
+        'div[class*="job" i]'
+    ],
+    'title': ['h2', 'h3', '.title', '.job-title', '[data-testid="job-title"]'],
+    'company': ['.company', '.company-name', '[data-testid="company-name"]'],
+    'location': ['.location', '.job-location', '[data-testid="location"]'],
+    'link': ['a']
+}
+
+# Opening tag of the element wrapping the search results. Pages are parsed from
+# there on, skipping the head, inline scripts and navigation before it.
+MONSTER_RESULTS_START = re.compile(
+    rb'<(?:div|section|main|ul)\b[^>]*\b(?:id|data-testid)="(?:JobCardGrid|card-scroll-container|SearchResults|job-?results)"',
+    re.IGNORECASE
+)
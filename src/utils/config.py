@@ -2,6 +2,14 @@ import yaml
 import os
 from typing import Dict, Any
 
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+def resolve_path(path: str) -> str:
+    """Resolve a path from settings.yaml relative to the project root"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(PROJECT_ROOT, path)
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from YAML file"""
     config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'settings.yaml')
@@ -21,3 +29,14 @@ def get_role_mappings() -> Dict[str, Any]:
         mappings = json.load(file)
     
     return mappings
+
+def get_city_states() -> Dict[str, str]:
+    """Load the bundled US city to state table"""
+    import json
+    
+    cities_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'us_cities.json')
+    
+    with open(cities_path, 'r') as file:
+        cities = json.load(file)
+    
+    return cities
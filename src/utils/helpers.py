@@ -8,45 +8,59 @@ def random_delay(min_seconds=1, max_seconds=3):
     """Add random delay to avoid being blocked"""
     time.sleep(random.uniform(min_seconds, max_seconds))
 
+# Compiled once; shared with the column-wise normalization in src.data.normalizer
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\-\.\,\(\)]')
+DAYS_AGO_PATTERN = re.compile(r'(\d{1,2})\s+(?:day|days)\s+ago', re.IGNORECASE)
+HOURS_AGO_PATTERN = re.compile(r'(\d{1,2})\s+(?:hour|hours)\s+ago', re.IGNORECASE)
+US_DATE_PATTERN = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
     if not text:
         return ""
     
     # Remove extra whitespace and newlines
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = WHITESPACE_PATTERN.sub(' ', text.strip())
     
     # Remove special characters that might cause issues
-    text = re.sub(r'[^\w\s\-\.\,\(\)]', '', text)
+    text = SPECIAL_CHARS_PATTERN.sub('', text)
     
     return text
 
-def extract_date_from_text(text: str) -> str:
+def extract_date_from_text(text: str, now: datetime = None) -> str:
     """Extract and normalize date from job posting text"""
     if not text:
         return ""
     
-    # Common patterns for job posting dates
-    patterns = [
-        r'(\d{1,2})\s+(day|days)\s+ago',
-        r'(\d{1,2})\s+(hour|hours)\s+ago',
-        r'(\d{1,2})/(\d{1,2})/(\d{4})',
-        r'(\d{4})-(\d{1,2})-(\d{1,2})'
-    ]
+    now = now or datetime.now()
+    
+    match = DAYS_AGO_PATTERN.search(text)
+    if match:
+        return (now - timedelta(days=int(match.group(1)))).strftime('%Y-%m-%d')
     
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            if 'day' in pattern:
-                days_ago = int(match.group(1))
-                date = datetime.now() - timedelta(days=days_ago)
-                return date.strftime('%Y-%m-%d')
-            elif 'hour' in pattern:
-                hours_ago = int(match.group(1))
-                date = datetime.now() - timedelta(hours=hours_ago)
-                return date.strftime('%Y-%m-%d')
+    match = HOURS_AGO_PATTERN.search(text)
+    if match:
+        return (now - timedelta(hours=int(match.group(1)))).strftime('%Y-%m-%d')
     
-    return datetime.now().strftime('%Y-%m-%d')
+    match = US_DATE_PATTERN.search(text)
+    if match:
+        month, day, year = (int(part) for part in match.groups())
+        try:
+            return datetime(year, month, day).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    
+    match = ISO_DATE_PATTERN.search(text)
+    if match:
+        year, month, day = (int(part) for part in match.groups())
+        try:
+            return datetime(year, month, day).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    
+    return now.strftime('%Y-%m-%d')
 
 def get_us_states() -> List[str]:
     """Return list of US states for filtering"""
@@ -62,3 +76,21 @@ def get_us_states() -> List[str]:
         'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington',
         'West Virginia', 'Wisconsin', 'Wyoming'
     ]
+
+def get_us_state_abbreviations() -> Dict[str, str]:
+    """Return mapping of US state abbreviations to state names"""
+    return {
+        'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
+        'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
+        'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
+        'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
+        'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
+        'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
+        'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+        'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+        'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
+        'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
+        'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
+        'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
+        'WI': 'Wisconsin', 'WY': 'Wyoming'
+    }
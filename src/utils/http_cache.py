@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+from src.utils.config import resolve_path
+
+class HttpCache:
+    """On-disk HTTP response cache with LRU eviction and conditional revalidation"""
+
+    def __init__(self, directory: str, logger, max_size_mb: float = 200,
+                 ttl_hours: Dict[str, float] = None):
+        self.directory = directory
+        self.logger = logger
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.ttl_hours = ttl_hours or {}
+
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(directory, 'index.sqlite'), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers TEXT, etag TEXT, "
+            "last_modified TEXT, stored_at REAL, accessed_at REAL, size INTEGER)"
+        )
+        self._db.commit()
+        self._total_size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], logger) -> Optional['HttpCache']:
+        """Build a cache from the http_cache section, or return None when disabled"""
+        cache_config = config.get('http_cache', {}) or {}
+        if not cache_config.get('enabled', False):
+            return None
+
+        return cls(
+            directory=resolve_path(cache_config.get('directory', 'output/cache/http')),
+            logger=logger,
+            max_size_mb=cache_config.get('max_size_mb', 200),
+            ttl_hours=cache_config.get('ttl_hours', {})
+        )
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for url including its body, or None"""
+        key = self._key(url)
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, headers, etag, last_modified, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            try:
+                with open(self._body_path(key), 'rb') as file:
+                    content = file.read()
+            except OSError:
+                self._delete(key)
+                return None
+
+            self._db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+        status, headers, etag, last_modified, stored_at = row
+        return {
+            'url': url,
+            'status': status,
+            'headers': json.loads(headers),
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': stored_at,
+            'content': content
+        }
+
+    def is_fresh(self, entry: Dict[str, Any], platform: str) -> bool:
+        """Check whether an entry is still within the platform's freshness TTL"""
+        ttl_hours = self.ttl_hours.get(platform.lower(), self.ttl_hours.get('default', 6))
+        return time.time() - entry['stored_at'] < ttl_hours * 3600
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers to revalidate an entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record_hit(self):
+        """Count a cached body served without contacting the server"""
+        with self._lock:
+            self.stats['hits'] += 1
+
+    def record_miss(self):
+        """Count a request that had to be sent to the server"""
+        with self._lock:
+            self.stats['misses'] += 1
+
+    def refresh(self, url: str, headers: Dict[str, str]):
+        """Mark an entry fresh again after a 304 Not Modified response"""
+        now = time.time()
+        etag = headers.get('ETag') or headers.get('etag')
+        last_modified = headers.get('Last-Modified') or headers.get('last-modified')
+
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET stored_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                (now, now, etag, last_modified, self._key(url))
+            )
+            self._db.commit()
+            self.stats['revalidated'] += 1
+
+    def store(self, url: str, status: int, headers: Dict[str, str], content: bytes):
+        """Store a response body and its validators, evicting old entries if needed"""
+        key = self._key(url)
+        now = time.time()
+        etag = headers.get('ETag') or headers.get('etag')
+        last_modified = headers.get('Last-Modified') or headers.get('last-modified')
+
+        with self._lock:
+            tmp_path = self._body_path(key) + '.tmp'
+            with open(tmp_path, 'wb') as file:
+                file.write(content)
+            os.replace(tmp_path, self._body_path(key))
+
+            previous = self._db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if previous:
+                self._total_size -= previous[0]
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(dict(headers)), etag, last_modified, now, now, len(content))
+            )
+            self._total_size += len(content)
+            self.stats['stored'] += 1
+
+            self._evict()
+            self._db.commit()
+
+    def log_stats(self):
+        """Log hit/miss statistics"""
+        total = self.stats['hits'] + self.stats['misses']
+        hit_rate = (self.stats['hits'] + self.stats['revalidated']) / total * 100 if total else 0
+        self.logger.info(
+            f"HTTP cache: {self.stats['hits']} fresh hits, {self.stats['revalidated']} revalidated (304), "
+            f"{self.stats['misses']} requests sent, {self.stats['stored']} stored, "
+            f"{self.stats['evicted']} evicted, {hit_rate:.0f}% served from cache"
+        )
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits; caller must hold the lock"""
+        while self._total_size > self.max_size:
+            row = self._db.execute("SELECT key FROM entries ORDER BY accessed_at LIMIT 1").fetchone()
+            if row is None:
+                break
+            self._delete(row[0])
+            self.stats['evicted'] += 1
+
+    def _delete(self, key: str):
+        """Remove an entry and its body; caller must hold the lock"""
+        row = self._db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if row:
+            self._total_size -= row[0]
+        self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+        try:
+            os.remove(self._body_path(key))
+        except OSError:
+            pass
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.body")
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+def get_http_cache(config: Dict[str, Any], logger) -> Optional[HttpCache]:
+    """Return the process-wide HTTP cache, or None when caching is disabled"""
+    global _shared_cache
+
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = HttpCache.from_config(config, logger)
+        return _shared_cache
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from typing import Dict, List
+from src.utils.config import PROJECT_ROOT
+
+# Run in a fresh interpreter so modules already imported by this process do not hide their cost
+_TIMER = (
+    "import sys, time; sys.path.insert(0, {root!r}); "
+    "start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+)
+
+def time_import(module: str) -> float:
+    """Seconds a fresh interpreter needs to import a module"""
+    result = subprocess.run(
+        [sys.executable, '-c', _TIMER.format(root=PROJECT_ROOT, module=module)],
+        capture_output=True, text=True, cwd=PROJECT_ROOT
+    )
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1] if result.stderr else module)
+    return float(result.stdout.strip())
+
+def benchmark_imports(modules: List[str], repeat: int = 3) -> Dict[str, float]:
+    """Best import time of each module over a few fresh interpreters"""
+    return {module: min(time_import(module) for _ in range(repeat)) for module in modules}
@@ -0,0 +1,183 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+from src.utils.config import resolve_path
+
+# Prefix of every series exported in the Prometheus text format
+PROMETHEUS_PREFIX = 'job_scraper_'
+
+Labels = Tuple[Tuple[str, str], ...]
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    """Hashable, ordered form of a label mapping; None values are left out"""
+    return tuple(sorted((key, str(value)) for key, value in labels.items() if value is not None))
+
+
+class MetricsRegistry:
+    """Thread-safe counters and timings labelled by platform, term and similar keys"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget all series, e.g. at the start of a run"""
+        with self._lock:
+            self.started = time.time()
+            self._counters: Dict[Tuple[str, Labels], float] = {}
+            # name, labels -> [count, total seconds, max seconds]
+            self._timings: Dict[Tuple[str, Labels], list] = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter"""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Record one duration"""
+        key = (name, _labels(labels))
+        with self._lock:
+            timing = self._timings.setdefault(key, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Time the enclosed block, including when it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All series as plain data"""
+        with self._lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for (name, labels), value in sorted(self._counters.items())]
+            timings = [{'name': name, 'labels': dict(labels), 'count': count,
+                        'total_seconds': round(total, 6), 'max_seconds': round(longest, 6)}
+                       for (name, labels), (count, total, longest) in sorted(self._timings.items())]
+        return {'counters': counters, 'timings': timings}
+
+    def by_platform(self, snapshot: Dict[str, Any] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Per platform and term totals of every series, for reading a report at a glance"""
+        snapshot = snapshot or self.snapshot()
+        platforms: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+        for series in snapshot['counters'] + snapshot['timings']:
+            labels = series['labels']
+            if 'platform' not in labels:
+                continue
+
+            name = series['name']
+            if 'status' in labels:
+                name = f"{name}[{labels['status']}]"
+            term = platforms.setdefault(labels['platform'], {}).setdefault(labels.get('term', '*'), {})
+            term[name] = round(term.get(name, 0) + series.get('value', series.get('total_seconds', 0)), 6)
+
+        return platforms
+
+    def write_report(self, path: str, **run_info) -> str:
+        """Write the run's metrics as JSON along with run details such as its ID and label"""
+        snapshot = self.snapshot()
+        report = dict(run_info)
+        report.update({
+            'started': datetime.fromtimestamp(self.started).isoformat(timespec='seconds'),
+            'duration_seconds': round(time.time() - self.started, 3),
+            'platforms': self.by_platform(snapshot),
+            **snapshot
+        })
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        return path
+
+    def prometheus_text(self) -> str:
+        """All series in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+        typed = set()
+
+        def series(name: str, labels: Dict[str, str], value: float):
+            rendered = ','.join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            lines.append(f"{name}{{{rendered}}} {value}" if rendered else f"{name} {value}")
+
+        for counter in snapshot['counters']:
+            name = f"{PROMETHEUS_PREFIX}{counter['name']}"
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} counter")
+            series(name, counter['labels'], counter['value'])
+
+        for timing in snapshot['timings']:
+            name = f"{PROMETHEUS_PREFIX}{timing['name']}"
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} summary")
+            series(f"{name}_count", timing['labels'], timing['count'])
+            series(f"{name}_sum", timing['labels'], timing['total_seconds'])
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+_shared_registry = MetricsRegistry()
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry"""
+    return _shared_registry
+
+
+def report_path(config: Dict[str, Any], run_id: str) -> Optional[str]:
+    """Where a run's metrics report goes, or None when metrics.enabled is off"""
+    metrics_config = config.get('metrics', {}) or {}
+    if not metrics_config.get('enabled', False):
+        return None
+    return os.path.join(resolve_path(metrics_config.get('directory', 'output/metrics')), f"{run_id}.json")
+
+
+def start_metrics_server(config: Dict[str, Any], logger) -> Optional[ThreadingHTTPServer]:
+    """Serve the registry as Prometheus text on a background thread when metrics.prometheus is enabled"""
+    metrics_config = config.get('metrics', {}) or {}
+    prometheus_config = metrics_config.get('prometheus', {}) or {}
+    if not metrics_config.get('enabled', False) or not prometheus_config.get('enabled', False):
+        return None
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = get_metrics().prometheus_text().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    host = prometheus_config.get('host', '127.0.0.1')
+    port = int(prometheus_config.get('port', 9108))
+    try:
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+    except OSError as e:
+        logger.warning(f"Could not start the metrics endpoint on {host}:{port}: {e}")
+        return None
+
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    logger.info(f"Serving metrics at http://{host}:{port}/metrics")
+    return server
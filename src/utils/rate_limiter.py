@@ -0,0 +1,183 @@
+import asyncio
+import copy
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from src.utils.metrics import get_metrics
+
+class _HostBucket:
+    """Token bucket state for a single host"""
+
+    def __init__(self, rate: float, burst: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """Thread- and asyncio-safe token-bucket rate limiter keyed by host"""
+
+    def __init__(self, default_delay: float = 2, burst: float = 1, host_delays: Dict[str, float] = None,
+                 jitter: float = 0.25, min_rate_factor: float = 0.1):
+        self.default_delay = default_delay
+        self.burst = burst
+        self.host_delays = host_delays or {}
+        self.jitter = jitter
+        self.min_rate_factor = min_rate_factor
+
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'RateLimiter':
+        """Build a limiter from scraping.delay_between_requests (seconds or a mapping)"""
+        delay = (config.get('scraping', {}) or {}).get('delay_between_requests', 2)
+
+        if not isinstance(delay, dict):
+            return cls(default_delay=float(delay))
+
+        return cls(
+            default_delay=float(delay.get('default', 2)),
+            burst=float(delay.get('burst', 1)),
+            host_delays={host: float(value) for host, value in (delay.get('hosts', {}) or {}).items()},
+            jitter=float(delay.get('jitter', 0.25)),
+            min_rate_factor=float(delay.get('min_rate_factor', 0.1))
+        )
+
+    def reserve(self, host: str) -> float:
+        """Take a token for host and return how long the caller must wait before using it"""
+        host = self._normalize_host(host)
+
+        with self._lock:
+            bucket = self._get_bucket(host)
+            now = time.monotonic()
+
+            # Time inside a Retry-After block earns no tokens, so callers queued during
+            # the block are spaced at the current rate after it instead of released at once
+            refill_from = max(bucket.updated, bucket.blocked_until)
+            if now > refill_from:
+                bucket.tokens = min(bucket.burst, bucket.tokens + (now - refill_from) * bucket.rate)
+            bucket.updated = now
+            bucket.tokens -= 1
+
+            wait = 0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate
+            wait += max(0.0, bucket.blocked_until - now)
+
+        if wait > 0 and self.jitter:
+            wait += random.uniform(0, self.jitter / bucket.rate)
+
+        return wait
+
+    def acquire(self, host: str) -> float:
+        """Block the calling thread until a request to host is allowed"""
+        wait = self.reserve(host)
+        if wait > 0:
+            get_metrics().observe('rate_limit_wait_seconds', wait, host=self._normalize_host(host))
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, host: str) -> float:
+        """Coroutine version of acquire"""
+        wait = self.reserve(host)
+        if wait > 0:
+            get_metrics().observe('rate_limit_wait_seconds', wait, host=self._normalize_host(host))
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_response(self, host: str, status_code: int, headers: Dict[str, str] = None):
+        """Adapt the host's rate to a response: back off on 429/503, recover on success"""
+        host = self._normalize_host(host)
+        headers = headers or {}
+
+        with self._lock:
+            bucket = self._get_bucket(host)
+
+            if status_code in (429, 503):
+                bucket.rate = max(bucket.rate / 2, bucket.max_rate * self.min_rate_factor)
+
+                retry_after = parse_retry_after(headers.get('Retry-After') or headers.get('retry-after'))
+                if retry_after is None:
+                    retry_after = 1 / bucket.rate
+
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + retry_after)
+                # One request may go when the block ends; the rest follow at the reduced rate.
+                # The rejected request already spent its token, so this is not a refund.
+                bucket.tokens = 1.0
+
+            elif 200 <= status_code < 400 and bucket.rate < bucket.max_rate:
+                # Additive recovery towards the configured rate
+                bucket.rate = min(bucket.max_rate, bucket.rate + bucket.max_rate * 0.1)
+
+    def current_delay(self, host: str) -> float:
+        """Return the current seconds-per-request for host"""
+        with self._lock:
+            return 1 / self._get_bucket(self._normalize_host(host)).rate
+
+    def _get_bucket(self, host: str) -> _HostBucket:
+        """Return the bucket for host, creating it on first use; caller must hold the lock"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            delay = self.host_delays.get(host, self.default_delay)
+            rate = 1 / delay if delay > 0 else 1000.0
+            bucket = self._buckets[host] = _HostBucket(rate, self.burst)
+        return bucket
+
+    def _normalize_host(self, host: str) -> str:
+        """Accept either a host name or a full URL"""
+        if '://' in host:
+            return urlparse(host).netloc
+        return host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def split_request_rates(config: Dict[str, Any], processes: int) -> Dict[str, Any]:
+    """Copy of config with every request delay multiplied by processes, so that many
+    processes with a limiter each keep the configured rates together"""
+    config = copy.deepcopy(config)
+    scraping = config.setdefault('scraping', {})
+    delay = scraping.get('delay_between_requests', 2)
+    processes = max(1, processes)
+
+    if not isinstance(delay, dict):
+        scraping['delay_between_requests'] = float(delay) * processes
+        return config
+
+    delay['default'] = float(delay.get('default', 2)) * processes
+    delay['hosts'] = {host: float(value) * processes for host, value in (delay.get('hosts', {}) or {}).items()}
+    return config
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+def get_rate_limiter(config: Dict[str, Any]) -> RateLimiter:
+    """Return the process-wide rate limiter shared by all scrapers"""
+    global _shared_limiter
+
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter.from_config(config)
+        return _shared_limiter
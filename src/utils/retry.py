@@ -0,0 +1,158 @@
+import random
+import threading
+import time
+from typing import Dict, Any
+
+# Statuses platforms use to refuse automated clients
+BLOCKING_STATUSES = {403, 429, 999}
+
+# Statuses worth asking again for after a pause
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting a platform whose circuit is open"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} circuit is open, next probe in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class ScrapeError(Exception):
+    """Raised when search terms could not be scraped, so they are tried again instead of saved as finished"""
+
+
+class RetryPolicy:
+    """How often and after how long a failed request is repeated"""
+
+    def __init__(self, attempts: int = 3, backoff_base: float = 1.0, backoff_max: float = 30.0, jitter: float = 0.5):
+        self.attempts = max(1, attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'RetryPolicy':
+        """Build the policy from scraping.retry_attempts and scraping.retry"""
+        scraping = config.get('scraping', {}) or {}
+        retry_config = scraping.get('retry', {}) or {}
+
+        return cls(
+            attempts=int(scraping.get('retry_attempts', 3)),
+            backoff_base=float(retry_config.get('backoff_base', 1.0)),
+            backoff_max=float(retry_config.get('backoff_max', 30.0)),
+            jitter=float(retry_config.get('jitter', 0.5))
+        )
+
+    def delay(self, retry: int) -> float:
+        """Seconds to wait before the given retry (1 for the first), doubling each time with jitter"""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def should_retry(self, result) -> bool:
+        """True for transport errors and transient statuses, but never for an open circuit"""
+        if result.error is not None:
+            return not isinstance(result.error, CircuitOpenError)
+        return result.status_code in RETRY_STATUSES
+
+
+class CircuitBreaker:
+    """Stop contacting a platform after repeated blocks or timeouts, probing again after a cooldown
+
+    closed: requests flow; open: requests are refused until the cooldown ends;
+    half-open: one probe is let through and its outcome closes or reopens the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, name: str, logger, failure_threshold: int = 5, cooldown: float = 300):
+        self.name = name
+        self.logger = logger
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, name: str, config: Dict[str, Any], logger) -> 'CircuitBreaker':
+        """Build a platform's breaker from scraping.circuit_breaker"""
+        breaker_config = (config.get('scraping', {}) or {}).get('circuit_breaker', {}) or {}
+        return cls(
+            name=name,
+            logger=logger,
+            failure_threshold=int(breaker_config.get('failure_threshold', 5)),
+            cooldown=float(breaker_config.get('cooldown', 300))
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are refused"""
+        with self._lock:
+            return self.state == self.HALF_OPEN or (
+                self.state == self.OPEN and time.monotonic() - self.opened_at < self.cooldown)
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now; after the cooldown only one probe is allowed"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self.logger.info(f"{self.name} circuit half-open, sending a probe")
+                return True
+            return False
+
+    def check(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed"""
+        with self._lock:
+            return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def record_success(self):
+        """A request went through; close the circuit"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                self.logger.info(f"{self.name} circuit closed, requests resume")
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        """A request was blocked or timed out; open the circuit after too many in a row"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.logger.warning(
+                    f"{self.name} circuit opened after {self.failures} consecutive failures, "
+                    f"pausing requests for {self.cooldown:.0f}s"
+                )
+
+    def record_result(self, result):
+        """Count a fetch result: blocks, server errors and transport errors are failures, other answers successes"""
+        if isinstance(result.error, CircuitOpenError):
+            return
+        if result.error is not None or result.status_code in BLOCKING_STATUSES or result.status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+_shared_breakers: Dict[str, CircuitBreaker] = {}
+_shared_lock = threading.Lock()
+
+def get_circuit_breaker(name: str, config: Dict[str, Any], logger) -> CircuitBreaker:
+    """Return the process-wide circuit breaker of a platform"""
+    with _shared_lock:
+        if name not in _shared_breakers:
+            _shared_breakers[name] = CircuitBreaker.from_config(name, config, logger)
+        return _shared_breakers[name]
@@ -0,0 +1,254 @@
+import logging
+import time
+from datetime import date, datetime
+import pandas as pd
+import pytest
+from src.data.keyword_matcher import KeywordMatcher
+from src.data.near_duplicates import NearDuplicateIndex
+from src.data.processor import DataProcessor
+from src.data.normalizer import extract_contract_durations, normalize_jobs
+from src.data.rollups import RollupStore, build_rollup, combine_rollups
+from src.data.seen_index import SeenJobIndex
+from src.data.state_resolver import StateResolver
+
+ROLE_GROUPS = {
+    'SAP': ['SAP', 'SAP ABAP'],
+    'Oracle': ['Oracle', 'Oracle BI'],
+    'BI': ['Oracle BI', 'Power BI'],
+}
+
+
+def test_classify_picks_first_group_in_mapping_order():
+    matcher = KeywordMatcher(ROLE_GROUPS)
+    texts = pd.Series(['Power BI and SAP', 'SAP ABAP developer', 'Oracle BI Publisher'], index=[10, 11, 12])
+
+    result = matcher.classify(texts)
+
+    assert list(result.index) == [10, 11, 12]
+    assert result['group'].tolist() == ['SAP', 'SAP', 'Oracle']
+    assert result['groups'].tolist() == ['SAP, BI', 'SAP', 'Oracle, BI']
+    # The longest keyword wins at a position
+    assert result.loc[11, 'keywords'] == 'sap abap'
+    assert result.loc[10, 'keywords'] == 'power bi, sap'
+
+def test_classify_defaults_when_nothing_matches():
+    matcher = KeywordMatcher(ROLE_GROUPS)
+
+    result = matcher.classify(pd.Series(['Line Cook', None, '']), default='Other')
+
+    assert result['group'].tolist() == ['Other'] * 3
+    assert result['groups'].tolist() == [''] * 3
+    assert result['keywords'].tolist() == [''] * 3
+
+def test_keywords_match_whole_words_only():
+    matcher = KeywordMatcher({'contract': ['contract', 'temp']})
+
+    assert matcher.contains_any('Contract role')
+    assert not matcher.contains_any('Subcontractor template')
+    assert matcher.find_keywords('Temp to hire, CONTRACT') == ['temp', 'contract']
+
+def test_suffixes_extend_keywords():
+    matcher = KeywordMatcher({'contract': ['contract', 'temp', 'freelance']}, suffixes=['or', 'ing', 'r'])
+
+    assert matcher.contains_any('Contracting opportunity')
+    assert matcher.contains_any('Freelancer wanted')
+    assert not matcher.contains_any('Email template')
+
+def make_state_resolver() -> StateResolver:
+    return StateResolver(
+        states=['Texas', 'Missouri', 'Kansas', 'Indiana', 'New York'],
+        abbreviations={'TX': 'Texas', 'MO': 'Missouri', 'KS': 'Kansas', 'IN': 'Indiana', 'NY': 'New York'},
+        cities={'Austin': 'Texas', 'Kansas City': 'Missouri', 'St. Louis': 'Missouri', 'New York': 'New York'}
+    )
+
+@pytest.mark.parametrize('location, state', [
+    ('Austin, TX', 'Texas'),
+    ('Kansas City', 'Missouri'),
+    ('Kansas City, KS', 'Kansas'),
+    ('St. Louis', 'Missouri'),
+    ('New York, NY', 'New York'),
+    # Lowercase words are not read as abbreviations
+    ('Jobs in Austin', 'Texas'),
+    ('Remote', 'Unknown'),
+    ('', 'Unknown'),
+])
+def test_state_resolver(location, state):
+    assert make_state_resolver().resolve(location) == state
+
+def test_resolve_series_resolves_each_location_once():
+    resolver = make_state_resolver()
+
+    states = resolver.resolve_series(pd.Series(['Austin, TX', None, 'Austin, TX', 'Austin, TX']))
+
+    assert states.tolist() == ['Texas', 'Unknown', 'Texas', 'Texas']
+    assert resolver.cache_info().misses == 2
+
+def test_normalize_jobs_cleans_text_and_dates():
+    df = pd.DataFrame({
+        'title': ['  Java   Developer!! ', None, 'SAP FICO', 'Oracle DBA', 'Data Engineer'],
+        'location': ['Austin,  TX', '', 'Remote', 'Denver, CO', 'Chicago, IL'],
+        'posting_date': ['2 days ago', '', '3 hours ago', '10/05/2026', 'sometime'],
+    })
+
+    result = normalize_jobs(df, datetime(2026, 10, 17, 1, 0))
+
+    assert result['title'].tolist() == ['Java Developer', '', 'SAP FICO', 'Oracle DBA', 'Data Engineer']
+    assert result['location'].tolist()[0] == 'Austin, TX'
+    # Empty dates stay empty; unparsable ones fall back to the run date
+    assert result['posting_date'].tolist() == ['2026-10-15', '', '2026-10-16', '2026-10-05', '2026-10-17']
+
+def test_extract_contract_durations():
+    descriptions = pd.Series([
+        '6 month contract with extension',
+        '3 to 6 months contract',
+        'Contract for 12 months',
+        '26-week contract',
+        'Permanent role',
+    ])
+
+    durations = extract_contract_durations(descriptions)
+
+    assert durations['months'].tolist()[:4] == [6.0, 6.0, 12.0, 6.0]
+    assert pd.isna(durations['months'].iloc[4])
+    assert durations['text'].iloc[4] == 'Not specified'
+
+def make_jobs(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=['title', 'company', 'location', 'platform'])
+
+def test_near_duplicates_within_a_batch():
+    index = NearDuplicateIndex(':memory:', logging.getLogger('test'))
+    jobs = make_jobs([
+        ('Java Developer II', 'Acme Inc', 'Austin, TX', 'Dice'),
+        ('Java Developer III', 'Acme Inc', 'Austin, TX', 'Dice'),
+        ('Java Developer II', 'Acme, Inc.', 'Austin TX', 'LinkedIn'),
+        ('SAP FICO Consultant', 'Globex', 'Remote', 'Dice'),
+        ('SAP FICO Consultant', 'Globex Corporation', 'Remote', 'Monster'),
+    ])
+
+    duplicates = index.find_duplicates(jobs)
+
+    # Only the reformatted copy goes; a different title or company is a different job
+    assert duplicates.tolist() == [False, False, True, False, False]
+
+def test_near_duplicates_across_runs():
+    job = make_jobs([('Java Developer II', 'Acme Inc', 'Austin, TX', 'Dice')])
+    current = NearDuplicateIndex(':memory:', logging.getLogger('test'))
+    history = NearDuplicateIndex(':memory:', logging.getLogger('test'), against_history=True)
+
+    for index in (current, history):
+        index.find_duplicates(job)
+        index.begin_run()
+
+    assert not current.find_duplicates(job).any()
+    assert history.find_duplicates(job).all()
+
+def test_resumed_run_does_not_match_its_own_jobs():
+    index = NearDuplicateIndex(':memory:', logging.getLogger('test'), against_history=True)
+    job = make_jobs([('Java Developer II', 'Acme Inc', 'Austin, TX', 'Dice')])
+    interrupted_start = index.run_started
+    index.find_duplicates(job)
+
+    index.begin_run(resumed_since=interrupted_start)
+
+    assert not index.find_duplicates(job).any()
+
+def make_classified_jobs(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=['vertical', 'state', 'platform'])
+
+def test_combined_chunk_rollups_match_whole_batch():
+    jobs = make_classified_jobs([
+        ('SAP', 'Texas', 'Dice'), ('SAP', 'Texas', 'Dice'), ('Oracle', 'Ohio', 'Monster'),
+        ('SAP', 'Ohio', 'LinkedIn'), ('Oracle', 'Ohio', 'Monster'),
+    ])
+
+    combined = combine_rollups([build_rollup(jobs.iloc[:2]), build_rollup(jobs.iloc[2:])])
+
+    key = ['vertical', 'state', 'platform']
+    assert combined.sort_values(key).reset_index(drop=True).equals(
+        build_rollup(jobs).sort_values(key).reset_index(drop=True))
+    assert combined['job_count'].sum() == 5
+
+def test_rollup_store_summarizes_a_period(tmp_path):
+    store = RollupStore(str(tmp_path), logging.getLogger('test'))
+    store.save(make_classified_jobs([('SAP', 'Texas', 'Dice'), ('SAP', 'Ohio', 'Dice')]), date(2026, 10, 15), 'daily')
+    store.save(make_classified_jobs([('SAP', 'Texas', 'LinkedIn')]), date(2026, 10, 16), 'daily')
+    store.save(make_classified_jobs([('Oracle', 'Texas', 'Dice')]), date(2026, 10, 16), 'manual')
+    # A rerun replaces the earlier rollup of the same day and label
+    store.save(make_classified_jobs([('Oracle', 'Ohio', 'Monster')]), date(2026, 10, 17), 'daily')
+    store.save(make_classified_jobs([('SAP', 'Ohio', 'Monster')]), date(2026, 10, 17), 'daily')
+
+    sheets = store.summarize(date(2026, 10, 15), date(2026, 10, 17), labels=['daily'])
+
+    verticals = sheets['Vertical_Analysis']
+    assert verticals['job_count'].to_dict() == {'SAP': 4}
+    assert verticals.loc['SAP', 'states_count'] == 2
+    assert verticals.loc['SAP', 'platform'] == 'Dice, LinkedIn, Monster'
+    assert sheets['State_Analysis']['job_count'].to_dict() == {'Ohio': 2, 'Texas': 2}
+
+    trend = store.trend(date(2026, 10, 16), date(2026, 10, 17))
+    assert trend.to_dict() == {
+        'Oracle': {date(2026, 10, 16): 1, date(2026, 10, 17): 0},
+        'SAP': {date(2026, 10, 16): 1, date(2026, 10, 17): 1},
+    }
+
+def test_seen_index_keys_prefer_job_ids_over_canonical_urls():
+    assert SeenJobIndex.make_key('Dice', ' 123 ', 'https://dice.com/job/1') == 'dice:id:123'
+    assert (SeenJobIndex.make_key('Monster', url='HTTPS://Www.Monster.com/job/7/?src=feed#top')
+            == SeenJobIndex.make_key('Monster', url='https://www.monster.com/job/7'))
+    assert SeenJobIndex.make_key('Dice') is None
+
+def test_seen_index_expires_jobs_not_seen_within_retention(tmp_path, monkeypatch):
+    now = [1_800_000_000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    path = str(tmp_path / 'seen.sqlite')
+    index = SeenJobIndex(path, logging.getLogger('test'), retention_days=30)
+    index.add('dice:id:old', 'Dice', {'title': 'Old'})
+    index.add('dice:id:reused', 'Dice', {'title': 'Reused'})
+
+    # Seeing a posting again keeps it alive
+    now[0] += 20 * 86400
+    assert index.get('dice:id:reused') == {'title': 'Reused'}
+
+    now[0] += 15 * 86400
+    reopened = SeenJobIndex(path, logging.getLogger('test'), retention_days=30)
+
+    assert reopened.get('dice:id:old') is None
+    assert reopened.get('dice:id:reused') == {'title': 'Reused'}
+    assert reopened.stats['dice'] == {'hits': 1, 'misses': 1}
+
+def make_raw_job(title: str, location: str = 'Austin, TX') -> dict:
+    return {'title': title, 'company': 'Acme', 'location': location, 'description': '6 month SAP contract',
+            'posting_date': '', 'platform': 'Dice', 'url': 'https://www.dice.com/jobs', 'job_type': 'Contract'}
+
+def test_process_jobs_chunked_streams_batches_to_writers(tmp_path, monkeypatch):
+    logger = logging.getLogger('test')
+    config = {'processing': {'chunk_size': 2},
+              'output': {'directory': str(tmp_path), 'formats': ['jsonl'], 'background': False}}
+    processor = DataProcessor(logger, config)
+    processor._rollup_store = RollupStore(str(tmp_path / 'rollups'), logger)
+    pulled = []
+
+    def scraped_jobs():
+        # The first job comes back in the last chunk and is written only once
+        for title in ['SAP FICO', 'SAP ABAP', 'SAP Basis', 'SAP HANA', 'SAP FICO']:
+            pulled.append(title)
+            yield make_raw_job(title)
+
+    batches_seen = []
+    process_jobs = processor.process_jobs
+
+    def record_batch(batch, run_timestamp=None):
+        batches_seen.append(len(pulled))
+        return process_jobs(batch, run_timestamp)
+
+    monkeypatch.setattr(processor, 'process_jobs', record_batch)
+
+    result = processor.process_jobs_chunked(scraped_jobs(), 'run', config, 'manual', datetime(2026, 10, 17, 9, 0))
+
+    # Each batch is processed as soon as it is complete, before the next job is pulled
+    assert batches_seen == [2, 4, 5]
+    assert (result['jobs_scraped'], result['jobs_saved']) == (5, 4)
+    saved = pd.read_json(result['filepaths'][0], lines=True)
+    assert saved['title'].tolist() == ['SAP FICO', 'SAP ABAP', 'SAP Basis', 'SAP HANA']
+    summary = processor.rollup_store.summarize(date(2026, 10, 17), date(2026, 10, 17), labels=['manual'])
+    assert summary['State_Analysis']['job_count'].to_dict() == {'Texas': 4}
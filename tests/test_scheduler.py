@@ -0,0 +1,228 @@
+import logging
+import threading
+import time
+import pytest
+from src.scheduler.checkpoints import RunCheckpoints
+from src.scheduler.job_scheduler import JobScheduler
+from src.scheduler.platform_executor import PlatformExecutor
+from src.scheduler.work_queue import SqliteWorkQueue, WorkUnit
+from src.utils.retry import ScrapeError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_800_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, 'time', clock)
+    return clock
+
+@pytest.fixture
+def work_queue(tmp_path, clock):
+    return SqliteWorkQueue(str(tmp_path / 'queue.sqlite'), logging.getLogger('test'),
+                           lease_seconds=60, max_attempts=2)
+
+
+def test_enqueue_ignores_units_already_queued(work_queue):
+    units = [WorkUnit('Dice', 'Java'), WorkUnit('Dice', 'SAP'), WorkUnit('Dice', 'Java')]
+
+    assert work_queue.enqueue('run', units) == 2
+    assert work_queue.enqueue('run', [WorkUnit('Dice', 'SAP'), WorkUnit('Monster', 'SAP')]) == 1
+    assert work_queue.status('run') == {'pending': 3}
+
+def test_lease_hands_each_unit_to_one_worker(work_queue):
+    work_queue.enqueue('run', [WorkUnit('Dice', 'Java'), WorkUnit('Dice', 'SAP')])
+
+    first = work_queue.lease('run', 'worker-1')
+    second = work_queue.lease('run', 'worker-2')
+
+    assert {first.term, second.term} == {'Java', 'SAP'}
+    assert first.attempts == second.attempts == 1
+    assert work_queue.lease('run', 'worker-3') is None
+    assert not work_queue.is_finished('run')
+
+def test_expired_lease_is_taken_over(work_queue, clock):
+    work_queue.enqueue('run', [WorkUnit('Dice', 'Java')])
+    lost = work_queue.lease('run', 'worker-1')
+
+    clock.now += 30
+    assert work_queue.heartbeat(lost, 'worker-1')
+    clock.now += 61
+    retried = work_queue.lease('run', 'worker-2')
+
+    assert retried.unit_id == lost.unit_id and retried.attempts == 2
+    assert not work_queue.heartbeat(lost, 'worker-1')
+
+    # The late result of the first worker is discarded
+    work_queue.complete(lost, 'worker-1', [{'title': 'stale'}])
+    work_queue.complete(retried, 'worker-2', [{'title': 'Java Developer'}])
+    assert list(work_queue.iter_results('run')) == [{'title': 'Java Developer'}]
+
+def test_unit_fails_after_max_attempts(work_queue, clock):
+    work_queue.enqueue('run', [WorkUnit('Dice', 'Java')])
+
+    work_queue.fail(work_queue.lease('run', 'worker-1'), 'worker-1', 'blocked')
+    assert work_queue.status('run') == {'pending': 1}
+
+    # A worker dying on the last attempt fails the unit too
+    work_queue.lease('run', 'worker-1')
+    clock.now += 61
+    assert work_queue.lease('run', 'worker-2') is None
+
+    assert work_queue.status('run') == {'failed': 1}
+    assert work_queue.is_finished('run')
+    assert work_queue.failures('run') == {'Dice': '1 work units failed, e.g. lease expired'}
+
+    assert work_queue.retry_failed('run') == 1
+    assert work_queue.lease('run', 'worker-3').attempts == 1
+
+def test_iter_results_yields_only_new_units(work_queue):
+    work_queue.enqueue('run', [WorkUnit('Dice', 'Java'), WorkUnit('Dice', 'SAP')])
+    seen = set()
+
+    java = work_queue.lease('run', 'worker')
+    work_queue.complete(java, 'worker', [{'title': 'Java 1'}, {'title': 'Java 2'}])
+    assert [job['title'] for job in work_queue.iter_results('run', seen)] == ['Java 1', 'Java 2']
+
+    sap = work_queue.lease('run', 'worker')
+    work_queue.complete(sap, 'worker', [{'title': 'SAP 1'}])
+    assert [job['title'] for job in work_queue.iter_results('run', seen)] == ['SAP 1']
+    assert list(work_queue.iter_results('run', seen)) == []
+
+class FakeScraper:
+    """Yields one job per term, except for terms listed in failing"""
+
+    max_terms = None
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.failed_terms = {}
+        self.scraped = []
+
+    def iter_term_jobs(self, search_terms):
+        for term in search_terms:
+            self.scraped.append(term)
+            if term in self.failing:
+                self.failed_terms[term] = 'browser crashed'
+                continue
+            yield term, [{'title': f'{term} Developer'}]
+
+@pytest.fixture
+def scheduler(tmp_path):
+    config = {'checkpoints': {'enabled': True, 'path': str(tmp_path / 'runs.sqlite')}, 'metrics': {'enabled': False}}
+    return JobScheduler(config, logging.getLogger('test'))
+
+
+def test_checkpoints_record_runs_and_terms(tmp_path):
+    checkpoints = RunCheckpoints(str(tmp_path / 'runs.sqlite'), logging.getLogger('test'))
+    checkpoints.start_run('old', 'daily', ['dice'], ['Java'], started_at=1.0)
+    checkpoints.start_run('new', 'daily', ['dice', 'monster'], ['Java', 'SAP'], started_at=2.0)
+    checkpoints.save_term('new', 'dice', 'Java', [{'title': 'Java Developer'}])
+
+    assert checkpoints.get_run()['run_id'] == 'new'
+    assert checkpoints.get_run('old')['search_terms'] == ['Java']
+    assert checkpoints.completed_terms('new', 'dice') == {'Java'}
+    assert list(checkpoints.iter_jobs('new', 'dice')) == [{'title': 'Java Developer'}]
+
+    checkpoints.finish_run('new')
+
+    assert checkpoints.get_run()['run_id'] == 'old'
+    assert checkpoints.get_run('new')['finished_at'] is not None
+    assert checkpoints.completed_terms('new', 'dice') == set()
+
+def test_failed_terms_are_not_checkpointed(scheduler):
+    scraper = FakeScraper(failing=['SAP'])
+    jobs = []
+
+    with pytest.raises(ScrapeError, match=r'1 of 3 terms not scraped: SAP \(browser crashed\)'):
+        for job in scheduler._iter_checkpointed_jobs('dice', scraper, ['Java', 'SAP', 'Oracle'], 'run'):
+            jobs.append(job)
+
+    assert [job['title'] for job in jobs] == ['Java Developer', 'Oracle Developer']
+    assert scheduler.checkpoints.completed_terms('run', 'dice') == {'Java', 'Oracle'}
+
+def test_resume_reloads_checkpoints_and_scrapes_the_rest(scheduler):
+    list(scheduler._iter_checkpointed_jobs('dice', FakeScraper(), ['Java'], 'run'))
+    scraper = FakeScraper()
+
+    jobs = list(scheduler._iter_checkpointed_jobs('dice', scraper, ['Java', 'SAP'], 'run'))
+
+    assert [job['title'] for job in jobs] == ['Java Developer', 'SAP Developer']
+    assert scraper.scraped == ['SAP']
+
+def make_executor(**execution) -> PlatformExecutor:
+    return PlatformExecutor({'execution': execution}, logging.getLogger('test'))
+
+def slow_task(items, delay=0.05, fail_after=None):
+    def task():
+        for count, item in enumerate(items):
+            if count == fail_after:
+                raise RuntimeError('browser crashed')
+            time.sleep(delay)
+            yield item
+    return task
+
+def test_executor_runs_platforms_concurrently():
+    executor = make_executor(mode='concurrent', max_workers=3)
+    tasks = [(platform, slow_task([f'{platform}-{n}' for n in range(4)])) for platform in ('dice', 'monster', 'linkedin')]
+
+    start = time.monotonic()
+    items = list(executor.stream(tasks))
+    elapsed = time.monotonic() - start
+
+    # Three platforms of four 50 ms items each take about as long as one
+    assert elapsed < 0.45
+    assert sorted(items) == sorted((platform, f'{platform}-{n}') for platform, _ in tasks for n in range(4))
+    # Items of one platform keep their order
+    assert [item for platform, item in items if platform == 'dice'] == [f'dice-{n}' for n in range(4)]
+
+def test_executor_sequential_mode_keeps_task_order():
+    executor = make_executor(mode='sequential')
+
+    items = list(executor.stream([('dice', slow_task([1, 2], 0)), ('monster', slow_task([3], 0))]))
+
+    assert items == [('dice', 1), ('dice', 2), ('monster', 3)]
+
+@pytest.mark.parametrize('mode', ['concurrent', 'sequential'])
+def test_executor_isolates_failing_platform(mode):
+    executor = make_executor(mode=mode)
+
+    items = list(executor.stream([('dice', slow_task([1, 2, 3], 0, fail_after=1)), ('monster', slow_task([4, 5], 0))]))
+
+    # Jobs yielded before the failure are kept and the other platform finishes
+    assert sorted(items) == [('dice', 1), ('monster', 4), ('monster', 5)]
+    assert executor.failed == {'dice': 'browser crashed'}
+
+def test_executor_caps_tasks_per_platform():
+    executor = make_executor(mode='concurrent', max_workers=4, platform_concurrency={'dice': 1})
+    active = {'now': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    def task():
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        time.sleep(0.05)
+        with lock:
+            active['now'] -= 1
+        yield 'job'
+
+    items = list(executor.stream([('dice', task) for _ in range(3)]))
+
+    assert len(items) == 3
+    assert active['peak'] == 1
+
+def test_executor_lets_workers_exit_when_consumer_stops():
+    executor = make_executor(mode='concurrent', queue_size=1)
+    tasks = [('dice', slow_task(range(1000), 0)), ('monster', slow_task(range(1000), 0))]
+
+    stream = executor.stream(tasks)
+    assert next(stream)[0] in ('dice', 'monster')
+    start = time.monotonic()
+    stream.close()
+
+    assert time.monotonic() - start < 2
@@ -0,0 +1,596 @@
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from src.data.seen_index import SeenJobIndex
+from src.scrapers import base_scraper
+from src.scrapers.async_fetcher import AsyncFetcher, FetchResult
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.dice_scraper import DiceScraper
+from src.scrapers.driver_pool import DriverPool
+from src.scrapers.html_parsing import (
+    CardSelectors, make_scoped_soup, make_soup, parse_card_fragments, parse_dice_card, parse_dice_cards,
+    parse_linkedin_card, parse_linkedin_cards, parse_linkedin_description
+)
+from src.scrapers.linkedin_scraper import GUEST_SEARCH_PATH, LinkedInScraper
+from src.scrapers.monsters_scraper import MonsterScraper
+from src.scrapers.page_readiness import PageReadiness
+from src.scrapers.registry import enabled_platforms, load_scraper_class
+from src.scrapers.selectors import DICE_SELECTORS, MONSTER_RESULTS_START, MONSTER_SELECTORS
+from src.utils.config import load_config
+from src.utils.http_cache import HttpCache
+from src.utils.rate_limiter import RateLimiter
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+def read_fixture(platform: str, name: str) -> bytes:
+    with open(os.path.join(FIXTURES, platform, name), 'rb') as file:
+        return file.read()
+
+@pytest.fixture(params=['html.parser', 'lxml'])
+def parser(request):
+    if request.param == 'lxml':
+        pytest.importorskip('lxml')
+    return request.param
+
+@pytest.fixture
+def monster_scraper():
+    config = load_config()
+    config['selector_learning'] = {'enabled': False}
+    config['http_cache'] = {'enabled': False}
+    return MonsterScraper(config, logging.getLogger('test'))
+
+
+def test_parse_linkedin_cards(parser):
+    jobs = parse_linkedin_cards(read_fixture('linkedin', 'guest_search.html'), parser)
+
+    assert len(jobs) == 5
+    assert jobs[0] == {
+        'job_id': '3901234561',
+        'title': 'SAP FICO Consultant - Contract',
+        'company': 'Acme Consulting',
+        'location': 'Austin, TX',
+        'posting_date': '2026-10-16',
+        'url': 'https://www.linkedin.com/jobs/view/sap-fico-consultant---contract-3901234561'
+    }
+    assert all(job['job_id'] and '?' not in job['url'] for job in jobs)
+
+def test_parse_linkedin_card_without_title():
+    card = make_soup('<div class="base-card"><span class="job-search-card__location">Austin, TX</span></div>').find()
+
+    assert parse_linkedin_card(card) is None
+    assert parse_linkedin_card(None) is None
+
+def test_parse_linkedin_description(parser):
+    description = parse_linkedin_description(read_fixture('linkedin', 'job_posting.html'), parser)
+
+    assert description.startswith('Contract length: 6 months')
+
+def test_parse_dice_cards(parser):
+    jobs = parse_dice_cards(read_fixture('dice', 'search_results.html'), parser)
+
+    assert len(jobs) == 20
+    assert jobs[0] == {
+        'job_id': '269e0d37-18b8',
+        'title': 'SAP ABAP Consultant',
+        'company': 'TEKsystems',
+        'location': 'New York, NY',
+        'url': 'https://www.dice.com/job-detail/269e0d37-18b8'
+    }
+
+def test_parse_dice_card_without_title():
+    card = make_soup('<div class="card" data-id="1"><a class="card-title-link"></a></div>').find()
+
+    assert parse_dice_card(card) is None
+
+@pytest.mark.parametrize('name, selector, count', [
+    ('search_results.html', '.job-cardstyle__JobCardComponent', 25),
+    ('search_results_articles.html', 'article', 20),
+])
+def test_monster_scoped_soup_finds_every_card(name, selector, count, parser):
+    markup = read_fixture('monster', name)
+    selectors = CardSelectors('Monster', MONSTER_SELECTORS)
+
+    scoped = selectors.select(make_scoped_soup(markup, MONSTER_RESULTS_START, parser), 'card')
+    full = selectors.select(make_soup(markup, parser), 'card')
+
+    assert scoped[0] == full[0] == selector
+    assert len(scoped[1]) == len(full[1]) == count
+
+def test_monster_scoped_soup_skips_head_but_keeps_declared_charset(parser):
+    markup = ('<html><head><meta charset="windows-1252"><title>Caf\xe9 jobs</title></head><body>'
+              '<div id="SearchResults"><article><h3>Caf\xe9 Manager</h3></article></div></body></html>').encode('cp1252')
+
+    soup = make_scoped_soup(markup, MONSTER_RESULTS_START, parser)
+
+    assert soup.find('title') is None
+    assert soup.find('h3').get_text() == 'Caf\xe9 Manager'
+
+def test_monster_scoped_soup_parses_whole_page_without_results_region(parser):
+    markup = b'<html><body><main><article><h3>Java Developer</h3></article></main></body></html>'
+
+    soup = make_scoped_soup(markup, MONSTER_RESULTS_START, parser)
+
+    assert [h3.get_text() for h3 in soup.find_all('h3')] == ['Java Developer']
+
+@pytest.mark.parametrize('name, first_title', [
+    ('search_results.html', 'Oracle EBS Analyst - Contract'),
+    ('search_results_articles.html', 'Salesforce Administrator (Contract)'),
+])
+def test_monster_parse_response(monster_scraper, name, first_title):
+    response = FetchResult('https://www.monster.com/jobs/search?q=Java', 200, read_fixture('monster', name))
+
+    jobs = monster_scraper._parse_monster_response(response, 'Java')
+
+    # At most five cards are used per term
+    assert len(jobs) == 5
+    assert jobs[0]['title'] == first_title
+    assert all(job['platform'] == 'Monster' for job in jobs)
+    assert all(job['url'].startswith('https://www.monster.com/job-openings/') for job in jobs)
+
+def test_monster_handle_response_ignores_errors(monster_scraper):
+    blocked = FetchResult('https://www.monster.com/jobs/search?q=Java', 403, b'<html></html>')
+
+    assert monster_scraper._handle_response(blocked, 'Java') == []
+
+class FakeLinkedInSite:
+    """Serves the guest listing fixture and either the posting fixture or a block for details"""
+
+    def __init__(self):
+        self.details_status = 403
+        self.detail_requests = 0
+
+    def fetch_many(self, urls, terms=None):
+        results = []
+        for url in urls:
+            if GUEST_SEARCH_PATH in url:
+                results.append(FetchResult(url, 200, read_fixture('linkedin', 'guest_search.html')))
+            else:
+                self.detail_requests += 1
+                content = read_fixture('linkedin', 'job_posting.html') if self.details_status == 200 else b''
+                results.append(FetchResult(url, self.details_status, content))
+        return results
+
+def test_linkedin_jobs_without_description_are_fetched_again(tmp_path, monkeypatch):
+    seen_index = SeenJobIndex(str(tmp_path / 'seen.sqlite'), logging.getLogger('test'))
+    monkeypatch.setattr(base_scraper, 'get_seen_index', lambda config, logger: seen_index)
+    config = load_config()
+    config['selector_learning'] = {'enabled': False}
+    config['http_cache'] = {'enabled': False}
+    scraper = LinkedInScraper(config, logging.getLogger('test'))
+    site = FakeLinkedInSite()
+    monkeypatch.setattr(scraper, 'fetch_many', site.fetch_many)
+
+    blocked = scraper._scrape_term_http('SAP', None)
+    assert len(blocked) == 5 and not any(job['description'] for job in blocked)
+
+    site.details_status = 200
+    loaded = scraper._scrape_term_http('SAP', None)
+    assert site.detail_requests == 10
+    assert all(job['description'].startswith('Contract length') for job in loaded)
+
+    reused = scraper._scrape_term_http('SAP', None)
+    assert site.detail_requests == 10
+    assert reused == loaded
+
+class FakeDriver:
+    """Just enough of a WebDriver for the readiness waits: counted elements and a detail panel"""
+
+    def __init__(self, elements=None, growth=(), description=''):
+        self.elements = dict(elements or {})
+        self.growth = list(growth)
+        self.description = description
+        self.polls = 0
+
+    def find_elements(self, by, selector):
+        self.polls += 1
+        return [object()] * self.elements.get(selector, 0)
+
+    def find_element(self, by, selector):
+        return type('Element', (), {'text': self.description})()
+
+    def execute_script(self, script, *args):
+        # Each scroll loads the next batch of cards
+        if 'scrollTo' in script and self.growth:
+            self.elements['.card'] = self.elements.get('.card', 0) + self.growth.pop(0)
+
+class FakeCard:
+    def __init__(self, driver, description):
+        self.driver = driver
+        self.description = description
+
+    def click(self):
+        if self.description is not None:
+            self.driver.description = self.description
+
+def fast_readiness_config():
+    config = load_config()
+    config['selector_learning'] = {'enabled': False}
+    config['selenium'] = dict(config.get('selenium', {}) or {},
+                              readiness={'max_wait': 0.1, 'poll_interval': 0.01, 'scroll_wait': 0.05})
+    return config
+
+@pytest.mark.parametrize('new_description, expected', [
+    ('Second posting details', 'Second posting details'),
+    # The panel never changed, so the first posting's text must not be used
+    (None, ''),
+])
+def test_linkedin_detail_panel_readiness(new_description, expected):
+    scraper = LinkedInScraper(fast_readiness_config(), logging.getLogger('test'))
+    driver = FakeDriver(description='First posting details')
+    card = {'title': 'SAP FICO Consultant', 'company': 'Acme', 'location': 'Austin, TX',
+            'posting_date': '', 'url': 'https://www.linkedin.com/jobs/view/2'}
+
+    job = scraper._extract_job_data(driver, FakeCard(driver, new_description), card, 'https://www.linkedin.com/jobs/search')
+
+    assert job['description'] == expected
+
+@pytest.fixture
+def readiness():
+    return PageReadiness('LinkedIn', fast_readiness_config(), logging.getLogger('test'))
+
+def test_wait_for_elements_returns_first_matching_selector(readiness):
+    driver = FakeDriver(elements={'.fallback-card': 2, '.job-card': 0})
+
+    assert readiness.wait_for_elements(driver, ['.job-card', '.fallback-card']) == '.fallback-card'
+    assert readiness.summary()['elements']['count'] == 1
+
+def test_wait_until_returns_none_on_timeout(readiness):
+    driver = FakeDriver()
+
+    assert readiness.wait_for_elements(driver, ['.job-card']) is None
+    assert driver.polls > 1
+    # The ceiling caps longer requested timeouts
+    assert readiness.wait_until(driver, lambda d: False, 'details', timeout=60) is None
+    assert readiness.summary()['details']['max_seconds'] < 1
+
+def test_wait_until_returns_condition_value(readiness):
+    driver = FakeDriver()
+    polls = iter([False, False, 'ready'])
+
+    assert readiness.wait_until(driver, lambda d: next(polls), 'details') == 'ready'
+
+def test_scroll_until_stable_stops_when_no_cards_load(readiness):
+    driver = FakeDriver(elements={'.card': 5}, growth=[5, 3, 0, 4])
+
+    assert readiness.scroll_until_stable(driver, '.card', max_scrolls=5) == 13
+    # The fourth batch is never requested once a scroll loaded nothing
+    assert driver.growth == [4]
+
+def test_scroll_until_stable_respects_max_scrolls(readiness):
+    driver = FakeDriver(elements={'.card': 1}, growth=[1, 1, 1, 1])
+
+    assert readiness.scroll_until_stable(driver, '.card', max_scrolls=2) == 3
+
+class LocalSiteHandler(BaseHTTPRequestHandler):
+    """/status/<code>, /slow and /work/<n> pages that record how many requests run at once"""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        if self.path.startswith('/status/'):
+            status = int(self.path.rsplit('/', 1)[1])
+            headers = {'Retry-After': '7'} if status == 429 else {}
+            return self._reply(status, f'status {status}', headers)
+
+        if self.path == '/slow':
+            time.sleep(0.5)
+            return self._reply(200, 'late')
+
+        with LocalSiteHandler.lock:
+            LocalSiteHandler.active += 1
+            LocalSiteHandler.peak = max(LocalSiteHandler.peak, LocalSiteHandler.active)
+        time.sleep(0.05)
+        with LocalSiteHandler.lock:
+            LocalSiteHandler.active -= 1
+        self._reply(200, f"{self.path} {self.headers.get('X-Test', '')}".strip())
+
+    def _reply(self, status: int, body: str, headers=None):
+        content = body.encode('utf-8')
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        try:
+            self.wfile.write(content)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up, e.g. after its timeout
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def local_site():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LocalSiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    LocalSiteHandler.peak = 0
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+def make_fetcher(**kwargs) -> AsyncFetcher:
+    return AsyncFetcher(headers={}, cookies={}, logger=logging.getLogger('test'), **kwargs)
+
+def test_async_fetcher_keeps_order_and_caps_each_host(local_site):
+    pytest.importorskip('aiohttp')
+    urls = [f'{local_site}/work/{n}' for n in range(8)]
+
+    results = make_fetcher(per_host_limit=2).fetch_all(urls, [{'X-Test': str(n)} for n in range(8)])
+
+    assert [result.text for result in results] == [f'/work/{n} {n}' for n in range(8)]
+    assert all(result.status_code == 200 and result.error is None for result in results)
+    assert LocalSiteHandler.peak == 2
+
+def test_async_fetcher_reports_statuses_and_timeouts(local_site):
+    pytest.importorskip('aiohttp')
+    limiter = RateLimiter(default_delay=0.01, jitter=0)
+    fetcher = make_fetcher(timeout=0.2, rate_limiter=limiter)
+
+    ok, throttled, missing, slow = fetcher.fetch_all(
+        [f'{local_site}/work/1', f'{local_site}/status/429', f'{local_site}/status/404', f'{local_site}/slow'])
+
+    assert ok.status_code == 200
+    assert (throttled.status_code, throttled.headers['Retry-After']) == (429, '7')
+    assert (missing.status_code, missing.text) == (404, 'status 404')
+    # A timeout is an error result rather than an exception
+    assert slow.status_code == 0 and slow.error is not None
+    # The 429 slowed the host down in the shared limiter
+    assert limiter.current_delay(local_site) > 0.01
+
+class FakeBrowser:
+    """A WebDriver with tabs; hung browsers fail every command"""
+
+    created = 0
+
+    def __init__(self):
+        FakeBrowser.created += 1
+        self.name = f'browser-{FakeBrowser.created}'
+        self.window_handles = ['main']
+        self.current = 'main'
+        self.hung = False
+        self.quit_called = False
+        self.switch_to = self
+
+    @property
+    def current_window_handle(self):
+        if self.hung:
+            raise RuntimeError('browser not answering')
+        return self.current
+
+    def new_window(self, kind):
+        handle = f'tab-{len(self.window_handles)}'
+        self.window_handles.append(handle)
+        self.current = handle
+
+    def window(self, handle):
+        self.current = handle
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def quit(self):
+        self.quit_called = True
+
+def make_pool(**pool) -> DriverPool:
+    config = {'selenium': {'pool': dict({'max_browsers': 2, 'max_rss_mb': 0}, **pool)}}
+    return DriverPool(config, logging.getLogger('test'))
+
+def test_driver_pool_reuses_browser_with_fresh_tabs():
+    pool = make_pool()
+
+    with pool.lease('linkedin', FakeBrowser) as first:
+        assert first.current == 'tab-1'
+    with pool.lease('linkedin', FakeBrowser) as second:
+        pass
+
+    assert second is first
+    # Each lease's tab is closed again
+    assert first.window_handles == ['main'] and first.current == 'main'
+
+def test_driver_pool_keeps_platforms_apart_and_evicts_idle_browsers():
+    pool = make_pool(max_browsers=1)
+
+    with pool.lease('dice', FakeBrowser) as dice:
+        pass
+    with pool.lease('linkedin', FakeBrowser) as linkedin:
+        pass
+
+    assert linkedin is not dice
+    assert dice.quit_called and not linkedin.quit_called
+
+def test_driver_pool_recycles_worn_out_and_failed_browsers():
+    pool = make_pool(max_pages_per_browser=2)
+
+    with pool.lease('dice', FakeBrowser) as first:
+        pass
+    with pool.lease('dice', FakeBrowser) as again:
+        pass
+    assert again is first and first.quit_called
+
+    with pytest.raises(ValueError):
+        with pool.lease('dice', FakeBrowser) as failed:
+            raise ValueError('page error')
+    assert failed.quit_called
+
+    with pool.lease('dice', FakeBrowser) as fresh:
+        pass
+    assert fresh is not failed
+
+def test_driver_pool_replaces_unhealthy_idle_browser():
+    pool = make_pool()
+    with pool.lease('dice', FakeBrowser) as hung:
+        pass
+    hung.hung = True
+
+    with pool.lease('dice', FakeBrowser) as replacement:
+        pass
+
+    assert replacement is not hung and hung.quit_called
+
+def test_driver_pool_waits_for_a_free_slot():
+    pool = make_pool(max_browsers=1)
+    leased = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def hold():
+        with pool.lease('dice', FakeBrowser):
+            leased.set()
+            release.wait(2)
+            order.append('first released')
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    leased.wait(2)
+    threading.Timer(0.1, release.set).start()
+    with pool.lease('dice', FakeBrowser):
+        order.append('second leased')
+    holder.join()
+
+    assert order == ['first released', 'second leased']
+
+def test_fetch_many_revalidates_through_http_cache(tmp_path, monkeypatch, monster_scraper):
+    cache = HttpCache(str(tmp_path / 'http'), logging.getLogger('test'), ttl_hours={'default': 0})
+    monkeypatch.setattr(base_scraper, 'get_http_cache', lambda config, logger: cache)
+    sent = []
+
+    def fake_fetch(urls, extra_headers, terms=None):
+        sent.extend(extra_headers)
+        return [FetchResult(url, 304, headers={'ETag': '"v1"'}) if headers.get('If-None-Match')
+                else FetchResult(url, 200, b'<html>jobs</html>', {'ETag': '"v1"'})
+                for url, headers in zip(urls, extra_headers)]
+
+    monkeypatch.setattr(monster_scraper, '_fetch_uncached', fake_fetch)
+    url = 'https://www.monster.com/jobs/search?q=SAP'
+
+    first = monster_scraper.fetch_many([url])[0]
+    # Nothing is cached until the scraper accepts the page
+    assert cache.get(url) is None
+    monster_scraper.cache_response(first)
+
+    second = monster_scraper.fetch_many([url])[0]
+
+    assert sent == [{}, {'If-None-Match': '"v1"'}]
+    assert (second.status_code, second.content, second.cache_url) == (200, b'<html>jobs</html>', None)
+    assert cache.stats['revalidated'] == 1 and cache.stats['stored'] == 1
+
+class ScriptedScraper(BaseScraper):
+    """Yields canned jobs per term and records which terms were scraped"""
+
+    def __init__(self, jobs_by_term):
+        super().__init__(load_config(), logging.getLogger('test'))
+        self.jobs_by_term = jobs_by_term
+        self.scraped = []
+
+    def get_platform_name(self) -> str:
+        return "Scripted"
+
+    def iter_term_jobs(self, search_terms, location=None):
+        for term in search_terms:
+            self.scraped.append(term)
+            if self.jobs_by_term[term] is None:
+                self.fail_term(term, "blocked")
+                continue
+            yield term, self.filter_contract_jobs(self.jobs_by_term[term], term)
+
+def test_iter_jobs_streams_each_term_before_scraping_the_next():
+    scraper = ScriptedScraper({
+        'Java': [{'title': 'Java Developer', 'job_type': 'Contract'}, {'title': 'Java Lead', 'job_type': 'Full-time'}],
+        'SAP': None,
+        'Oracle': [{'title': 'Oracle DBA', 'job_type': 'Contract'}],
+    })
+    jobs = scraper.iter_jobs(['Java', 'SAP', 'Oracle'])
+
+    assert next(jobs)['title'] == 'Java Developer'
+    assert scraper.scraped == ['Java']
+    assert [job['title'] for job in jobs] == ['Oracle DBA']
+    assert scraper.scraped == ['Java', 'SAP', 'Oracle']
+    assert scraper.failed_terms == {'SAP': 'blocked'}
+
+REGISTRY_IMPORT_CHECK = """
+import sys
+from src.scrapers.registry import enabled_platforms, load_scraper_class
+scraper_modules = lambda: sorted(name for name in sys.modules if name.endswith('_scraper'))
+enabled_platforms({'platforms': {'linkedin': {'enabled': False}}})
+print(scraper_modules())
+load_scraper_class('dice')
+print(scraper_modules())
+"""
+
+def test_registry_imports_scraper_modules_on_first_use():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', REGISTRY_IMPORT_CHECK], cwd=root,
+                            capture_output=True, text=True, check=True).stdout
+
+    assert output.splitlines() == [
+        "[]",
+        "['src.scrapers.base_scraper', 'src.scrapers.dice_scraper']",
+    ]
+
+def test_registry_platforms_from_config():
+    config = {'platforms': {
+        'linkedin': {'enabled': False},
+        'dice_mirror': {'scraper': 'src.scrapers.dice_scraper:DiceScraper'},
+    }}
+
+    assert enabled_platforms(config) == ['monster', 'dice', 'dice_mirror']
+    assert load_scraper_class('dice_mirror', config).__name__ == 'DiceScraper'
+    assert load_scraper_class('monster') is MonsterScraper
+    with pytest.raises(KeyError):
+        load_scraper_class('indeed')
+
+class SnapshotDriver:
+    """Answers the card snapshot script, or fails it so the page source is parsed instead"""
+
+    def __init__(self, page_source, snapshot=None):
+        self.page_source = page_source
+        self.snapshot = snapshot
+        self.scripts = 0
+
+    def execute_script(self, script, selectors):
+        self.scripts += 1
+        if self.snapshot is None:
+            raise RuntimeError('javascript error')
+        return self.snapshot
+
+@pytest.fixture
+def dice_scraper():
+    config = load_config()
+    config['selector_learning'] = {'enabled': False}
+    return DiceScraper(config, logging.getLogger('test'))
+
+
+def test_snapshot_cards_reads_every_card_in_one_script_call(dice_scraper):
+    driver = SnapshotDriver('', {'selector': '.card', 'cards': ['<div class="card">1</div>', '<div class="card">2</div>']})
+
+    assert dice_scraper.snapshot_cards(driver, DICE_SELECTORS['card']) == (
+        '.card', ['<div class="card">1</div>', '<div class="card">2</div>'])
+    assert driver.scripts == 1
+
+def test_snapshot_cards_falls_back_to_page_source(dice_scraper):
+    markup = read_fixture('dice', 'search_results.html').decode('utf-8')
+
+    selector, fragments = dice_scraper.snapshot_cards(SnapshotDriver(markup), DICE_SELECTORS['card'])
+
+    assert selector == CardSelectors('Dice', DICE_SELECTORS).select(make_soup(markup), 'card')[0]
+    assert len(fragments) == 20
+    assert dice_scraper.snapshot_cards(SnapshotDriver('<html></html>'), DICE_SELECTORS['card']) == (None, [])
+
+def test_card_fragments_parse_like_the_full_page(dice_scraper, parser):
+    markup = read_fixture('dice', 'search_results.html').decode('utf-8')
+    fragments = dice_scraper.snapshot_cards(SnapshotDriver(markup), DICE_SELECTORS['card'])[1]
+
+    cards = parse_card_fragments(fragments + ['<div class="card"></div>'], parse_dice_card, parser)
+
+    # Unusable cards keep their position so they still line up with the live elements
+    assert cards[:-1] == parse_dice_cards(markup, parser)
+    assert cards[-1] is None
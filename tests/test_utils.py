@@ -0,0 +1,251 @@
+import json
+import logging
+import time
+import urllib.error
+import urllib.request
+import pytest
+from src.scrapers.async_fetcher import FetchResult
+from src.utils.http_cache import HttpCache
+from src.utils.metrics import MetricsRegistry, get_metrics, start_metrics_server
+from src.utils.rate_limiter import RateLimiter, parse_retry_after, split_request_rates
+from src.utils.retry import CircuitBreaker, CircuitOpenError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, 'monotonic', clock)
+    return clock
+
+
+def test_rate_limiter_spaces_requests_per_host(clock):
+    limiter = RateLimiter(default_delay=2, jitter=0)
+
+    assert limiter.reserve('example.com') == 0
+    assert limiter.reserve('example.com') == pytest.approx(2)
+    assert limiter.reserve('example.com') == pytest.approx(4)
+    # Hosts have separate buckets; URLs are keyed by their host
+    assert limiter.reserve('https://other.com/jobs?q=java') == 0
+
+    clock.now += 10
+    assert limiter.reserve('example.com') == 0
+
+def test_rate_limiter_host_delays_and_burst(clock):
+    limiter = RateLimiter(default_delay=2, burst=2, host_delays={'fast.com': 0.5}, jitter=0)
+
+    assert [limiter.reserve('fast.com') for _ in range(3)] == [0, 0, pytest.approx(0.5)]
+    assert limiter.current_delay('slow.com') == pytest.approx(2)
+
+def test_retry_after_blocks_and_spaces_queued_callers(clock):
+    limiter = RateLimiter(default_delay=1, jitter=0)
+    limiter.reserve('example.com')
+
+    limiter.record_response('example.com', 429, {'Retry-After': '5'})
+
+    # The rate is halved and callers queued behind the block follow each other at it
+    assert limiter.current_delay('example.com') == pytest.approx(2)
+    assert [limiter.reserve('example.com') for _ in range(3)] == [
+        pytest.approx(5), pytest.approx(7), pytest.approx(9)
+    ]
+
+def test_rate_limiter_recovers_after_success(clock):
+    limiter = RateLimiter(default_delay=1, jitter=0)
+    limiter.record_response('example.com', 503)
+
+    for _ in range(10):
+        limiter.record_response('example.com', 200)
+
+    assert limiter.current_delay('example.com') == pytest.approx(1)
+
+def test_parse_retry_after():
+    assert parse_retry_after('12') == 12
+    assert parse_retry_after('-3') == 0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+def test_split_request_rates_leaves_config_alone():
+    config = {'scraping': {'delay_between_requests': {'default': 2, 'hosts': {'www.dice.com': 3}}}}
+
+    split = split_request_rates(config, 4)
+
+    assert split['scraping']['delay_between_requests'] == {'default': 8, 'hosts': {'www.dice.com': 12}}
+    assert config['scraping']['delay_between_requests']['default'] == 2
+
+def make_breaker() -> CircuitBreaker:
+    return CircuitBreaker('Dice', logging.getLogger('test'), failure_threshold=3, cooldown=60)
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    breaker = make_breaker()
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open
+    assert not breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+def test_circuit_half_open_lets_one_probe_through(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.retry_in() == pytest.approx(30)
+    assert not breaker.allow()
+
+    clock.now += 30
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+def test_failed_probe_reopens_circuit(clock):
+    breaker = make_breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 60
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_in() == pytest.approx(60)
+
+def test_record_result_counts_blocks_and_skips_refusals(clock):
+    breaker = make_breaker()
+
+    breaker.record_result(FetchResult('https://www.dice.com', 403))
+    breaker.record_result(FetchResult('https://www.dice.com', error=TimeoutError()))
+    breaker.record_result(FetchResult('https://www.dice.com', error=CircuitOpenError('Dice', 10)))
+    assert breaker.failures == 2
+
+    breaker.record_result(FetchResult('https://www.dice.com', 404))
+    assert breaker.failures == 0
+
+def make_cache(tmp_path, **kwargs) -> HttpCache:
+    return HttpCache(str(tmp_path / 'http'), logging.getLogger('test'), **kwargs)
+
+def test_http_cache_revalidates_with_stored_validators(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, 'time', clock)
+    cache = make_cache(tmp_path, ttl_hours={'monster': 1})
+    cache.store('https://www.monster.com/jobs?q=sap', 200,
+                {'ETag': '"v1"', 'Last-Modified': 'Wed, 14 Oct 2026 08:00:00 GMT'}, b'<html>v1</html>')
+
+    entry = cache.get('https://www.monster.com/jobs?q=sap')
+    assert entry['content'] == b'<html>v1</html>'
+    assert cache.is_fresh(entry, 'Monster')
+    assert cache.conditional_headers(entry) == {
+        'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 14 Oct 2026 08:00:00 GMT'
+    }
+
+    clock.now += 2 * 3600
+    entry = cache.get('https://www.monster.com/jobs?q=sap')
+    assert not cache.is_fresh(entry, 'Monster')
+
+    # A 304 makes the entry fresh again and may bring a new validator
+    cache.refresh('https://www.monster.com/jobs?q=sap', {'ETag': '"v2"'})
+    entry = cache.get('https://www.monster.com/jobs?q=sap')
+    assert cache.is_fresh(entry, 'Monster')
+    assert entry['etag'] == '"v2"' and entry['last_modified'] == 'Wed, 14 Oct 2026 08:00:00 GMT'
+    assert cache.stats['revalidated'] == 1
+
+def test_http_cache_without_validators_sends_plain_request(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store('https://www.dice.com/jobs', 200, {}, b'page')
+
+    assert cache.conditional_headers(cache.get('https://www.dice.com/jobs')) == {}
+    assert cache.conditional_headers(None) == {}
+    assert cache.get('https://www.dice.com/other') is None
+
+def test_http_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, 'time', clock)
+    cache = make_cache(tmp_path, max_size_mb=2500 / (1024 * 1024))
+    for name in ('a', 'b'):
+        clock.now += 1
+        cache.store(f'https://example.com/{name}', 200, {}, b'x' * 1000)
+    clock.now += 1
+    cache.get('https://example.com/a')
+
+    clock.now += 1
+    cache.store('https://example.com/c', 200, {}, b'x' * 1000)
+
+    assert cache.get('https://example.com/b') is None
+    assert cache.get('https://example.com/a') is not None
+    assert cache.stats['evicted'] == 1
+
+    # The index survives a restart
+    assert make_cache(tmp_path).get('https://example.com/c')['content'] == b'x' * 1000
+
+def make_metrics() -> MetricsRegistry:
+    metrics = MetricsRegistry()
+    metrics.inc('jobs_scraped_total', 3, platform='Dice', term='Java')
+    metrics.inc('jobs_scraped_total', 2, platform='Dice', term='Java')
+    metrics.inc('requests_total', platform='Dice', term='Java', status=200)
+    metrics.inc('runs_total', label=None)
+    metrics.observe('fetch_seconds', 0.25, platform='Dice', term='Java')
+    metrics.observe('fetch_seconds', 0.5, platform='Dice', term='Java')
+    return metrics
+
+def test_metrics_report_groups_series_by_platform_and_term(tmp_path):
+    path = make_metrics().write_report(str(tmp_path / 'metrics' / 'run.json'), run_id='run', label='daily')
+
+    with open(path, encoding='utf-8') as file:
+        report = json.load(file)
+
+    assert (report['run_id'], report['label']) == ('run', 'daily')
+    assert report['platforms'] == {'Dice': {'Java': {
+        'jobs_scraped_total': 5, 'requests_total[200]': 1, 'fetch_seconds': 0.75,
+    }}}
+    # None labels are dropped rather than exported as "None"
+    assert {'name': 'runs_total', 'labels': {}, 'value': 1} in report['counters']
+    assert report['timings'] == [{'name': 'fetch_seconds', 'labels': {'platform': 'Dice', 'term': 'Java'},
+                                  'count': 2, 'total_seconds': 0.75, 'max_seconds': 0.5}]
+
+def test_metrics_prometheus_text():
+    metrics = make_metrics()
+    metrics.inc('jobs_kept_total', platform='Dice', term='C# "lead"')
+
+    lines = metrics.prometheus_text().splitlines()
+
+    assert lines.count('# TYPE job_scraper_jobs_scraped_total counter') == 1
+    assert 'job_scraper_jobs_scraped_total{platform="Dice",term="Java"} 5' in lines
+    assert 'job_scraper_jobs_kept_total{platform="Dice",term="C# \\"lead\\""} 1' in lines
+    assert 'job_scraper_runs_total 1' in lines
+    assert '# TYPE job_scraper_fetch_seconds summary' in lines
+    assert 'job_scraper_fetch_seconds_count{platform="Dice",term="Java"} 2' in lines
+    assert 'job_scraper_fetch_seconds_sum{platform="Dice",term="Java"} 0.75' in lines
+
+def test_metrics_server_serves_prometheus_text():
+    logger = logging.getLogger('test')
+    assert start_metrics_server({'metrics': {'enabled': True}}, logger) is None
+
+    server = start_metrics_server({'metrics': {'enabled': True, 'prometheus': {'enabled': True, 'port': 0}}}, logger)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+            assert response.read().decode('utf-8') == get_metrics().prometheus_text()
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{url}/other", timeout=5)
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,103 @@
+import gzip
+import json
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+from src.data.rollups import build_rollup, summarize_rollup
+from src.data.writers import BackgroundWriter, CsvWriter, ExcelWriter, JsonlWriter, ParquetWriter, create_writers
+
+def make_chunk(start: int, size: int, **columns) -> pd.DataFrame:
+    rows = range(start, start + size)
+    data = {
+        'title': [f'Java Developer {row}' for row in rows],
+        'vertical': ['Java' if row % 2 else 'SAP' for row in rows],
+        'state': ['Texas' if row % 3 else 'Ohio' for row in rows],
+        'platform': ['Dice' for _ in rows],
+        'posting_date': ['2026-10-16' for _ in rows],
+        'contract_duration_months': [6.0 for _ in rows],
+    }
+    data.update(columns)
+    return pd.DataFrame(data)
+
+@pytest.fixture
+def logger():
+    return logging.getLogger('test')
+
+
+def test_jsonl_round_trip_over_chunks(tmp_path, logger):
+    writer = JsonlWriter(str(tmp_path / 'jobs.jsonl.gz'), logger)
+    writer.write_chunk(make_chunk(0, 2))
+    writer.write_chunk(make_chunk(2, 0))
+    writer.write_chunk(make_chunk(2, 3, title=['Käse Developer', None, 'SAP "FICO"']))
+
+    with gzip.open(writer.close(), 'rt', encoding='utf-8') as file:
+        lines = file.read().splitlines()
+
+    # One record per line and no blank lines between chunks
+    records = [json.loads(line) for line in lines]
+    assert len(records) == writer.rows_written == 5
+    assert [record['title'] for record in records[2:]] == ['Käse Developer', None, 'SAP "FICO"']
+
+def test_csv_header_written_once(tmp_path, logger):
+    writer = CsvWriter(str(tmp_path / 'jobs.csv.gz'), logger)
+    for start in (0, 2, 4):
+        writer.write_chunk(make_chunk(start, 2))
+
+    df = pd.read_csv(writer.close())
+
+    assert len(df) == 6
+    assert list(df.columns) == list(make_chunk(0, 1).columns)
+    assert 'title' not in df['title'].tolist()
+
+def test_parquet_types_survive_empty_first_chunk(tmp_path, logger):
+    pytest.importorskip('pyarrow')
+    writer = ParquetWriter(str(tmp_path / 'jobs.parquet'), logger)
+    writer.write_chunk(make_chunk(0, 2, posting_date=[None, None], contract_duration_months=[np.nan, np.nan]))
+    writer.write_chunk(make_chunk(2, 2, posting_date=['2026-10-16', ''], contract_duration_months=[6.0, 3.5]))
+
+    df = pd.read_parquet(writer.close())
+
+    assert len(df) == 4
+    assert df['posting_date'].tolist()[2:] == ['2026-10-16', '']
+    assert df['contract_duration_months'].tolist()[2:] == [6.0, 3.5]
+
+def test_excel_data_and_summary_sheets(tmp_path, logger):
+    pytest.importorskip('xlsxwriter')
+    chunks = [make_chunk(0, 3), make_chunk(3, 4)]
+    writer = ExcelWriter(str(tmp_path / 'jobs.xlsx'), logger,
+                         summary_builder=lambda: summarize_rollup(build_rollup(pd.concat(chunks))))
+    writer.max_rows_per_sheet = 5
+    for chunk in chunks:
+        writer.write_chunk(chunk)
+
+    sheets = pd.read_excel(writer.close(), sheet_name=None)
+
+    # Full sheets continue on a new one
+    assert list(sheets) == ['Job_Data', 'Job_Data_2', 'Vertical_Analysis', 'State_Analysis', 'Platform_Analysis']
+    assert len(sheets['Job_Data']) + len(sheets['Job_Data_2']) == 7
+    assert dict(zip(sheets['Vertical_Analysis']['vertical'], sheets['Vertical_Analysis']['job_count'])) == {
+        'Java': 3, 'SAP': 4
+    }
+    assert sheets['Platform_Analysis']['job_count'].tolist() == [7]
+
+def test_background_writer_reports_errors(tmp_path, logger):
+    class FailingWriter(CsvWriter):
+        def write_chunk(self, df):
+            raise OSError('disk full')
+
+    writer = BackgroundWriter(FailingWriter(str(tmp_path / 'jobs.csv.gz'), logger))
+    writer.write_chunk(make_chunk(0, 1))
+
+    with pytest.raises(OSError, match='disk full'):
+        writer.close()
+
+def test_create_writers_follows_output_settings(tmp_path, logger):
+    config = {'output': {'directory': str(tmp_path), 'formats': ['jsonl', 'csv', 'unknown'], 'background': False}}
+
+    writers = create_writers(config, 'run', logger)
+
+    assert [type(writer) for writer in writers] == [JsonlWriter, CsvWriter]
+    assert writers[0].path == str(tmp_path / 'jsonl' / 'run.jsonl.gz')
+    for writer in writers:
+        writer.close()